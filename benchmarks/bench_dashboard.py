@@ -0,0 +1,332 @@
+"""Benchmark pentru dashboard: pornire la rece, rerun-uri calde pe pagini, cache hit/miss și payload.
+
+Rulare, din rădăcina proiectului:
+
+    python benchmarks/bench_dashboard.py --repeat 10 --output benchmarks/results/$(git rev-parse --short HEAD).json
+    python benchmarks/bench_dashboard.py --compare benchmarks/results/vechi.json benchmarks/results/nou.json
+    python benchmarks/bench_dashboard.py --uat 3200 --check-budgets
+
+Aplicația rulează headless prin streamlit.testing.v1.AppTest; rezultatele sunt scrise în JSON.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "dashboard", "dashboard_final.py")
+sys.path.insert(0, os.path.join(ROOT, "dashboard"))
+
+PAGINI = {"🏠 Home": "views/home.py", "📊 Dashboard": "views/dashboard.py", "🔬 Metodologie": "views/metodologie.py"}
+
+# Bugetul de latență (ms) pentru mediana rerun-urilor calde, pe pagină; valabil și la nivel UAT
+BUGETE_MS = {"🏠 Home": 250, "📊 Dashboard": 1000, "🔬 Metodologie": 250}
+
+
+def _stats(durate):
+    durate = sorted(durate)
+    return {
+        "median_ms": round(statistics.median(durate) * 1000, 3),
+        "p95_ms": round(durate[min(len(durate) - 1, int(round(0.95 * (len(durate) - 1))))] * 1000, 3),
+        "min_ms": round(durate[0] * 1000, 3),
+        "n": len(durate),
+    }
+
+
+def _timp(functie, *args):
+    start = time.perf_counter()
+    rezultat = functie(*args)
+    return time.perf_counter() - start, rezultat
+
+
+def _app(timeout=120):
+    from streamlit.testing.v1 import AppTest
+    return AppTest.from_file(APP, default_timeout=timeout)
+
+
+def _go_to(at, pagina, nivel=None):
+    at.switch_page(PAGINI[pagina])
+    if nivel:
+        at.session_state["nivel"] = nivel
+    return at.run()
+
+
+def payload_bytes(nod):
+    """Mărimea serializată (protobuf) a elementelor trimise clientului, pe tip de element."""
+    pe_tip = {}
+
+    def _parcurge(n):
+        for copil in getattr(n, "children", {}).values():
+            proto = getattr(copil, "proto", None)
+            if proto is not None and hasattr(proto, "ByteSize"):
+                tip = getattr(copil, "type", type(copil).__name__)
+                pe_tip[tip] = pe_tip.get(tip, 0) + proto.ByteSize()
+            _parcurge(copil)
+
+    _parcurge(nod)
+    return {"total": sum(pe_tip.values()), "per_type": dict(sorted(pe_tip.items()))}
+
+
+def bench_cold_start(repeat):
+    """Proces nou la fiecare rulare: importuri, încărcarea datelor și primul rerun al paginii Home."""
+    durate = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--cold-child"],
+            cwd=ROOT, check=True, capture_output=True,
+        )
+        durate.append(time.perf_counter() - start)
+    return _stats(durate)
+
+
+def bench_pages(repeat, nivel=None):
+    import streamlit as st
+    from metrics import METRICS
+
+    rezultate = {}
+    for pagina in PAGINI:
+        # Prima rulare după golirea cache-urilor din memorie (fișierele din baze/.cache rămân)
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        at = _app()
+        at.run()
+        durata_rece, at = _timp(_go_to, at, pagina, nivel)
+        # Timpii pe secțiuni (metrics.METRICS) doar pentru rerun-urile calde
+        METRICS.reset()
+        calde = [_timp(at.run)[0] for _ in range(repeat)]
+        sectiuni = METRICS.snapshot()
+        if at.exception:
+            raise RuntimeError(f"{pagina}: {[e.value for e in at.exception]}")
+        principal = at._tree.children[0]
+        rezultat = {
+            "first_run_ms": round(durata_rece * 1000, 3),
+            "warm_rerun": _stats(calde),
+            "payload": payload_bytes(principal),
+            "sections": {nume: {"mean_ms": v["mean_ms"]} for nume, v in sectiuni["sections"].items()},
+            "loader_hit_rate": {nume: v["hit_rate"] for nume, v in sectiuni["loaders"].items()},
+        }
+        if at.tabs:
+            # Doar tab-ul deschis rulează; fiecare tab este deschis și măsurat separat
+            rezultat["tabs"] = {}
+            for eticheta in [tab.label for tab in at.tabs]:
+                calde_tab = []
+                for _ in range(repeat + 1):
+                    # AppTest nu păstrează tab-ul selectat între rerun-uri, deci este setat înainte de fiecare
+                    at.session_state["tab_dashboard"] = eticheta
+                    calde_tab.append(_timp(at.run)[0])
+                calde_tab = calde_tab[1:]
+                deschis = next(tab for tab in at.tabs if tab.label == eticheta)
+                rezultat["tabs"][eticheta] = {"warm_rerun": _stats(calde_tab), "payload": payload_bytes(deschis)}
+        if pagina in BUGETE_MS:
+            rezultat["budget_ms"] = BUGETE_MS[pagina]
+            rezultat["within_budget"] = rezultat["warm_rerun"]["median_ms"] <= BUGETE_MS[pagina]
+        rezultate[pagina] = rezultat
+    return rezultate
+
+
+def bench_map_updates(nivel=None):
+    """Octeții trimiși pentru hartă la fiecare interacțiune (schimbarea unei ponderi), cu și fără harta delta.
+
+    Browserul confirmă figura statică prin starea componentei; AppTest nu rulează JS-ul, așa că
+    confirmarea este simulată înaintea fiecărui rerun, cu cheia primită la prima randare.
+    """
+    import map_component
+
+    cheie_stare = f"harta_{nivel or 'Județe'}"
+    rezultate = {}
+    for delta in (True, False):
+        map_component.HARTA_DELTA = delta
+        at = _app()
+        at.run()
+        at = _go_to(at, "📊 Dashboard", nivel)
+        elemente = lambda: at.get("bidi_component") if delta else at.get("plotly_chart")
+        prima = sum(e.proto.ByteSize() for e in elemente())
+        confirmat = json.loads(elemente()[0].proto.json)["cheie"] if delta else None
+        interactiuni = []
+        for valoare in (50, 40, 30, 20, 10):
+            if delta:
+                at.session_state[cheie_stare] = {"static": confirmat, "selectie": None}
+            at.sidebar.slider[0].set_value(valoare).run()
+            if at.exception:
+                raise RuntimeError(f"harta: {[e.value for e in at.exception]}")
+            interactiuni.append(sum(e.proto.ByteSize() for e in elemente()))
+        rezultate["delta_component" if delta else "plotly_chart"] = {
+            "first_render_bytes": prima,
+            "update_bytes": round(statistics.median(interactiuni)),
+        }
+    map_component.HARTA_DELTA = os.environ.get("DASHBOARD_HARTA_DELTA", "0") == "1"
+    return rezultate
+
+
+def bench_loaders(repeat):
+    import loaders
+
+    rezultate = {}
+    for nume in [
+        "load_geojson", "load_main_data", "load_tooltip_data", "load_scoring_engine",
+        "load_trend_engines", "load_all_datasets", "load_series_data", "load_summary_table",
+    ]:
+        functie = getattr(loaders, nume)
+        miss = []
+        for _ in range(max(1, repeat // 2)):
+            functie.clear()
+            miss.append(_timp(functie)[0])
+        hit = [_timp(functie)[0] for _ in range(repeat)]
+        rezultate[nume] = {"miss": _stats(miss), "hit": _stats(hit)}
+    return rezultate
+
+
+def bench_components(repeat):
+    """Costul secțiunilor din fiecare tab al paginii Dashboard, măsurat direct."""
+    from figure_cache import FigureCache, content_hash
+    from figures import build_bar_figure, build_map_figure
+    from loaders import load_all_datasets, load_geojson, load_scoring_engine, load_summary_table
+    from scoring import PONDERI_IMPLICITE
+
+    engine = load_scoring_engine()
+    geojson = load_geojson()
+    scoruri = engine.score(PONDERI_IMPLICITE).frame()
+    cache = FigureCache()
+    cheie = content_hash("harta", scoruri)
+    cache.get_or_build(cheie, lambda: build_map_figure(scoruri, geojson))
+
+    masuratori = {
+        "score_weights": lambda: engine.score([30, 20, 20, 15, 15]).frame(),
+        "map_figure_build": lambda: build_map_figure(scoruri, geojson),
+        "map_figure_cache_hit": lambda: cache.get_or_build(cheie, lambda: None),
+        "map_figure_to_json": lambda: build_map_figure(scoruri, geojson).to_json(),
+        "bar_figure_build": lambda: build_bar_figure(scoruri.sort_values("Rank")),
+        "summary_table_miss": lambda: (load_all_datasets.clear(), load_summary_table.clear(), load_summary_table()),
+    }
+    rezultate = {}
+    for nume, functie in masuratori.items():
+        rezultate[nume] = _stats([_timp(functie)[0] for _ in range(repeat)])
+    rezultate["map_figure_json_bytes"] = len(build_map_figure(scoruri, geojson).to_json())
+    rezultate["bar_figure_json_bytes"] = len(build_bar_figure(scoruri).to_json())
+    return rezultate
+
+
+def bench_point_lookup(repeat, n=1_000_000):
+    """Localizarea în lot a punctelor (lon/lat -> județ): indexul pe grilă cu muchii față de GridIndex."""
+    import numpy as np
+    from geometry import GridIndex
+    from geostore import PointLocator, load_packed, locate_points
+
+    durata_index, locator = _timp(lambda: PointLocator(load_packed()))
+    geometrie = locator.geometrie
+    rng = np.random.default_rng(0)
+    x = rng.uniform(geometrie.bbox[:, 0].min(), geometrie.bbox[:, 2].max(), n)
+    y = rng.uniform(geometrie.bbox[:, 1].min(), geometrie.bbox[:, 3].max(), n)
+    durate = [_timp(locate_points, locator, x, y)[0] for _ in range(repeat)]
+    with open("baze/ro.json", encoding="utf-8") as f:
+        grila = GridIndex(json.load(f))
+    durata_grila = _timp(grila.locate, x[:100_000], y[:100_000])[0]
+    return {
+        "index_build_ms": round(durata_index * 1000, 3),
+        "index_bytes": locator.nbytes,
+        "locate_1m": _stats(durate),
+        "points_per_s": round(n / statistics.median(durate)),
+        "grid_index_points_per_s": round(100_000 / durata_grila),
+    }
+
+
+def _meta():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    import pandas
+    import plotly
+    import streamlit
+    return {
+        "commit": commit,
+        "uat": int(os.environ.get("DASHBOARD_UAT_SINTETIC", "0")),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": {"streamlit": streamlit.__version__, "pandas": pandas.__version__, "plotly": plotly.__version__},
+    }
+
+
+def compare(vechi, nou):
+    """Afișează diferențele de mediană dintre două fișiere de rezultate."""
+    with open(vechi, encoding="utf-8") as f:
+        a = json.load(f)
+    with open(nou, encoding="utf-8") as f:
+        b = json.load(f)
+
+    def _mediane(rez, prefix=""):
+        for cheie, valoare in rez.items():
+            if isinstance(valoare, dict) and ("median_ms" in valoare or "mean_ms" in valoare):
+                yield f"{prefix}{cheie}", valoare.get("median_ms", valoare.get("mean_ms"))
+            elif isinstance(valoare, dict):
+                yield from _mediane(valoare, f"{prefix}{cheie}/")
+            elif cheie in ("total", "first_run_ms") or cheie.endswith("_bytes"):
+                yield f"{prefix}{cheie}", valoare
+
+    valori_a = dict(_mediane({k: v for k, v in a.items() if k != "meta"}))
+    for cheie, valoare in _mediane({k: v for k, v in b.items() if k != "meta"}):
+        if cheie in valori_a and valori_a[cheie]:
+            print(f"{cheie:70s} {valori_a[cheie]:>12.3f} -> {valoare:>12.3f} ({(valoare / valori_a[cheie] - 1) * 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", default=None, help="fișierul JSON cu rezultate (implicit: stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("VECHI", "NOU"))
+    parser.add_argument("--uat", type=int, default=0, help="rulează la nivel UAT, cu N unități sintetice")
+    parser.add_argument("--check-budgets", action="store_true", help="cod de ieșire 1 dacă o pagină depășește bugetul")
+    parser.add_argument("--cold-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.uat:
+        # Citit de loaders la import, deci înainte de primul rerun
+        os.environ["DASHBOARD_UAT_SINTETIC"] = str(args.uat)
+
+    os.chdir(ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    if args.cold_child:
+        _app().run()
+        return
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    rezultate = {
+        "meta": _meta(),
+        "cold_start": bench_cold_start(max(1, args.repeat // 3)),
+        "pages": bench_pages(args.repeat, "UAT" if args.uat else None),
+        "map_updates": bench_map_updates("UAT" if args.uat else None),
+        "loaders": bench_loaders(args.repeat),
+        "components": bench_components(args.repeat),
+        "point_lookup": bench_point_lookup(args.repeat),
+    }
+    text = json.dumps(rezultate, ensure_ascii=False, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    depasite = [p for p, r in rezultate["pages"].items() if r.get("within_budget") is False]
+    for pagina in depasite:
+        r = rezultate["pages"][pagina]
+        print(f"Buget depășit: {pagina} {r['warm_rerun']['median_ms']:.0f} ms > {r['budget_ms']} ms", file=sys.stderr)
+    if args.check_budgets and depasite:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Test de încărcare: N sesiuni simultane ale dashboard-ului în același proces, ca pe un server real.
+
+Fiecare sesiune este un AppTest pe propriul thread și parcurge un scenariu (Home -> Dashboard, tab-urile,
+schimbări de ponderi). Raportează latența rerun-urilor (mediană, p95), memoria procesului (RSS curent și
+maxim) și statisticile stratului partajat. Fiecare configurație rulează într-un proces separat, ca memoria
+să nu se amestece:
+
+    python benchmarks/load_test.py --sessions 20 --rounds 3
+    python benchmarks/load_test.py --sessions 20 --compare      # și cu st.cache_data (DASHBOARD_SHARED_CACHE=0)
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "dashboard", "dashboard_final.py")
+sys.path.insert(0, os.path.join(ROOT, "dashboard"))
+
+TAB_URI = ["🗺️ Hartă Interactivă", "📊 Top Județe", "📋 Tabel Rezumativ", "📅 Evoluție pe Ani"]
+
+
+def rss_mb():
+    """(RSS curent, RSS maxim) al procesului, în MB."""
+    curent = None
+    try:
+        with open("/proc/self/status", encoding="utf-8") as f:
+            for linie in f:
+                if linie.startswith("VmRSS:"):
+                    curent = int(linie.split()[1]) / 1024
+    except OSError:
+        pass
+    maxim = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss este în KB pe Linux și în bytes pe macOS
+    maxim = maxim / 1024 / 1024 if sys.platform == "darwin" else maxim / 1024
+    return (round(curent, 1) if curent is not None else None), round(maxim, 1)
+
+
+def _p95(durate):
+    durate = sorted(durate)
+    return durate[min(len(durate) - 1, int(round(0.95 * (len(durate) - 1))))]
+
+
+def _server_comun():
+    """Aduce AppTest mai aproape de un server real, pe care sesiunile împart runtime-ul și scripturile compilate.
+
+    AppTest setează Runtime._instance la începutul fiecărui run și îl șterge la final (cu sesiuni simultane,
+    un run care se termină l-ar șterge sub celelalte) și compilează scripturile la fiecare run, cu un
+    ScriptCache nou (compile() concurent nu este sigur în CPython 3.11). Aici runtime-ul rămâne setat pe
+    toată durata testului și toate run-urile folosesc un singur ScriptCache.
+    """
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    script_cache = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+
+    class _Fixat(type(Runtime)):
+        def __setattr__(cls, nume, valoare):
+            if nume == "_instance":
+                if valoare is not None and Runtime._instance is None:
+                    Runtime._instance = valoare
+                return
+            super().__setattr__(nume, valoare)
+
+    app_test.Runtime = _Fixat("Runtime", (Runtime,), {})
+
+
+def sesiune(indice, runde, durate, erori, start):
+    """Scenariul unei sesiuni; fiecare rerun este cronometrat."""
+    from streamlit.testing.v1 import AppTest
+
+    def rerun(at):
+        t0 = time.perf_counter()
+        at.run()
+        durate.append(time.perf_counter() - t0)
+        if at.exception:
+            erori.append(f"sesiunea {indice}: {[e.value for e in at.exception]}")
+
+    at = AppTest.from_file(APP, default_timeout=300)
+    start.wait()
+    rerun(at)
+    at.switch_page("views/dashboard.py")
+    rerun(at)
+    for runda in range(runde):
+        for tab in TAB_URI:
+            at.session_state["tab_dashboard"] = tab
+            rerun(at)
+        # Ponderi diferite per sesiune și rundă, ca scorurile să nu fie mereu aceleași
+        at.session_state["tab_dashboard"] = TAB_URI[0]
+        at.sidebar.slider[0].set_value(5 * ((indice + runda) % 20 + 1))
+        rerun(at)
+
+
+def run(sesiuni, runde):
+    from metrics import METRICS
+    from shared import SHARED
+
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    _server_comun()
+    rss_start = rss_mb()[0]
+    durate, erori = [], []
+    start = threading.Barrier(sesiuni)
+    threaduri = [
+        threading.Thread(target=sesiune, args=(i, runde, durate, erori, start), daemon=True)
+        for i in range(sesiuni)
+    ]
+    t0 = time.perf_counter()
+    for t in threaduri:
+        t.start()
+    for t in threaduri:
+        t.join()
+    total = time.perf_counter() - t0
+    rss_final, rss_maxim = rss_mb()
+    return {
+        "shared_cache": os.environ.get("DASHBOARD_SHARED_CACHE", "1") != "0",
+        "sessions": sesiuni,
+        "reruns": len(durate),
+        "wall_s": round(total, 2),
+        "rerun_median_ms": round(statistics.median(durate) * 1000, 1) if durate else None,
+        "rerun_p95_ms": round(_p95(durate) * 1000, 1) if durate else None,
+        "rss_start_mb": rss_start,
+        "rss_end_mb": rss_final,
+        "rss_peak_mb": rss_maxim,
+        "shared": SHARED.stats(),
+        "loaders": {k: v["hit_rate"] for k, v in METRICS.snapshot()["loaders"].items()},
+        "errors": erori[:10],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--compare", action="store_true", help="rulează și cu st.cache_data (DASHBOARD_SHARED_CACHE=0)")
+    parser.add_argument("--output", default=None, help="fișierul JSON cu rezultate (implicit: stdout)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    os.chdir(ROOT)
+
+    if args.child:
+        print(json.dumps(run(args.sessions, args.rounds)))
+        return
+
+    configuratii = {"shared": "1", "cache_data": "0"} if args.compare else {"shared": os.environ.get("DASHBOARD_SHARED_CACHE", "1")}
+    rezultate = {}
+    for nume, valoare in configuratii.items():
+        proces = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", "--sessions", str(args.sessions), "--rounds", str(args.rounds)],
+            cwd=ROOT, env={**os.environ, "DASHBOARD_SHARED_CACHE": valoare}, capture_output=True, text=True, check=True,
+        )
+        rezultate[nume] = json.loads(proces.stdout.strip().splitlines()[-1])
+    text = json.dumps(rezultate, ensure_ascii=False, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
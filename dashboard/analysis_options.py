@@ -0,0 +1,13 @@
+"""Opțiunile căutării de similaritate și ale tipologiilor, fără dependențele lor (sklearn, scipy).
+
+Pagina Dashboard construiește controalele din aceste constante; modulele `similarity` și `typology`
+se importă doar când funcționalitatea este folosită prima dată.
+"""
+
+METRICI = {"euclidean": "Euclidiană", "manhattan": "Manhattan", "chebyshev": "Chebyshev", "cosine": "Cosinus"}
+
+# Numărul maxim de vecini pre-calculați per unitate
+K_MAX = 20
+
+LINKAGE = {"ward": "Ward", "average": "Medie", "complete": "Completă"}
+K_VALORI = tuple(range(2, 9))
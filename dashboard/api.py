@@ -0,0 +1,219 @@
+"""API HTTP local (JSON) pentru clasament, detalii pe județ, agregate regionale și tabelul rezumativ.
+
+Pornire, din rădăcina proiectului:
+
+    python dashboard/api.py --port 8502
+
+Folosește aceleași funcții de încărcare ca dashboard-ul. Răspunsurile sunt serializate o singură
+dată (și comprimate gzip la cerere), cu ETag pentru cereri condiționate (If-None-Match).
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+import numpy as np
+
+from judete import REGISTRY
+from loaders import load_all_datasets, load_scoring_engine, load_series_data, load_summary_table
+from scoring import DIMENSIUNI, PONDERI_IMPLICITE, normalize_weights
+
+# Seturi de ponderi cu răspunsuri păstrate, per instanță ApiData
+MAX_PONDERI = 256
+
+
+class Raspuns:
+    """Corpul JSON serializat o dată, cu ETag și varianta gzip calculată la prima cerere."""
+
+    def __init__(self, date):
+        self.body = json.dumps(date, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:20]}"'
+        self._gzip = None
+        self._lock = threading.Lock()
+
+    @property
+    def gzip_body(self):
+        with self._lock:
+            if self._gzip is None:
+                self._gzip = gzip.compress(self.body, compresslevel=6)
+            return self._gzip
+
+
+def _records(df):
+    # NaN -> null
+    return json.loads(df.to_json(orient="records", force_ascii=False))
+
+
+class ApiData:
+    """Datele dashboard-ului încărcate o singură dată, plus răspunsurile pre-calculate pe ponderi."""
+
+    def __init__(self):
+        self.engine = load_scoring_engine()
+        if self.engine is None:
+            raise RuntimeError("Nu s-au putut încărca scorurile (tabel_grafice.csv).")
+        self.rezumat = load_summary_table()
+        self.serii = load_series_data()
+        populatie = load_all_datasets()["populatie"]
+        self.populatie = populatie["Populatie"].to_numpy() if populatie is not None else None
+        self.tabel = Raspuns(_records(self.rezumat) if self.rezumat is not None else [])
+        self._raspunsuri = OrderedDict()
+        self._lock = threading.Lock()
+        # Răspunsurile pentru ponderile publicate sunt calculate la pornire
+        self.pentru_ponderi(tuple(PONDERI_IMPLICITE))
+
+    def pentru_ponderi(self, ponderi):
+        """Răspunsurile pentru un set de ponderi, memorate (LRU) după ponderile normalizate."""
+        cheie = tuple(np.round(normalize_weights(ponderi), 6))
+        with self._lock:
+            calculat = self._raspunsuri.get(cheie)
+            if calculat is not None:
+                self._raspunsuri.move_to_end(cheie)
+                return calculat
+        calculat = self._calculeaza(cheie)
+        with self._lock:
+            self._raspunsuri[cheie] = calculat
+            while len(self._raspunsuri) > MAX_PONDERI:
+                self._raspunsuri.popitem(last=False)
+        return calculat
+
+    def _calculeaza(self, ponderi):
+        rezultat = self.engine.score(ponderi)
+        scoruri = rezultat.frame()
+        clasament = scoruri.sort_values("Rank")
+        detalii = {}
+        for i, judet in enumerate(self.engine.judete):
+            detaliu = {
+                **_records(scoruri.iloc[[i]])[0],
+                "Dimensiuni": dict(zip(DIMENSIUNI, self.engine.matrice[i].round(4).tolist())),
+            }
+            if self.rezumat is not None:
+                detaliu["Indicatori"] = _records(self.rezumat.iloc[[i]].drop(columns=["Judet"]))[0]
+            if self.serii is not None:
+                detaliu["Serii"] = _records(self.serii[self.serii["Judet"] == judet].drop(columns=["Judet"]))
+            detalii[i] = Raspuns(detaliu)
+        return {
+            "clasament": Raspuns({
+                "ponderi": dict(zip(DIMENSIUNI, rezultat.ponderi.round(4).tolist())),
+                "judete": _records(clasament),
+            }),
+            "regiuni": Raspuns(self._regiuni(rezultat)),
+            "detalii": detalii,
+        }
+
+    def _regiuni(self, rezultat):
+        cod = self.engine.cod_regiune
+        numar = self.engine.judete_per_regiune
+        medii = np.bincount(cod, weights=rezultat.potential) / numar
+        regiuni = []
+        for k, nume in enumerate(self.engine.nume_regiuni):
+            regiune = {
+                "Regiune": nume,
+                "Judete": int(numar[k]),
+                "Potential mediu": round(float(medii[k]), 2),
+                "Judete incluse": self.engine.judete[cod == k].tolist(),
+            }
+            if self.populatie is not None:
+                regiune["Populatie"] = int(np.nansum(self.populatie[cod == k]))
+            regiuni.append(regiune)
+        return sorted(regiuni, key=lambda r: -r["Potential mediu"])
+
+
+def parse_weights(query):
+    valori = query.get("ponderi")
+    if not valori:
+        return tuple(PONDERI_IMPLICITE)
+    try:
+        ponderi = normalize_weights([float(v) for v in valori[0].split(",")])
+    except ValueError as exc:
+        raise ValueError(f"Parametrul ponderi este invalid ({valori[0]}): {exc}") from exc
+    # Rotunjire pentru reutilizarea răspunsurilor cache-uite
+    return tuple(np.round(ponderi, 6))
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "EconomicScoreAPI/1.0"
+    data = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parti = [unquote(p) for p in url.path.strip("/").split("/") if p]
+        try:
+            raspuns = self._ruta(parti, parse_qs(url.query))
+        except ValueError as exc:
+            return self._eroare(HTTPStatus.BAD_REQUEST, str(exc))
+        if raspuns is None:
+            return self._eroare(HTTPStatus.NOT_FOUND, f"Resursă inexistentă: {url.path}")
+        self._trimite(raspuns)
+
+    def _ruta(self, parti, query):
+        if parti == ["api", "tabel"]:
+            return self.data.tabel
+        if parti[:1] != ["api"] or len(parti) < 2:
+            return None
+        calculat = self.data.pentru_ponderi(parse_weights(query))
+        if parti == ["api", "clasament"]:
+            return calculat["clasament"]
+        if parti == ["api", "regiuni"]:
+            return calculat["regiuni"]
+        if len(parti) == 3 and parti[1] == "judete":
+            try:
+                return calculat["detalii"][REGISTRY.id_of(parti[2])]
+            except KeyError:
+                return None
+        return None
+
+    def _trimite(self, raspuns):
+        comprimat = "gzip" in self.headers.get("Accept-Encoding", "")
+        # Varianta gzip are propriul ETag (reprezentări diferite ale aceleiași resurse)
+        etag = f'{raspuns.etag[:-1]}-gz"' if comprimat else raspuns.etag
+        if etag in [e.strip() for e in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = raspuns.gzip_body if comprimat else raspuns.body
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if comprimat:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _eroare(self, status, mesaj):
+        body = json.dumps({"eroare": mesaj}, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.getLogger("api").info("%s - %s", self.address_string(), format % args)
+
+
+def make_server(host="127.0.0.1", port=8502):
+    ApiHandler.data = ApiData()
+    return ThreadingHTTPServer((host, port), ApiHandler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API JSON pentru potențialul economic al județelor.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+    # Funcțiile cache-uite Streamlit rulează aici fără runtime; avertismentele lor nu sunt relevante
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    server = make_server(args.host, args.port)
+    print(f"API pornit pe http://{args.host}:{args.port}/api/clasament")
+    server.serve_forever()
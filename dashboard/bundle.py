@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+from judete import REGISTRY
+
+# Tabelele compilate în bundle; CSV-urile rămân sursa de adevăr
+SURSE = {
+    "tabel_final": "dashboard/tabel_final.csv",
+    "tabel_tooltip": "dashboard/tabel_tooltip.csv",
+    "tabel_grafice": "dashboard/tabel_grafice.csv",
+    "populatie": "baze/populatie_2024.csv",
+    "pop_activa": "baze/populatia_activa_2023.csv",
+    "firme": "baze/numar_firme2023.csv",
+    "firme_per_mie": "baze/firme_per_mie.csv",
+    "trenduri": "baze/trenduri.csv",
+    "somaj": "baze/rata_somaj_2023.csv",
+    "somaj_serie": "baze/rata_somaj_2019-2023.csv",
+    "salarii": "baze/salariul_mediu2023.csv",
+    "salarii_serie": "baze/salariul_mediu_2019-2023.csv",
+    "urbanizare": "baze/procent_urbanizare2024.csv",
+    "venit_gosp": "baze/venit_gosp_2024.csv",
+}
+
+BUNDLE_DIR = "baze/.bundle"
+FORMAT_BUNDLE = 3
+
+
+def clean_frame(df):
+    """Elimină coloanele de index generate automat și spațiile din nume de coloane și valori text."""
+    df = df.drop(columns=[c for c in df.columns if str(c).startswith("Unnamed:")])
+    df.columns = [str(c).strip() for c in df.columns]
+    for col in df.columns:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            # Valorile lipsă rămân NaN (nu devin textul "nan")
+            df[col] = df[col].mask(df[col].notna(), df[col].astype(str).str.strip())
+    return df
+
+
+def _surse_existente(surse):
+    # Un CSV lipsă nu blochează restul bundle-ului; tabelul lui pur și simplu lipsește
+    return {nume: path for nume, path in surse.items() if os.path.exists(path)}
+
+
+def _semnatura_stat(surse):
+    semnatura = {}
+    for path in surse.values():
+        info = os.stat(path)
+        semnatura[path] = [info.st_mtime_ns, info.st_size]
+    return semnatura
+
+
+def _amprenta(surse):
+    h = hashlib.sha256(str(FORMAT_BUNDLE).encode())
+    for nume, path in sorted(surse.items()):
+        h.update(nume.encode())
+        with open(path, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()[:16]
+
+
+def build_bundle(surse=SURSE, bundle_dir=BUNDLE_DIR):
+    """Compilează toate CSV-urile într-un director de fișiere .npy, aliniate pe un index comun de județe."""
+    surse = _surse_existente(surse)
+    amprenta = _amprenta(surse)
+    destinatie = os.path.join(bundle_dir, amprenta)
+    # Numele temporar e unic per proces și thread: build-uri concurente nu scriu în același director
+    temporar = f"{destinatie}.{os.getpid()}.{threading.get_ident()}.tmp"
+    os.makedirs(temporar, exist_ok=True)
+
+    tabele = {nume: clean_frame(pd.read_csv(path)) for nume, path in surse.items()}
+    # Indexul comun = registrul de județe; numele nerecunoscute sunt adăugate la final și raportate
+    judete = list(REGISTRY.names)
+    nepotrivite = {}
+    for nume, df in tabele.items():
+        if "Judet" in df.columns:
+            _, lipsa = REGISTRY.ids(df["Judet"])
+            if lipsa:
+                nepotrivite[nume] = lipsa
+                judete.extend(j for j in lipsa if j not in judete)
+    suplimentare = {j: i for i, j in enumerate(judete) if i >= len(REGISTRY)}
+    np.save(os.path.join(temporar, "judete.npy"), np.array(judete, dtype=str))
+
+    manifest = {
+        "format": FORMAT_BUNDLE,
+        "fingerprint": amprenta,
+        "counties": len(REGISTRY),
+        "unmatched": nepotrivite,
+        "tables": {},
+    }
+    for nume, df in tabele.items():
+        coloane = []
+        for k, col in enumerate(df.columns):
+            fisier = f"{nume}.{k}.npy"
+            if col == "Judet":
+                # Județul e stocat ca id în registru, nu ca text
+                ids, _ = REGISTRY.ids(df[col])
+                ids[ids < 0] = df[col][ids < 0].map(suplimentare).to_numpy()
+                valori = ids.astype(np.int32)
+                tip = "judet"
+            elif pd.api.types.is_numeric_dtype(df[col]):
+                valori = df[col].to_numpy()
+                tip = "numeric"
+            else:
+                # Textul lipsă este stocat ca șir gol și citit înapoi ca None
+                valori = df[col].fillna("").to_numpy(dtype=str)
+                tip = "text"
+            np.save(os.path.join(temporar, fisier), valori)
+            coloane.append({"name": col, "file": fisier, "kind": tip})
+        manifest["tables"][nume] = {"source": surse[nume], "rows": len(df), "columns": coloane}
+
+    with open(os.path.join(temporar, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    try:
+        os.replace(temporar, destinatie)
+    except OSError:
+        # Alt build a publicat deja aceeași amprentă (conținut identic)
+        if not os.path.isdir(destinatie):
+            raise
+        shutil.rmtree(temporar)
+
+    # Pointer către build-ul curent, cu semnăturile stat ale surselor pentru verificarea rapidă
+    curent = {"format": FORMAT_BUNDLE, "fingerprint": amprenta, "stat": _semnatura_stat(surse)}
+    pointer = os.path.join(bundle_dir, "current.json")
+    temporar = f"{pointer}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporar, "w", encoding="utf-8") as f:
+        json.dump(curent, f)
+    os.replace(temporar, pointer)
+
+    for vechi in os.listdir(bundle_dir):
+        cale = os.path.join(bundle_dir, vechi)
+        if os.path.isdir(cale) and vechi != amprenta and not vechi.endswith(".tmp"):
+            shutil.rmtree(cale, ignore_errors=True)
+    return destinatie
+
+
+def ensure_bundle(surse=SURSE, bundle_dir=BUNDLE_DIR):
+    """Întoarce directorul bundle-ului curent, reconstruindu-l doar dacă s-a schimbat vreun CSV."""
+    surse = _surse_existente(surse)
+    try:
+        with open(os.path.join(bundle_dir, "current.json"), "r", encoding="utf-8") as f:
+            curent = json.load(f)
+        destinatie = os.path.join(bundle_dir, curent["fingerprint"])
+        if curent["format"] != FORMAT_BUNDLE:
+            return build_bundle(surse, bundle_dir)
+        if curent["stat"] == _semnatura_stat(surse) and os.path.isdir(destinatie):
+            return destinatie
+        # Timestamp-uri schimbate (ex. git checkout) dar conținut identic: nu reconstruim
+        if _amprenta(surse) == curent["fingerprint"] and os.path.isdir(destinatie):
+            curent["stat"] = _semnatura_stat(surse)
+            with open(os.path.join(bundle_dir, "current.json"), "w", encoding="utf-8") as f:
+                json.dump(curent, f)
+            return destinatie
+    except (FileNotFoundError, KeyError, ValueError):
+        pass
+    return build_bundle(surse, bundle_dir)
+
+
+class Bundle:
+    """Acces la tabelele din bundle; coloanele sunt citite memory-mapped, fără parsare de text."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "manifest.json"), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.judete = np.load(os.path.join(path, "judete.npy"), mmap_mode="r")
+
+    @property
+    def unmatched(self):
+        """Numele de județ nerecunoscute de registru, per tabel."""
+        return self.manifest["unmatched"]
+
+    def __contains__(self, nume):
+        return nume in self.manifest["tables"]
+
+    def column(self, nume, coloana):
+        for col in self.manifest["tables"][nume]["columns"]:
+            if col["name"] == coloana:
+                return np.load(os.path.join(self.path, col["file"]), mmap_mode="r")
+        raise KeyError(coloana)
+
+    def table(self, nume):
+        if nume not in self.manifest["tables"]:
+            raise FileNotFoundError(f"Tabelul {nume} nu există în bundle.")
+        date = {}
+        for col in self.manifest["tables"][nume]["columns"]:
+            valori = np.load(os.path.join(self.path, col["file"]), mmap_mode="r")
+            if col["kind"] == "judet":
+                valori = self.judete[valori]
+            elif col["kind"] == "text":
+                valori = _text(valori)
+            date[col["name"]] = valori
+        return pd.DataFrame(date)
+
+    def aligned(self, nume, where=None):
+        """Tabelul cu un rând per județ, pe poziția id-ului din registru.
+
+        Mai multe rânduri pentru același județ sunt o eroare, ca la REGISTRY.align; `where` filtrează
+        întâi după valori exacte, ex. {"Clasa Firma": "Total"}. Județele lipsă și textul lipsă devin NaN/None.
+        """
+        if nume not in self.manifest["tables"]:
+            raise FileNotFoundError(f"Tabelul {nume} nu există în bundle.")
+        coloane = self.manifest["tables"][nume]["columns"]
+        incarca = {c["name"]: np.load(os.path.join(self.path, c["file"]), mmap_mode="r") for c in coloane}
+        ids = incarca.pop("Judet")
+        masca = ids < self.manifest["counties"]
+        for coloana, valoare in (where or {}).items():
+            masca &= incarca[coloana] == valoare
+        ids = ids[masca]
+        n = self.manifest["counties"]
+        if (np.bincount(ids, minlength=n) > 1).any():
+            raise ValueError(f"Tabelul {nume} conține mai multe rânduri pentru același județ.")
+        date = {"Judet": self.judete[:n]}
+        for c in coloane:
+            if c["kind"] == "numeric":
+                valori = np.full(n, np.nan)
+                valori[ids] = incarca[c["name"]][masca]
+                date[c["name"]] = valori
+            elif c["kind"] == "text" and c["name"] not in (where or {}):
+                valori = np.full(n, None, dtype=object)
+                valori[ids] = _text(incarca[c["name"]][masca])
+                date[c["name"]] = valori
+        return pd.DataFrame(date)
+
+
+def _text(valori):
+    """Coloana text din bundle ca obiecte Python, cu șirul gol (valoare lipsă) ca None."""
+    valori = np.asarray(valori).astype(object)
+    valori[valori == ""] = None
+    return valori
+
+
+def load_bundle(surse=SURSE, bundle_dir=BUNDLE_DIR):
+    return Bundle(ensure_bundle(surse, bundle_dir))
+
+
+if __name__ == "__main__":
+    print(build_bundle())
@@ -0,0 +1,51 @@
+"""Controalele comune din bara laterală (ponderi, nivel de detaliu) și scorurile pentru selecția curentă.
+
+Importat doar de paginile care afișează scoruri (Home, după conținutul static, și Dashboard); Metodologie nu încarcă date.
+"""
+import streamlit as st
+
+from loaders import load_scoring_engine, load_uat_data
+from metrics import METRICS
+from scoring import DIMENSIUNI, PONDERI_IMPLICITE
+
+
+def weight_sliders():
+    # Ponderile dimensiunilor (w1..w5), normalizate automat la 100%
+    st.sidebar.markdown("---")
+    # Valorile stau în session_state (nu ca valoare implicită a slider-ului), ca să se păstreze între pagini
+    for coloana, w in zip(DIMENSIUNI, PONDERI_IMPLICITE):
+        st.session_state.setdefault(f"w_{coloana}", int(round(w * 100)))
+    with st.sidebar.expander("⚖️ Ponderi dimensiuni"):
+        ponderi = [
+            st.slider(eticheta, 0, 100, step=5, format="%d%%", key=f"w_{coloana}")
+            for coloana, eticheta in DIMENSIUNI.items()
+        ]
+        if sum(ponderi) == 0:
+            st.warning("Toate ponderile sunt 0 - se folosesc ponderile implicite.")
+            ponderi = PONDERI_IMPLICITE
+        st.caption("Ponderile sunt normalizate automat astfel încât suma lor să fie 100%.")
+    return ponderi
+
+
+def level_selector():
+    # Nivelul UAT apare doar când există date pe UAT (deocamdată setul sintetic, DASHBOARD_UAT_SINTETIC)
+    uat = load_uat_data()
+    if uat is None:
+        return "Județe", None
+    return st.sidebar.radio("🧭 Nivel de detaliu", ["Județe", "UAT"], horizontal=True, key="nivel"), uat
+
+
+def current_scores(ponderi, nivel="Județe", uat=None):
+    """Scorurile pentru ponderile curente: un singur produs matrice-vector, fără recitirea CSV-urilor.
+
+    Întoarce tabelul de scoruri și ScoringResult-ul din care provine (None dacă lipsesc datele).
+    """
+    with METRICS.section("scoring"):
+        if nivel == "UAT":
+            rezultat = uat.engine.score(ponderi)
+            return uat.frame(rezultat), rezultat
+        engine = load_scoring_engine()
+        if engine is None:
+            return None, None
+        rezultat = engine.score(ponderi)
+        return rezultat.frame(), rezultat
@@ -0,0 +1,153 @@
+"""Cub de agregare pre-calculat peste indicatorii și scorurile județelor.
+
+Nivelurile formează o ierarhie: județ -> regiune de dezvoltare -> macroregiune -> țară. Sumele,
+numărul de valori și sumele ponderate cu populația sunt aditive, deci fiecare nivel se obține din
+nivelul de dedesubt cu o singură reducere vectorizată (np.add.at). Mediile sunt derivate o dată, la
+construcție; o vizualizare (alt nivel, altă statistică, alt indicator) este doar o indexare.
+"""
+import numpy as np
+import pandas as pd
+
+from scoring import DIMENSIUNI, normalize_weights
+
+NIVELURI = ["Judet", "Regiune", "Macroregiune", "Tara"]
+ETICHETE_NIVEL = {"Judet": "Județ", "Regiune": "Regiune", "Macroregiune": "Macroregiune", "Tara": "Țară"}
+TARA = "România"
+
+STATISTICI = {
+    "suma": "Sumă",
+    "medie": "Medie",
+    "medie_ponderata": "Medie ponderată cu populația",
+    "numar": "Număr județe",
+}
+
+
+def macroregions(venit):
+    """Regiune -> macroregiune, din venit_gosp_2024.csv (fiecare rând MACROREGIUNEA e urmat de regiunile sale)."""
+    macro = None
+    rezultat = {}
+    for nume in venit["Regiuni"]:
+        if nume.upper().startswith("MACROREGIUNEA"):
+            macro = nume.title()
+        elif macro is not None:
+            rezultat[nume] = macro
+    return rezultat
+
+
+class AggregationCube:
+    """Statistici (nivel x grupă x măsură) calculate o singură dată; toate interogările sunt indexări."""
+
+    def __init__(self, judete, regiuni, macroregiuni, masuri, populatie):
+        self.masuri = list(masuri)
+        self._coloana = {m: k for k, m in enumerate(self.masuri)}
+        valori = np.column_stack([np.asarray(v, dtype=float) for v in masuri.values()])
+        populatie = np.asarray(populatie, dtype=float)
+
+        # Codurile fiecărui județ pe fiecare nivel; grupele unui nivel sunt sortate după nume
+        etichete = {
+            "Judet": np.asarray(judete, dtype=object),
+            "Regiune": np.asarray(regiuni, dtype=object),
+            "Macroregiune": np.asarray(macroregiuni, dtype=object),
+            "Tara": np.full(len(valori), TARA, dtype=object),
+        }
+        self.nume = {}
+        cod_judet = {}
+        for nivel in NIVELURI:
+            self.nume[nivel], cod_judet[nivel] = np.unique(etichete[nivel], return_inverse=True)
+        self._index = {nivel: {n: i for i, n in enumerate(nume)} for nivel, nume in self.nume.items()}
+
+        # Părintele fiecărei grupe pe nivelul următor (ierarhia e strictă: un județ are o singură regiune etc.)
+        self._parinte = {}
+        for jos, sus in zip(NIVELURI, NIVELURI[1:]):
+            parinte = np.empty(len(self.nume[jos]), dtype=int)
+            parinte[cod_judet[jos]] = cod_judet[sus]
+            self._parinte[jos] = parinte
+
+        prezent = ~np.isnan(valori)
+        aditive = {
+            "suma": np.where(prezent, valori, 0.0),
+            "numar": prezent.astype(float),
+            "suma_ponderata": np.where(prezent, valori * populatie[:, None], 0.0),
+            "pondere": prezent * populatie[:, None],
+        }
+        nivel_jos = "Judet"
+        # Județele sunt deja grupele primului nivel, în ordinea numelor sortate
+        ordine = np.argsort(cod_judet["Judet"])
+        aditive = {k: v[ordine] for k, v in aditive.items()}
+        self._stat = {}
+        for nivel in NIVELURI:
+            if nivel != "Judet":
+                grupe = len(self.nume[nivel])
+                parinte = self._parinte[nivel_jos]
+                for k, v in aditive.items():
+                    sus = np.zeros((grupe, v.shape[1]))
+                    np.add.at(sus, parinte, v)
+                    aditive[k] = sus
+                nivel_jos = nivel
+            with np.errstate(invalid="ignore", divide="ignore"):
+                stat = np.stack([
+                    aditive["suma"],
+                    aditive["suma"] / aditive["numar"],
+                    aditive["suma_ponderata"] / aditive["pondere"],
+                    aditive["numar"],
+                ])
+            stat.flags.writeable = False
+            self._stat[nivel] = stat
+        self._statistici = {s: k for k, s in enumerate(STATISTICI)}
+        self._cadre = {}
+
+    def values(self, nivel, masura, statistica="medie"):
+        """Valorile unei măsuri pentru toate grupele nivelului (view read-only, aliniat pe `names(nivel)`)."""
+        return self._stat[nivel][self._statistici[statistica], :, self._coloana[masura]]
+
+    def value(self, nivel, grupa, masura, statistica="medie"):
+        return float(self._stat[nivel][self._statistici[statistica], self._index[nivel][grupa], self._coloana[masura]])
+
+    def names(self, nivel):
+        return self.nume[nivel]
+
+    def parent(self, nivel, grupa):
+        """Roll-up: nivelul și grupa imediat superioare."""
+        sus = NIVELURI[NIVELURI.index(nivel) + 1]
+        return sus, self.nume[sus][self._parinte[nivel][self._index[nivel][grupa]]]
+
+    def children(self, nivel, grupa):
+        """Drill-down: nivelul imediat inferior și grupele care compun `grupa`."""
+        jos = NIVELURI[NIVELURI.index(nivel) - 1]
+        return jos, self.nume[jos][self._parinte[jos] == self._index[nivel][grupa]]
+
+    def frame(self, nivel, statistica="medie"):
+        """Tabelul nivelului pentru o statistică (construit o singură dată per combinație)."""
+        cheie = (nivel, statistica)
+        if cheie not in self._cadre:
+            df = pd.DataFrame(self._stat[nivel][self._statistici[statistica]], columns=self.masuri)
+            df.insert(0, nivel, self.nume[nivel])
+            self._cadre[cheie] = df
+        return self._cadre[cheie]
+
+    def potential(self, nivel, ponderi, statistica="medie"):
+        """Potențialul (0-100) agregat pe nivel, pentru orice ponderi.
+
+        Potențialul este liniar în scorurile pe dimensiuni, deci media (ponderată) a potențialului
+        este media scorurilor înmulțită cu ponderile: 5 coloane x grupe, fără recalcularea județelor.
+        """
+        w = normalize_weights(ponderi)
+        coloane = [self._coloana[d] for d in DIMENSIUNI]
+        return self._stat[nivel][self._statistici[statistica]][:, coloane] @ w * 100
+
+
+def build_cube(indicatori, macroregiuni, matrice=None):
+    """Cubul peste un tabel aliniat pe județe (Judet, Regiune, Populatie și indicatorii numerici).
+
+    `matrice` (județe x 5) adaugă scorurile pe dimensiuni ca măsuri; județele fără regiune sunt omise.
+    """
+    valid = indicatori["Regiune"].notna().to_numpy()
+    if matrice is not None:
+        valid = valid & ~np.isnan(matrice).any(axis=1)
+    df = indicatori[valid]
+    masuri = {c: df[c].to_numpy(dtype=float) for c in df.columns if c not in ("Judet", "Regiune")}
+    if matrice is not None:
+        masuri.update(zip(DIMENSIUNI, np.asarray(matrice)[valid].T))
+    regiuni = df["Regiune"].to_numpy(dtype=object)
+    macro = np.array([macroregiuni.get(r, "Necunoscută") for r in regiuni], dtype=object)
+    return AggregationCube(df["Judet"].to_numpy(), regiuni, macro, masuri, df["Populatie"].to_numpy(dtype=float))
@@ -0,0 +1,61 @@
+"""Payload-ul pre-calculat pentru panoul de detalii al unui județ (click pe hartă).
+
+Tabelele primite sunt aliniate pe id-ul din registru (un rând per județ), deci fiecare panou este o
+simplă indexare; seriile anuale sunt împărțite pe județe o singură dată.
+"""
+import numpy as np
+import pandas as pd
+
+from judete import REGISTRY
+from scoring import DIMENSIUNI
+
+# Indicatorii din tabel_grafice.csv (valori scalate Min-Max, 0-1)
+INDICATORI = {
+    "Populatie": "Populație",
+    "Populatia Activa": "Populație activă",
+    "Rata Somaj": "Rata șomajului",
+    "Salariul Mediu": "Salariul mediu",
+    "Venit Gospodarie": "Venitul gospodăriei (regiune)",
+    "Numar Firme": "Număr firme",
+    "Firme per 1000 locuitori": "Firme la 1000 locuitori",
+    "Procent Urbanizare": "Procent urbanizare",
+    "Evolutie_medie_salariu": "Evoluția medie a salariului",
+    "Evolutie_medie_somaj": "Evoluția medie a șomajului",
+}
+
+
+def build_county_details(grafice, tooltip, rezumat=None, serii=None, registry=REGISTRY):
+    """Dict id județ -> detalii: indicatori, scoruri pe dimensiuni, valori brute, serii 2019-2023 și comparația regională."""
+    ids_serii = registry.ids(serii["Judet"])[0] if serii is not None else None
+    detalii = {}
+    for i, judet in enumerate(registry.names):
+        if pd.isna(grafice["Regiune"].iloc[i]):
+            continue
+        regiune = tooltip["Regiune"].iloc[i]
+        din_regiune = tooltip[tooltip["Regiune"] == regiune][["Judet", "Potential"]]
+        detalii[i] = {
+            "judet": judet,
+            "regiune": regiune,
+            "indicatori": pd.DataFrame({
+                "Indicator": list(INDICATORI.values()),
+                "Valoare (0-1)": grafice[list(INDICATORI)].iloc[i].to_numpy(dtype=float).round(3),
+            }),
+            "dimensiuni": pd.DataFrame({
+                "Dimensiune": list(DIMENSIUNI.values()),
+                "Scor (0-1)": grafice[list(DIMENSIUNI)].iloc[i].to_numpy(dtype=float).round(3),
+            }),
+            "valori": rezumat.drop(columns=["Judet"]).iloc[i].to_dict() if rezumat is not None else {},
+            "serii": (
+                serii[ids_serii == i].drop(columns=["Judet"]).set_index("An")
+                if serii is not None else None
+            ),
+            "comparatie": tooltip.iloc[i].to_dict(),
+            "regiune_judete": din_regiune.sort_values("Potential", ascending=False, ignore_index=True),
+        }
+    return detalii
+
+
+def region_position(detaliu):
+    """Locul județului în regiunea sa după potențialul publicat (1 = cel mai mare)."""
+    judete = detaliu["regiune_judete"]["Judet"].to_numpy()
+    return int(np.flatnonzero(judete == detaliu["judet"])[0]) + 1, len(judete)
@@ -0,0 +1,353 @@
+"""Pipeline-ul reproductibil de la fișierele brute INS (baze/*.csv) la tabelele scorate.
+
+Etapele formează un graf de dependențe: fiecare etapă primește fișiere brute sau rezultatele altor
+etape. Cheia unei etape este hash-ul codului ei și al intrărilor (conținutul fișierelor, respectiv
+hash-ul rezultatelor din amonte), deci la o schimbare doar etapele din aval sunt recalculate; o etapă
+recalculată cu același rezultat nu mai invalidează etapele de după ea. Rezultatele intermediare stau
+în baze/.cache/etl.
+
+Rebuild complet: `python dashboard/etl.py --force` (fără --force se recalculează doar ce s-a schimbat).
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+
+import pandas as pd
+
+import bundle
+import details
+import judete
+import scoring
+import trends
+from bundle import clean_frame
+from details import INDICATORI
+from judete import REGISTRY
+from scoring import DIMENSIUNI, PONDERI_IMPLICITE
+from trends import TrendEngine
+
+FORMAT_ETL = 1
+CACHE_DIR = "baze/.cache/etl"
+
+# Fișierele brute, cu aceleași nume ca în bundle.SURSE
+SURSE_BRUTE = {
+    "populatie": "baze/populatie_2024.csv",
+    "pop_activa": "baze/populatia_activa_2023.csv",
+    "firme": "baze/numar_firme2023.csv",
+    "somaj": "baze/rata_somaj_2023.csv",
+    "somaj_serie": "baze/rata_somaj_2019-2023.csv",
+    "salarii": "baze/salariul_mediu2023.csv",
+    "salarii_serie": "baze/salariul_mediu_2019-2023.csv",
+    "urbanizare": "baze/procent_urbanizare2024.csv",
+    "venit_gosp": "baze/venit_gosp_2024.csv",
+}
+
+# Etapă -> fișierul scris; tabel_grafice.csv are o singură copie, în dashboard/
+IESIRI = {
+    "tabel_grafice": "dashboard/tabel_grafice.csv",
+    "tabel_tooltip": "dashboard/tabel_tooltip.csv",
+    "tabel_final": "dashboard/tabel_final.csv",
+    "trenduri": "baze/trenduri.csv",
+    "firme_per_mie": "baze/firme_per_mie.csv",
+}
+
+
+# Ordinea coloanelor din tabel_grafice.csv
+COLOANE_GRAFICE = [
+    "Judet", "Populatie", "Regiune", "Numar Firme", "Firme per 1000 locuitori", "Populatia Activa", "Rata Somaj",
+    "Salariul Mediu", "Venit Gospodarie", "Procent Urbanizare", "Evolutie_medie_salariu", "Evolutie_medie_somaj",
+    *sorted(DIMENSIUNI), "Potential",
+]
+
+
+class Etapa:
+    def __init__(self, nume, intrari, functie):
+        self.nume = nume
+        self.intrari = intrari
+        self.functie = functie
+        # Modificarea codului unei etape o invalidează (împreună cu tot ce e în aval)
+        self.cod = inspect.getsource(functie)
+
+
+# Ordinea definirii este o ordine topologică: o etapă poate folosi doar surse sau etape deja definite
+ETAPE = {}
+
+
+def etapa(*intrari):
+    def decorator(functie):
+        necunoscute = [i for i in intrari if i not in SURSE_BRUTE and i not in ETAPE]
+        if necunoscute:
+            raise ValueError(f"Etapa {functie.__name__} depinde de intrări nedefinite: {', '.join(necunoscute)}")
+        ETAPE[functie.__name__] = Etapa(functie.__name__, intrari, functie)
+        return functie
+    return decorator
+
+
+def _aliniat(df, coloane):
+    aliniat, nepotrivite = REGISTRY.align(df[["Judet", *coloane]])
+    if nepotrivite:
+        raise ValueError(f"Județe nerecunoscute: {', '.join(nepotrivite)}")
+    return aliniat
+
+
+def _min_max(serie):
+    return (serie - serie.min()) / (serie.max() - serie.min())
+
+
+# --- Curățare: câte o etapă per fișier brut, un rând per județ în ordinea registrului ---
+
+@etapa("populatie")
+def populatie(df):
+    return _aliniat(df, ["Populatie", "Regiune"])
+
+
+@etapa("pop_activa")
+def populatia_activa(df):
+    return _aliniat(df.rename(columns={"Populatia Activa (mii)": "Populatia Activa"}), ["Populatia Activa"])
+
+
+@etapa("firme")
+def numar_firme(df):
+    return _aliniat(df[df["Clasa Firma"] == "Total"], ["Numar Firme"])
+
+
+@etapa("somaj")
+def rata_somaj(df):
+    return _aliniat(df.rename(columns={"Rata Somaj (%)": "Rata Somaj"}), ["Rata Somaj"])
+
+
+@etapa("salarii")
+def salariul_mediu(df):
+    return _aliniat(df.rename(columns={"Salariul Mediu Net (RON)": "Salariul Mediu"}), ["Salariul Mediu"])
+
+
+@etapa("urbanizare")
+def urbanizare(df):
+    return _aliniat(df, ["Procent Urbanizare"])
+
+
+@etapa("venit_gosp")
+def venit_regiuni(df):
+    # Fișierul conține și macroregiunile; venitul se atribuie pe regiunea de dezvoltare
+    df = df[~df["Regiuni"].str.upper().str.startswith("MACROREGIUNEA")]
+    return pd.DataFrame({"Regiune": df["Regiuni"], "Venit Gospodarie": df["Valoare"]}).reset_index(drop=True)
+
+
+@etapa("salarii_serie")
+def evolutie_salariu(df):
+    # Media variațiilor anuale (%), nerotunjită
+    metrici = TrendEngine.from_long(df, "Perioade", "Salariul Mediu").metrics()
+    return metrici[["Judet", "Evolutie medie (%)"]].rename(columns={"Evolutie medie (%)": "Evolutie_medie_salariu"})
+
+
+@etapa("somaj_serie")
+def evolutie_somaj(df):
+    metrici = TrendEngine.from_long(df, "An", "Rata Somaj").metrics()
+    return metrici[["Judet", "Evolutie medie (%)"]].rename(columns={"Evolutie medie (%)": "Evolutie_medie_somaj"})
+
+
+# --- Indicatori, scalare, dimensiuni, potențial ---
+
+@etapa("populatie", "numar_firme")
+def firme_per_mie(pop, firme):
+    return pd.DataFrame({"Judet": pop["Judet"], "Firme per 1000 locuitori": firme["Numar Firme"] / pop["Populatie"] * 1000})
+
+
+@etapa("populatie", "numar_firme", "firme_per_mie", "populatia_activa", "rata_somaj", "salariul_mediu",
+       "urbanizare", "venit_regiuni", "evolutie_salariu", "evolutie_somaj")
+def indicatori(pop, firme, per_mie, activa, somaj, salariu, urban, venit, evo_salariu, evo_somaj):
+    """Valorile brute ale indicatorilor, un rând per județ."""
+    df = pop.copy()
+    # Tabelele pe județe sunt aliniate pe registru, deci coloanele se pot lipi direct
+    for tabel in (firme, per_mie, activa, somaj, salariu, urban, evo_salariu, evo_somaj):
+        df[tabel.columns[1]] = tabel.iloc[:, 1].to_numpy()
+    df["Venit Gospodarie"] = df["Regiune"].map(venit.set_index("Regiune")["Venit Gospodarie"])
+    return df.dropna(subset=["Populatie"]).reset_index(drop=True)
+
+
+@etapa("indicatori")
+def scalare(df):
+    """Scalare Min-Max (0-1) a fiecărui indicator."""
+    scalat = df[["Judet", "Populatie", "Regiune"]].copy()
+    for coloana in INDICATORI:
+        scalat[coloana] = _min_max(df[coloana])
+    return scalat
+
+
+@etapa("scalare")
+def dimensiuni(df):
+    df = df.copy()
+    df["Competitie_score"] = 1 - (df["Numar Firme"] + df["Firme per 1000 locuitori"]) / 2
+    df["Forta_de_munca_score"] = (df["Populatia Activa"] + 1 - df["Rata Somaj"]) / 2
+    df["Piata_locala_score"] = (df["Populatie"] + df["Salariul Mediu"] + df["Venit Gospodarie"]) / 3
+    df["Stabilitate_economica_score"] = (df["Evolutie_medie_salariu"] + 1 - df["Evolutie_medie_somaj"]) / 2
+    df["Urbanizare_score"] = df["Procent Urbanizare"]
+    return df
+
+
+@etapa("dimensiuni")
+def tabel_grafice(df):
+    """Indicatorii scalați, scorurile pe dimensiuni și potențialul (0-1), descrescător după potențial."""
+    df = df.copy()
+    df["Potential"] = df[list(DIMENSIUNI)].to_numpy() @ PONDERI_IMPLICITE
+    return df[COLOANE_GRAFICE].sort_values("Potential", ascending=False, kind="stable", ignore_index=True)
+
+
+@etapa("tabel_grafice")
+def tabel_tooltip(df):
+    """Potențialul 0-100 și comparațiile cu media țării / regiunii.
+
+    Mediile se calculează din potențialul deja rotunjit la 2 zecimale, ca în tabelul publicat.
+    """
+    potential = (df["Potential"] * 100).round(2)
+    media_tarii = potential.mean()
+    media_regiunii = potential.groupby(df["Regiune"]).transform("mean").round(2)
+    return pd.DataFrame({
+        "Judet": df["Judet"],
+        "Regiune": df["Regiune"],
+        "Potential": potential,
+        "Media Tarii": round(media_tarii, 2),
+        "Media Regiunii": media_regiunii,
+        "Vs Media Tarii": (potential - media_tarii).round(2),
+        "Vs Media Regiunii": (potential - media_regiunii).round(2),
+    })
+
+
+@etapa("tabel_tooltip")
+def tabel_final(df):
+    return df[["Judet", "Potential"]]
+
+
+@etapa("evolutie_salariu", "evolutie_somaj")
+def trenduri(salariu, somaj):
+    return pd.DataFrame({
+        "Judet": salariu["Judet"],
+        "Evolutie Medie Salariu (%)": salariu["Evolutie_medie_salariu"].round(2),
+        "Evolutie Medie Somaj (%)": somaj["Evolutie_medie_somaj"].round(2),
+    })
+
+
+# --- Execuție ---
+
+def _hash_fisier(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _hash_tabel(df):
+    h = hashlib.sha256(json.dumps([list(map(str, df.columns)), list(map(str, df.dtypes))]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _cod_comun():
+    """Codul și constantele folosite de toate etapele (în afara funcțiilor etapelor): helperii din acest
+    modul și modulele importate (curățare, registrul județelor, trenduri, ponderi, indicatori).
+    """
+    h = hashlib.sha256()
+    for sursa in (_aliniat, _min_max, bundle, details, judete, scoring, trends):
+        h.update(inspect.getsource(sursa).encode())
+    h.update(repr(COLOANE_GRAFICE).encode())
+    return h.hexdigest()
+
+
+def _cheie(etapa_, hash_intrari):
+    h = hashlib.sha256(f"{FORMAT_ETL}\n{_cod_comun()}\n{etapa_.cod}".encode())
+    for valoare in hash_intrari:
+        h.update(valoare.encode())
+    return h.hexdigest()
+
+
+def _temporar(path):
+    # Unic per proces și thread: sesiunile Streamlit din același proces pot rula ETL-ul simultan
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _scrie_pickle(df, path):
+    temporar = _temporar(path)
+    df.to_pickle(temporar)
+    os.replace(temporar, path)
+
+
+def _scrie_daca_difera(df, path):
+    continut = df.to_csv(index=False).encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == continut:
+                return False
+    except FileNotFoundError:
+        pass
+    # Scriere atomică, ca la bundle: aplicația nu citește niciodată un fișier parțial
+    temporar = _temporar(path)
+    with open(temporar, "wb") as f:
+        f.write(continut)
+    os.replace(temporar, path)
+    return True
+
+
+def run(force=False, surse=SURSE_BRUTE, iesiri=IESIRI, cache_dir=CACHE_DIR):
+    """Rulează graful; întoarce starea fiecărei etape ("recalculat" / "din cache") și fișierele rescrise."""
+    os.makedirs(cache_dir, exist_ok=True)
+    cale_manifest = os.path.join(cache_dir, "manifest.json")
+    try:
+        with open(cale_manifest, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != FORMAT_ETL:
+            manifest = {}
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+    etape_vechi = manifest.get("stages", {})
+
+    hashuri = {nume: _hash_fisier(path) for nume, path in surse.items()}
+    rezultate = {}
+
+    def rezultat(nume):
+        # Intrările se citesc doar când o etapă chiar trebuie recalculată
+        if nume not in rezultate:
+            if nume in surse:
+                rezultate[nume] = clean_frame(pd.read_csv(surse[nume]))
+            else:
+                rezultate[nume] = pd.read_pickle(os.path.join(cache_dir, f"{nume}.pkl"))
+        return rezultate[nume]
+
+    stare = {}
+    etape_noi = {}
+    for nume, e in ETAPE.items():
+        cheie = _cheie(e, [hashuri[i] for i in e.intrari])
+        vechi = etape_vechi.get(nume)
+        if not force and vechi and vechi["key"] == cheie and os.path.exists(os.path.join(cache_dir, f"{nume}.pkl")):
+            hashuri[nume] = vechi["hash"]
+            stare[nume] = "din cache"
+        else:
+            df = e.functie(*[rezultat(i) for i in e.intrari])
+            _scrie_pickle(df, os.path.join(cache_dir, f"{nume}.pkl"))
+            rezultate[nume] = df
+            hashuri[nume] = _hash_tabel(df)
+            stare[nume] = "recalculat"
+        etape_noi[nume] = {"key": cheie, "hash": hashuri[nume]}
+
+    # Fișierele de ieșire sunt rescrise doar dacă s-a schimbat conținutul (bundle-ul nu se reconstruiește degeaba)
+    scrise = [path for nume, path in iesiri.items() if _scrie_daca_difera(rezultat(nume), path)]
+
+    temporar = _temporar(cale_manifest)
+    with open(temporar, "w", encoding="utf-8") as f:
+        json.dump({"format": FORMAT_ETL, "stages": etape_noi}, f, indent=1)
+    os.replace(temporar, cale_manifest)
+    return stare, scrise
+
+
+def stage(nume, cache_dir=CACHE_DIR):
+    """Rezultatul unei etape (ex. "indicatori"): graful este adus la zi, fără a rescrie fișierele de ieșire."""
+    run(iesiri={}, cache_dir=cache_dir)
+    return pd.read_pickle(os.path.join(cache_dir, f"{nume}.pkl"))
+
+
+if __name__ == "__main__":
+    stare, scrise = run(force="--force" in sys.argv[1:])
+    for nume, s in stare.items():
+        print(f"{nume:<28} {s}")
+    print("Fișiere rescrise:", ", ".join(scrise) if scrise else "niciunul")
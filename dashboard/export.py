@@ -0,0 +1,98 @@
+import tempfile
+
+import pandas as pd
+import streamlit as st
+import xlsxwriter
+
+from figure_cache import content_hash
+from metrics import METRICS
+
+# Parquet e opțional: butonul apare doar dacă pyarrow este instalat
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Rânduri scrise per pas; memoria folosită nu depinde de mărimea tabelului
+CHUNK_ROWS = 10_000
+# Până la această mărime fișierul temporar stă în memorie, peste e mutat pe disc
+MAX_MEMORY_BYTES = 8 * 1024 * 1024
+
+FORMATE = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def parquet_available():
+    return pa is not None
+
+
+def _chunks(df):
+    for start in range(0, len(df), CHUNK_ROWS):
+        yield df.iloc[start:start + CHUNK_ROWS]
+
+
+def write_csv(df, fisier):
+    for i, bucata in enumerate(_chunks(df)):
+        fisier.write(bucata.to_csv(index=False, header=(i == 0)).encode("utf-8"))
+
+
+def write_xlsx(sheets, fisier):
+    # constant_memory: xlsxwriter scrie fiecare rând pe disc imediat ce rândul următor începe
+    workbook = xlsxwriter.Workbook(fisier, {"constant_memory": True})
+    antet = workbook.add_format({"bold": True})
+    for nume, df in sheets.items():
+        sheet = workbook.add_worksheet(nume[:31])
+        sheet.write_row(0, 0, [str(c) for c in df.columns], antet)
+        rand = 1
+        for bucata in _chunks(df):
+            valori = bucata.astype(object).where(bucata.notna(), None)
+            for linie in valori.itertuples(index=False):
+                sheet.write_row(rand, 0, linie)
+                rand += 1
+    workbook.close()
+
+
+def write_parquet(df, fisier):
+    writer = None
+    for bucata in _chunks(df):
+        tabel = pa.Table.from_pandas(bucata, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(fisier, tabel.schema)
+        writer.write_table(tabel)
+    if writer is not None:
+        writer.close()
+
+
+def _serialize(sheets, fmt):
+    with tempfile.SpooledTemporaryFile(max_size=MAX_MEMORY_BYTES) as fisier:
+        if fmt == "xlsx":
+            write_xlsx(sheets, fisier)
+        elif fmt == "csv":
+            write_csv(next(iter(sheets.values())), fisier)
+        elif fmt == "parquet":
+            write_parquet(next(iter(sheets.values())), fisier)
+        else:
+            raise ValueError(f"Format de export necunoscut: {fmt}")
+        fisier.seek(0)
+        return fisier.read()
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_export(cheie, fmt, _sheets):
+    return _serialize(_sheets, fmt)
+
+
+def export_bytes(sheets, fmt):
+    """Conținutul fișierului de export, cache-uit după hash-ul conținutului tabelelor.
+
+    `sheets` este un dict nume -> DataFrame; CSV și Parquet folosesc doar primul tabel.
+    """
+    with METRICS.section(f"export:{fmt}"):
+        cheie = content_hash(fmt, list(sheets), *sheets.values())
+        continut = _cached_export(cheie, fmt, sheets)
+    METRICS.add_payload(f"export:{fmt}", len(continut))
+    return continut
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+
+def content_hash(*parti):
+    """Hash stabil pentru DataFrame-uri, array-uri și valori simple (ponderi, opțiuni de layout)."""
+    h = hashlib.sha256()
+    for parte in parti:
+        if isinstance(parte, pd.DataFrame):
+            h.update(json.dumps(list(map(str, parte.columns))).encode())
+            h.update(pd.util.hash_pandas_object(parte, index=True).to_numpy().tobytes())
+        elif isinstance(parte, np.ndarray):
+            h.update(str(parte.dtype).encode())
+            h.update(np.ascontiguousarray(parte).tobytes())
+        else:
+            h.update(json.dumps(parte, sort_keys=True, default=str).encode())
+        h.update(b"\x00")
+    return h.hexdigest()[:32]
+
+
+class FigureCache:
+    """Cache LRU pentru figuri Plotly serializate, limitat în bytes, cu persistență opțională pe disc.
+
+    Pe un hit figura este refăcută din JSON fără validare, deci construcția
+    (px.choropleth, update_*) și validarea Plotly sunt sărite complet.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk_dir=None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self._intrari = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _cale_disc(self, cheie):
+        return os.path.join(self.disk_dir, f"{cheie}.json")
+
+    def _memoreaza(self, cheie, spec):
+        with self._lock:
+            if cheie in self._intrari:
+                return
+            self._intrari[cheie] = spec
+            self._bytes += len(spec)
+            while self._bytes > self.max_bytes and len(self._intrari) > 1:
+                _, vechi = self._intrari.popitem(last=False)
+                self._bytes -= len(vechi)
+                self.evictions += 1
+
+    def get_spec(self, cheie):
+        with self._lock:
+            spec = self._intrari.get(cheie)
+            if spec is not None:
+                self._intrari.move_to_end(cheie)
+                self.hits += 1
+                return spec
+        if self.disk_dir:
+            try:
+                with open(self._cale_disc(cheie), "r", encoding="utf-8") as f:
+                    spec = f.read()
+            except FileNotFoundError:
+                return None
+            self._memoreaza(cheie, spec)
+            with self._lock:
+                self.disk_hits += 1
+            return spec
+        return None
+
+    def put_spec(self, cheie, spec):
+        self._memoreaza(cheie, spec)
+        if self.disk_dir:
+            temporar = f"{self._cale_disc(cheie)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(temporar, "w", encoding="utf-8") as f:
+                    f.write(spec)
+                os.replace(temporar, self._cale_disc(cheie))
+            except OSError:
+                pass
+
+    def get_or_build_spec(self, cheie, build):
+        """JSON-ul pentru cheie; `build()` (care întoarce direct JSON-ul) este apelat doar la miss."""
+        spec = self.get_spec(cheie)
+        if spec is None:
+            with self._lock:
+                self.misses += 1
+            spec = build()
+            self.put_spec(cheie, spec)
+        return spec
+
+    def get_or_build(self, cheie, build):
+        """Întoarce figura pentru cheie; `build()` este apelat doar la miss."""
+        spec = self.get_or_build_spec(cheie, lambda: build().to_json(validate=False))
+        return go.Figure(json.loads(spec), _validate=False)
+
+    def size_of(self, cheie):
+        """Mărimea (bytes) figurii serializate din memorie, fără a modifica statisticile."""
+        with self._lock:
+            spec = self._intrari.get(cheie)
+            return len(spec) if spec is not None else None
+
+    def stats(self):
+        with self._lock:
+            cereri = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / cereri if cereri else 0.0,
+                "entries": len(self._intrari),
+                "bytes": self._bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._intrari.clear()
+            self._bytes = 0
@@ -0,0 +1,276 @@
+import plotly.express as px
+import plotly.graph_objects as go
+
+
+# Coloanele din customdata-ul hărții (după numele unității), în ordinea din hover template
+COLOANE_HOVER = ['Regiune', 'Potential', 'Media Tarii', 'Media Regiunii', 'Vs Media Tarii', 'Vs Media Regiunii']
+
+
+def build_map_figure(
+    df, geojson, latime_px=1400, nume="Judet", locatii="Judet", featureidkey="properties.name",
+    titlu="Potențialul Economic al Județelor din România - Hover pentru detalii",
+):
+    # Creează hover template personalizat
+    hover_template = (
+        "<b>%{customdata[0]}</b><br>"
+        "🏛️ <b>Regiune:</b> %{customdata[1]}<br>"
+        "📊 <b>Potențial Economic:</b> %{customdata[2]:.2f}<br>"
+        "🇷🇴 <b>Media Țării:</b> %{customdata[3]:.2f}<br>"
+        "🏘️ <b>Media Regiunii:</b> %{customdata[4]:.2f}<br>"
+        "📈 <b>vs Media Țării:</b> %{customdata[5]:+.2f}<br>"
+        "📉 <b>vs Media Regiunii:</b> %{customdata[6]:+.2f}<br>"
+        "<extra></extra>"
+    )
+
+    fig = px.choropleth(
+        df,
+        geojson=geojson,
+        locations=locatii,
+        featureidkey=featureidkey,
+        color="Potential",
+        color_continuous_scale="Viridis",
+        title=titlu,
+        hover_name=nume,
+        custom_data=[nume, *COLOANE_HOVER]
+    )
+
+    # Actualizează hover template
+    fig.update_traces(hovertemplate=hover_template)
+
+    fig.update_geos(
+        fitbounds="locations",
+        visible=False,
+        bgcolor='rgba(0,0,0,0)',
+        projection_type='mercator'
+    )
+
+    fig.update_layout(
+        width=latime_px,
+        height=700,
+        margin={"r":0, "t":50, "l":0, "b":0},
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        geo=dict(bgcolor='rgba(0,0,0,0)'),
+        legend=dict(
+            bgcolor='rgba(255,255,255,0.8)',
+            bordercolor='black',
+            borderwidth=1
+        )
+    )
+
+    fig.update_traces(
+        colorbar=dict(
+            title='Potențial Economic',
+            tickfont=dict(color='black'),
+            bgcolor='rgba(255,255,255,0.8)',
+            bordercolor='black',
+            borderwidth=1
+        )
+    )
+
+    return fig
+
+
+def map_values(df, nume="Judet", locatii="Judet"):
+    """Valorile trace-ului hărții care depind de scoruri (aceleași chei ca în figura din build_map_figure)."""
+    return {
+        "locations": df[locatii].tolist(),
+        "z": df["Potential"].round(4).tolist(),
+        "customdata": df[[nume, *COLOANE_HOVER]].to_numpy(dtype=object).tolist(),
+        "hovertext": df[nume].tolist(),
+    }
+
+
+# Culorile tipologiilor (tipologia i are mereu aceeași culoare, indiferent de k)
+CULORI_TIPOLOGII = px.colors.qualitative.Set2
+
+
+def build_cluster_map_figure(
+    geojson, latime_px=1400, locatii=(), featureidkey="properties.name",
+    titlu="Tipologiile Județelor - Hover pentru detalii",
+):
+    """Harta colorată pe tipologii. Scala de culori este discretă și fixă (o culoare per tipologie, până la
+    len(CULORI_TIPOLOGII)), deci figura nu depinde de k: valorile vin din cluster_map_values.
+    """
+    n = len(CULORI_TIPOLOGII)
+    scala = [[pas, culoare] for i, culoare in enumerate(CULORI_TIPOLOGII) for pas in (i / n, (i + 1) / n)]
+    hover_template = (
+        "<b>%{customdata[0]}</b><br>"
+        "🏛️ <b>Regiune:</b> %{customdata[1]}<br>"
+        "🧩 <b>Tipologia %{customdata[2]}:</b> %{customdata[3]}<br>"
+        "📊 <b>Potențial Economic:</b> %{customdata[4]:.2f}<br>"
+        "<extra></extra>"
+    )
+    fig = go.Figure(go.Choropleth(
+        geojson=geojson,
+        locations=list(locatii),
+        featureidkey=featureidkey,
+        colorscale=scala,
+        zmin=-0.5,
+        zmax=n - 0.5,
+        showscale=False,
+        marker_line_color="white",
+        hovertemplate=hover_template,
+    ))
+    fig.update_geos(fitbounds="locations", visible=False, bgcolor='rgba(0,0,0,0)', projection_type='mercator')
+    fig.update_layout(
+        title=titlu,
+        width=latime_px,
+        height=700,
+        margin={"r": 0, "t": 50, "l": 0, "b": 0},
+        paper_bgcolor='rgba(0,0,0,0)',
+        geo=dict(bgcolor='rgba(0,0,0,0)'),
+    )
+    return fig
+
+
+def cluster_map_values(df, etichete, descrieri, nume="Judet", locatii="Judet"):
+    """Valorile hărții pe tipologii: `etichete` (0..k-1) aliniate pe rândurile lui `df`."""
+    etichete = [int(e) for e in etichete]
+    return {
+        "locations": df[locatii].tolist(),
+        "z": etichete,
+        "customdata": [
+            [n, regiune, e + 1, descrieri[e], float(potential)]
+            for n, regiune, e, potential in zip(df[nume], df["Regiune"], etichete, df["Potential"])
+        ],
+        "hovertext": df[nume].tolist(),
+    }
+
+
+def build_bar_figure(df, x="Judet", titlu="Clasificarea Județelor după Potențial Economic", vizibile=10):
+    fig = px.bar(
+        df,
+        x=x,
+        y="Potential",
+        color="Potential",
+        color_continuous_scale="Viridis",
+        text="Potential",
+        title=titlu,
+    )
+
+    fig.update_layout(
+        xaxis=dict(
+            categoryorder="total descending",
+            range=[-0.5, min(vizibile, len(df)) - 0.5],
+            rangeslider=dict(
+                visible=True,
+                range=[0, len(df)-1]
+            ),
+            tickangle=-45,
+        ),
+        yaxis=dict(range=[0, df["Potential"].max() + 5]),
+        height=700,
+        margin=dict(l=60, r=60, t=80, b=180),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+
+    fig.update_traces(
+        texttemplate="%{text:.2f}",
+        textposition="outside"
+    )
+
+    return fig
+
+
+def build_rank_band_figure(df):
+    # Banda P5-P95 a rangului fiecărui județ, cu rangul median și rangul pentru ponderile de referință
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=df["Judet"],
+        y=df["Rang median"],
+        mode="markers",
+        name="Rang median",
+        marker=dict(size=9, color="#1f77b4"),
+        error_y=dict(
+            type="data",
+            symmetric=False,
+            array=df["Rang P95"] - df["Rang median"],
+            arrayminus=df["Rang median"] - df["Rang P5"],
+            thickness=1.5,
+            width=0,
+        ),
+        customdata=df[["Rang P5", "Rang P95", "P(top 5) %"]],
+        hovertemplate=(
+            "<b>%{x}</b><br>Rang median: %{y}<br>"
+            "Banda P5-P95: %{customdata[0]} - %{customdata[1]}<br>"
+            "P(top 5): %{customdata[2]:.1f}%<extra></extra>"
+        ),
+    ))
+    fig.add_trace(go.Scatter(
+        x=df["Judet"],
+        y=df["Rang (ponderi de referință)"],
+        mode="markers",
+        name="Rang cu ponderile curente",
+        marker=dict(symbol="x", size=8, color="#E74C3C"),
+    ))
+    fig.update_layout(
+        title="Stabilitatea rangului la variația ponderilor (banda P5-P95)",
+        xaxis=dict(tickangle=-45),
+        yaxis=dict(title="Rang", autorange="reversed"),
+        height=600,
+        margin=dict(l=60, r=60, t=80, b=140),
+        legend=dict(orientation="h", y=1.02, x=1, xanchor="right", yanchor="bottom"),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
+
+
+def build_animated_map_figure(judete, ani, potential, geojson, latime_px=1400):
+    """Harta potențialului pe ani: geometria este trimisă o singură dată (în trace-ul de bază),
+    iar fiecare cadru conține doar culorile (z) și rangul anului respectiv.
+    """
+    judete = list(judete)
+    # Rang 1 = cel mai mare potențial, pe fiecare an
+    ranguri = (-potential).argsort(axis=0).argsort(axis=0) + 1
+    zmin, zmax = float(potential.min()), float(potential.max())
+
+    def culori(k):
+        return dict(z=potential[:, k].round(2), customdata=ranguri[:, k])
+
+    hover_template = "<b>%{location}</b><br>📊 <b>Potențial:</b> %{z:.2f}<br>🏅 <b>Rang:</b> %{customdata}<extra></extra>"
+    fig = go.Figure(
+        data=[go.Choropleth(
+            geojson=geojson,
+            locations=judete,
+            featureidkey="properties.name",
+            colorscale="Viridis",
+            zmin=zmin,
+            zmax=zmax,
+            hovertemplate=hover_template,
+            colorbar=dict(title="Potențial Economic"),
+            **culori(0),
+        )],
+        frames=[go.Frame(name=str(an), data=[go.Choropleth(**culori(k))], traces=[0]) for k, an in enumerate(ani)],
+    )
+
+    pas = dict(frame=dict(duration=900, redraw=True), transition=dict(duration=300), mode="immediate")
+    fig.update_layout(
+        title="Evoluția Potențialului Economic pe Ani",
+        width=latime_px,
+        height=700,
+        margin={"r": 0, "t": 50, "l": 0, "b": 0},
+        paper_bgcolor='rgba(0,0,0,0)',
+        geo=dict(fitbounds="locations", visible=False, bgcolor='rgba(0,0,0,0)', projection_type='mercator'),
+        updatemenus=[dict(
+            type="buttons",
+            direction="left",
+            x=0.05,
+            y=0.02,
+            buttons=[
+                dict(label="▶ Play", method="animate", args=[None, dict(pas, fromcurrent=True)]),
+                dict(label="⏸ Pauză", method="animate", args=[[None], dict(pas, frame=dict(duration=0, redraw=False))]),
+            ],
+        )],
+        sliders=[dict(
+            active=0,
+            x=0.15,
+            y=0.02,
+            len=0.8,
+            currentvalue=dict(prefix="An: "),
+            steps=[dict(label=str(an), method="animate", args=[[str(an)], pas]) for an in ani],
+        )],
+    )
+    return fig
@@ -0,0 +1,317 @@
+import hashlib
+import json
+import math
+import os
+
+import numpy as np
+
+# Toleranțele de simplificare (grade) pentru nivelurile de detaliu pre-calculate
+NIVELURI = (0.001, 0.0025, 0.005, 0.01, 0.02)
+
+CACHE_DIR = "baze/.cache/geometrie"
+FORMAT_CACHE = 1
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for bloc in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloc)
+    return h.hexdigest()[:16]
+
+
+def _decimale(toleranta):
+    # Cuantizare la cel puțin 1/5 din toleranță, ca rotunjirea să nu se vadă peste simplificare
+    return max(1, math.ceil(-math.log10(toleranta / 5)))
+
+
+def _douglas_peucker(puncte, toleranta):
+    """Simplifică o polilinie (n x 2), păstrând capetele. Întoarce masca punctelor păstrate."""
+    n = len(puncte)
+    pastrat = np.zeros(n, dtype=bool)
+    pastrat[0] = pastrat[-1] = True
+    stiva = [(0, n - 1)]
+    while stiva:
+        a, b = stiva.pop()
+        if b - a < 2:
+            continue
+        segment = puncte[b] - puncte[a]
+        relativ = puncte[a + 1:b] - puncte[a]
+        lungime = math.hypot(*segment)
+        if lungime == 0:
+            dist = np.hypot(relativ[:, 0], relativ[:, 1])
+        else:
+            dist = np.abs(segment[0] * relativ[:, 1] - segment[1] * relativ[:, 0]) / lungime
+        i = int(np.argmax(dist))
+        if dist[i] > toleranta:
+            i += a + 1
+            pastrat[i] = True
+            stiva.append((a, i))
+            stiva.append((i, b))
+    return pastrat
+
+
+def _inele(geometrie):
+    if geometrie["type"] == "Polygon":
+        return [geometrie["coordinates"]]
+    return geometrie["coordinates"]
+
+
+def build_topology(geojson):
+    """Descompune inelele poligoanelor în arce partajate (stil TopoJSON).
+
+    Granițele comune dintre două județe devin un singur arc, referit de ambele inele
+    (indice ~i pentru parcurgerea inversă), astfel încât simplificarea să nu lase goluri.
+    """
+    inele = []
+    for feature in geojson["features"]:
+        for poligon in _inele(feature["geometry"]):
+            for inel in poligon:
+                puncte = [tuple(p) for p in inel]
+                if len(puncte) > 1 and puncte[0] == puncte[-1]:
+                    puncte = puncte[:-1]
+                inele.append(puncte)
+
+    # Inelele în care apare fiecare vertex
+    apartenenta = {}
+    for i, inel in enumerate(inele):
+        for p in inel:
+            apartenenta.setdefault(p, set()).add(i)
+
+    # Joncțiune = vertex în care se schimbă mulțimea inelelor vecine
+    jonctiuni = set()
+    for inel in inele:
+        n = len(inel)
+        for k, p in enumerate(inel):
+            if apartenenta[p] != apartenenta[inel[k - 1]] or apartenenta[p] != apartenenta[inel[(k + 1) % n]]:
+                jonctiuni.add(p)
+
+    arce, index_arce, referinte_inele = [], {}, []
+
+    def _adauga_arc(arc):
+        cheie = tuple(arc)
+        if cheie in index_arce:
+            return index_arce[cheie]
+        invers = tuple(reversed(arc))
+        if invers in index_arce:
+            return ~index_arce[invers]
+        index_arce[cheie] = len(arce)
+        arce.append(arc)
+        return len(arce) - 1
+
+    for inel in inele:
+        pozitii = [k for k, p in enumerate(inel) if p in jonctiuni]
+        if not pozitii:
+            # Inel fără joncțiuni (insulă, enclavă): pornim din vertexul minim, în sens canonic
+            start = inel.index(min(inel))
+            rotit = inel[start:] + inel[:start]
+            if rotit[1] > rotit[-1]:
+                rotit = [rotit[0]] + rotit[:0:-1]
+            referinte_inele.append([_adauga_arc(rotit + [rotit[0]])])
+            continue
+        rotit = inel[pozitii[0]:] + inel[:pozitii[0]] + [inel[pozitii[0]]]
+        taieturi = [k - pozitii[0] for k in pozitii] + [len(inel)]
+        referinte_inele.append([
+            _adauga_arc(rotit[a:b + 1]) for a, b in zip(taieturi, taieturi[1:])
+        ])
+
+    obiecte, k = [], 0
+    for feature in geojson["features"]:
+        poligoane = []
+        for poligon in _inele(feature["geometry"]):
+            poligoane.append(referinte_inele[k:k + len(poligon)])
+            k += len(poligon)
+        obiecte.append({
+            "type": feature["geometry"]["type"],
+            "id": feature.get("id"),
+            "properties": feature.get("properties", {}),
+            "polygons": poligoane,
+        })
+    return arce, obiecte
+
+
+def _encode_arc(arc, decimale):
+    # Coordonate întregi pe grila de cuantizare, codate delta
+    q = np.round(np.asarray(arc) * 10 ** decimale).astype(np.int64)
+    return np.concatenate([q[:1], np.diff(q, axis=0)]).tolist()
+
+
+def _decode_arc(delta, decimale):
+    return np.cumsum(np.asarray(delta, dtype=np.int64), axis=0) / 10 ** decimale
+
+
+def build_levels(geojson, niveluri=NIVELURI):
+    arce, obiecte = build_topology(geojson)
+    arce_np = [np.asarray(arc, dtype=float) for arc in arce]
+    puncte = np.concatenate(arce_np)
+    nivele = {}
+    for toleranta in niveluri:
+        decimale = _decimale(toleranta)
+        simplificate = [
+            _encode_arc(arc[_douglas_peucker(arc, toleranta)], decimale)
+            for arc in arce_np
+        ]
+        nivele[str(toleranta)] = {"decimals": decimale, "arcs": simplificate}
+    return {
+        "format": FORMAT_CACHE,
+        "bbox": [*puncte.min(axis=0).tolist(), *puncte.max(axis=0).tolist()],
+        "objects": obiecte,
+        "levels": nivele,
+    }
+
+
+def _ring_coordinates(referinte, arce, decimale):
+    inel = []
+    for ref in referinte:
+        coord = _decode_arc(arce[~ref if ref < 0 else ref], decimale)
+        if ref < 0:
+            coord = coord[::-1]
+        inel.extend(coord[1:] if inel else coord)
+    coord = np.round(np.asarray(inel), decimale)
+    # Eliminăm vertecșii duplicați rezultați din cuantizare
+    pastrat = np.ones(len(coord), dtype=bool)
+    pastrat[1:] = (np.diff(coord, axis=0) != 0).any(axis=1)
+    return coord[pastrat].tolist()
+
+
+def to_geojson(topologie, toleranta):
+    nivel = topologie["levels"][str(toleranta)]
+    features = []
+    for obiect in topologie["objects"]:
+        poligoane = [
+            [_ring_coordinates(inel, nivel["arcs"], nivel["decimals"]) for inel in poligon]
+            for poligon in obiect["polygons"]
+        ]
+        geometrie = poligoane[0] if obiect["type"] == "Polygon" else poligoane
+        feature = {
+            "type": "Feature",
+            "properties": obiect["properties"],
+            "geometry": {"type": obiect["type"], "coordinates": geometrie},
+        }
+        if obiect["id"] is not None:
+            feature["id"] = obiect["id"]
+        features.append(feature)
+    return {"type": "FeatureCollection", "features": features}
+
+
+def load_topology(path="baze/ro.json", cache_dir=CACHE_DIR):
+    """Întoarce topologia cu toate nivelurile, construită o singură dată per hash al fișierului sursă."""
+    cale_cache = os.path.join(cache_dir, f"{os.path.basename(path)}.{file_hash(path)}.topo.json")
+    try:
+        with open(cale_cache, "r", encoding="utf-8") as f:
+            topologie = json.load(f)
+        if topologie.get("format") == FORMAT_CACHE:
+            return topologie
+    except (FileNotFoundError, ValueError):
+        pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        topologie = build_levels(json.load(f))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temporar = f"{cale_cache}.{os.getpid()}.tmp"
+        with open(temporar, "w", encoding="utf-8") as f:
+            json.dump(topologie, f, separators=(",", ":"))
+        os.replace(temporar, cale_cache)
+    except OSError:
+        # Cache-ul pe disc e opțional (ex. sistem de fișiere read-only)
+        pass
+    return topologie
+
+
+def pick_level(topologie, latime_px):
+    """Cea mai grosieră toleranță care rămâne sub un pixel la lățimea dată a hărții."""
+    x0, _, x1, _ = topologie["bbox"]
+    grade_per_pixel = (x1 - x0) / max(latime_px, 1)
+    niveluri = sorted(float(t) for t in topologie["levels"])
+    potrivite = [t for t in niveluri if t <= grade_per_pixel]
+    return potrivite[-1] if potrivite else niveluri[0]
+
+
+def load_simplified_geojson(path="baze/ro.json", latime_px=1400, cache_dir=CACHE_DIR):
+    topologie = load_topology(path, cache_dir)
+    return to_geojson(topologie, pick_level(topologie, latime_px))
+
+
+def points_in_ring(x, y, inel):
+    """Test vectorizat (ray casting) pentru mai multe puncte față de un singur inel."""
+    inel = np.asarray(inel, dtype=float)
+    xa, ya = inel[:, 0], inel[:, 1]
+    xb, yb = np.roll(xa, -1), np.roll(ya, -1)
+    x = np.asarray(x, dtype=float)[:, None]
+    y = np.asarray(y, dtype=float)[:, None]
+    traverseaza = (ya > y) != (yb > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_intersectie = xa + (y - ya) * (xb - xa) / (yb - ya)
+    return (traverseaza & (x < x_intersectie)).sum(axis=1) % 2 == 1
+
+
+def points_in_geometry(x, y, geometrie):
+    """Punctele din interiorul unui Polygon/MultiPolygon (golurile, ex. Ilfov - București, sunt excluse)."""
+    rezultat = np.zeros(len(x), dtype=bool)
+    for poligon in _inele(geometrie):
+        interior = points_in_ring(x, y, poligon[0])
+        for gol in poligon[1:]:
+            interior &= ~points_in_ring(x, y, gol)
+        rezultat |= interior
+    return rezultat
+
+
+class GridIndex:
+    """Index spațial pe o grilă regulată: fiecare celulă reține feature-urile al căror bbox o atinge.
+
+    Interogările testează exact (point-in-polygon) doar candidații din celulele atinse.
+    """
+
+    def __init__(self, geojson, celule=64):
+        self.features = geojson["features"]
+        bbox = []
+        for feature in self.features:
+            puncte = np.concatenate([np.asarray(inel) for poligon in _inele(feature["geometry"]) for inel in poligon])
+            bbox.append([*puncte.min(axis=0), *puncte.max(axis=0)])
+        self.bbox = np.asarray(bbox, dtype=float)
+        self.x0, self.y0 = self.bbox[:, 0].min(), self.bbox[:, 1].min()
+        self.n = celule
+        self.dx = (self.bbox[:, 2].max() - self.x0) / celule
+        self.dy = (self.bbox[:, 3].max() - self.y0) / celule
+        self.celule = {}
+        for i, (xmin, ymin, xmax, ymax) in enumerate(self.bbox):
+            (c0, r0), (c1, r1) = self._celula(xmin, ymin), self._celula(xmax, ymax)
+            for c in range(c0, c1 + 1):
+                for r in range(r0, r1 + 1):
+                    self.celule.setdefault((c, r), []).append(i)
+
+    def _celula(self, x, y):
+        c = min(max(int((x - self.x0) / self.dx), 0), self.n - 1)
+        r = min(max(int((y - self.y0) / self.dy), 0), self.n - 1)
+        return c, r
+
+    def intersecting(self, xmin, ymin, xmax, ymax):
+        """Indicii feature-urilor al căror bbox intersectează dreptunghiul dat."""
+        (c0, r0), (c1, r1) = self._celula(xmin, ymin), self._celula(xmax, ymax)
+        candidati = {i for c in range(c0, c1 + 1) for r in range(r0, r1 + 1) for i in self.celule.get((c, r), ())}
+        return sorted(
+            i for i in candidati
+            if self.bbox[i, 0] <= xmax and self.bbox[i, 2] >= xmin and self.bbox[i, 1] <= ymax and self.bbox[i, 3] >= ymin
+        )
+
+    def locate(self, x, y):
+        """Indicele feature-ului care conține fiecare punct (-1 în afara tuturor), pentru loturi de puncte."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        rezultat = np.full(len(x), -1)
+        coloane = np.clip(((x - self.x0) / self.dx).astype(int), 0, self.n - 1)
+        randuri = np.clip(((y - self.y0) / self.dy).astype(int), 0, self.n - 1)
+        # Punctele grupate pe celule: fiecare celulă ocupată este vizitată o singură dată
+        ocupate, grup = np.unique(coloane * self.n + randuri, return_inverse=True)
+        ordine = np.argsort(grup, kind="stable")
+        limite = np.searchsorted(grup[ordine], np.arange(len(ocupate) + 1))
+        for k, celula in enumerate(ocupate):
+            in_celula = ordine[limite[k]:limite[k + 1]]
+            for i in self.celule.get(divmod(int(celula), self.n), ()):
+                if not len(in_celula):
+                    break
+                interior = points_in_geometry(x[in_celula], y[in_celula], self.features[i]["geometry"])
+                rezultat[in_celula[interior]] = i
+                in_celula = in_celula[~interior]
+        return rezultat
@@ -0,0 +1,336 @@
+"""Geometria județelor împachetată în tablouri plate și localizarea în lot a punctelor (lon/lat -> județ).
+
+`PackedGeometry` ține toate inelele din ro.json într-un singur tablou de coordonate (float64, n x 2), cu
+offset-urile inelelor, feature-ul fiecărui inel și bbox-ul fiecărui feature; se salvează ca .npz în
+cache-ul geometriei, per hash al fișierului sursă.
+
+`PointLocator` este un index pe grilă: o celulă fără nicio muchie este în întregime într-un singur județ
+(sau în afara țării), deci punctele din ea primesc eticheta celulei direct. Pentru celulele de graniță
+se rețin muchiile care le ating și, pentru fiecare județ al acestor muchii, dacă centrul celulei este în
+interiorul lui. Segmentul centru -> punct rămâne în celulă, deci traversează doar muchiile celulei:
+paritatea traversărilor per județ spune dacă punctul este de aceeași parte ca centrul. Totul este
+vectorizat pe perechi (punct, muchie), fără bucle Python pe puncte.
+
+`locate_points` împarte loturi mari (milioane de puncte) în blocuri rulate într-un ProcessPoolExecutor;
+`county_counts` agregă direct în tabelul pe județe (ex. „Numar Firme” din firmele geocodate).
+
+    python dashboard/geostore.py firme.csv --lon lon --lat lat --output baze/numar_firme2023.csv
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from geometry import CACHE_DIR, _inele, file_hash
+from judete import REGISTRY
+
+FORMAT_CACHE = 1
+
+# Celule pe latura mai lungă a grilei
+REZOLUTIE = 512
+MARIME_BLOC = 1 << 20
+# Sub acest număr de puncte pornirea proceselor costă mai mult decât localizarea
+MIN_PARALEL = 4_000_000
+# Perechi (punct, muchie) evaluate deodată în celulele de graniță (limitează memoria)
+MAX_PERECHI = 1 << 22
+
+
+class PackedGeometry:
+    """Inelele tuturor feature-urilor în tablouri plate: coordonate, offset-uri, feature per inel, bbox per feature."""
+
+    def __init__(self, nume, coordonate, offset_inele, feature_inel, bbox):
+        self.nume = np.asarray(nume, dtype=object)
+        self.coordonate = np.ascontiguousarray(coordonate, dtype=np.float64)
+        self.offset_inele = np.asarray(offset_inele, dtype=np.int64)
+        self.feature_inel = np.asarray(feature_inel, dtype=np.int32)
+        self.bbox = np.asarray(bbox, dtype=np.float64)
+
+    @classmethod
+    def from_geojson(cls, geojson, proprietate="name"):
+        nume, inele, feature_inel, bbox = [], [], [], []
+        for i, feature in enumerate(geojson["features"]):
+            nume.append(feature["properties"].get(proprietate))
+            puncte = [np.asarray(inel, dtype=np.float64) for poligon in _inele(feature["geometry"]) for inel in poligon]
+            for inel in puncte:
+                # Inelele sunt păstrate închise (ultimul punct = primul), ca muchia i să fie (i, i + 1)
+                inele.append(inel if (inel[0] == inel[-1]).all() else np.vstack([inel, inel[:1]]))
+                feature_inel.append(i)
+            toate = np.concatenate(puncte)
+            bbox.append([*toate.min(axis=0), *toate.max(axis=0)])
+        offset_inele = np.concatenate([[0], np.cumsum([len(inel) for inel in inele])])
+        return cls(nume, np.concatenate(inele), offset_inele, feature_inel, bbox)
+
+    def __len__(self):
+        return len(self.nume)
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.coordonate, self.offset_inele, self.feature_inel, self.bbox))
+
+    def ring(self, r):
+        return self.coordonate[self.offset_inele[r]:self.offset_inele[r + 1]]
+
+    def edges(self):
+        """Muchiile ca (indicele primului vârf, feature): vârful i și i + 1, fără ultimul vârf al fiecărui inel."""
+        ultim = np.zeros(len(self.coordonate), dtype=bool)
+        ultim[self.offset_inele[1:] - 1] = True
+        inceput = np.flatnonzero(~ultim)
+        inel = np.searchsorted(self.offset_inele, inceput, side="right") - 1
+        return inceput, self.feature_inel[inel]
+
+    def save(self, path):
+        temporar = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            temporar, format=FORMAT_CACHE, nume=self.nume.astype(str), coordonate=self.coordonate,
+            offset_inele=self.offset_inele, feature_inel=self.feature_inel, bbox=self.bbox,
+        )
+        os.replace(temporar, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as f:
+            if int(f["format"]) != FORMAT_CACHE:
+                raise ValueError(f"Format necunoscut pentru {path}")
+            return cls(f["nume"], f["coordonate"], f["offset_inele"], f["feature_inel"], f["bbox"])
+
+
+def load_packed(path="baze/ro.json", cache_dir=CACHE_DIR):
+    """Geometria împachetată, construită o singură dată per hash al fișierului sursă."""
+    cale_cache = os.path.join(cache_dir, f"{os.path.basename(path)}.{file_hash(path)}.packed.npz")
+    try:
+        return PackedGeometry.load(cale_cache)
+    except (FileNotFoundError, ValueError):
+        pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        geometrie = PackedGeometry.from_geojson(json.load(f))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        geometrie.save(cale_cache)
+    except OSError:
+        # Cache-ul pe disc e opțional (ex. sistem de fișiere read-only)
+        pass
+    return geometrie
+
+
+def _de_partea_pozitiva(ax, ay, bx, by, px, py):
+    # Un punct exact pe dreaptă este tratat ca fiind de partea negativă: paritatea rămâne consecventă
+    return (bx - ax) * (py - ay) - (by - ay) * (px - ax) > 0
+
+
+class PointLocator:
+    """Index pe grilă peste o geometrie împachetată; `locate` întoarce feature-ul fiecărui punct (-1 în afară)."""
+
+    def __init__(self, geometrie, rezolutie=REZOLUTIE):
+        self.geometrie = geometrie
+        x0, y0 = geometrie.bbox[:, :2].min(axis=0)
+        x1, y1 = geometrie.bbox[:, 2:].max(axis=0)
+        self.latura = max(x1 - x0, y1 - y0) / rezolutie
+        self.x0, self.y0 = x0, y0
+        self.nx = int(np.ceil((x1 - x0) / self.latura)) or 1
+        self.ny = int(np.ceil((y1 - y0) / self.latura)) or 1
+
+        inceput, feature = geometrie.edges()
+        self.ax, self.ay = geometrie.coordonate[inceput].T.copy()
+        self.bx, self.by = geometrie.coordonate[inceput + 1].T.copy()
+        self.feature_muchie = feature
+
+        # Celulele atinse de bbox-ul fiecărei muchii (o supramulțime a celulelor pe care le traversează)
+        c0, r0 = self._celula(np.minimum(self.ax, self.bx), np.minimum(self.ay, self.by))
+        c1, r1 = self._celula(np.maximum(self.ax, self.bx), np.maximum(self.ay, self.by))
+        latime = c1 - c0 + 1
+        numar = latime * (r1 - r0 + 1)
+        muchie = np.repeat(np.arange(len(numar)), numar)
+        k = np.arange(len(muchie)) - np.repeat(np.cumsum(numar) - numar, numar)
+        celula = (r0[muchie] + k // latime[muchie]) * self.nx + c0[muchie] + k % latime[muchie]
+        # Intrările sortate pe (celulă, județ): perechile aceluiași punct și județ ies contigue la interogare
+        ordine = np.lexsort((muchie, feature[muchie], celula))
+        self.intrari = muchie[ordine].astype(np.int32)
+        celula = celula[ordine]
+        self.offset = np.concatenate([[0], np.cumsum(np.bincount(celula, minlength=self.nx * self.ny))])
+
+        # Etichetele centrelor (celulele fără muchii) și, pe intrări, dacă centrul este în județul muchiei
+        activ, self.centru_interior = self._centre(celula)
+        self.eticheta = activ
+        # Județul centrului, dacă nu are muchii în celulă, conține toată celula
+        are_muchii = np.zeros(len(activ), dtype=bool)
+        potrivire = feature[self.intrari] == activ[celula]
+        are_muchii[celula[potrivire]] = True
+        self.rezerva = np.where(are_muchii, -1, activ)
+
+    def _celula(self, x, y):
+        c = np.clip(((x - self.x0) / self.latura).astype(np.int64), 0, self.nx - 1)
+        r = np.clip(((y - self.y0) / self.latura).astype(np.int64), 0, self.ny - 1)
+        return c, r
+
+    def _centre(self, celula_intrare):
+        """Scanare pe rânduri (ray casting spre dreapta) pentru centrele celulelor.
+
+        Întoarce, per celulă, primul județ care conține centrul (-1 în afară) și, per intrare, dacă centrul
+        celulei este în interiorul județului muchiei.
+        """
+        activ = np.full(self.nx * self.ny, -1, dtype=np.int64)
+        centru_interior = np.zeros(len(self.intrari), dtype=bool)
+        feature_intrare = self.feature_muchie[self.intrari]
+        xs = self.x0 + (np.arange(self.nx) + 0.5) * self.latura
+        for r in range(self.ny):
+            y = self.y0 + (r + 0.5) * self.latura
+            traverseaza = (self.ay > y) != (self.by > y)
+            ax, ay, bx, by = self.ax[traverseaza], self.ay[traverseaza], self.bx[traverseaza], self.by[traverseaza]
+            x_int = ax + (y - ay) * (bx - ax) / (by - ay)
+            f = self.feature_muchie[traverseaza]
+            ordine = np.argsort(x_int, kind="stable")
+            x_int, f = x_int[ordine], f[ordine]
+            # Județele active între traversări consecutive, de la dreapta (nicio traversare) spre stânga
+            interior = set()
+            etichete = [-1]
+            for j in f[::-1]:
+                interior ^= {int(j)}
+                etichete.append(min(interior) if interior else -1)
+            etichete = np.asarray(etichete[::-1])
+            interval = np.searchsorted(x_int, xs, side="right")
+            activ[r * self.nx:(r + 1) * self.nx] = etichete[interval]
+
+            # Pe intrările rândului: numărul de traversări ale județului la dreapta centrului
+            start, stop = self.offset[r * self.nx], self.offset[(r + 1) * self.nx]
+            if stop > start:
+                c = celula_intrare[start:stop] - r * self.nx
+                fi = feature_intrare[start:stop]
+                latime = (self.bbox_x1 - self.x0) + 1
+                cheie = np.sort(f * latime + (x_int - self.x0))
+                interogare = fi * latime + (xs[c] - self.x0)
+                dreapta = np.searchsorted(cheie, (fi + 1) * latime - 0.5, side="left") - np.searchsorted(cheie, interogare, side="right")
+                centru_interior[start:stop] = dreapta % 2 == 1
+        return activ, centru_interior
+
+    @property
+    def bbox_x1(self):
+        return self.x0 + self.nx * self.latura
+
+    @property
+    def nbytes(self):
+        tablouri = (self.ax, self.ay, self.bx, self.by, self.feature_muchie, self.intrari, self.offset,
+                    self.centru_interior, self.eticheta, self.rezerva)
+        return self.geometrie.nbytes + sum(a.nbytes for a in tablouri)
+
+    def locate(self, x, y):
+        """Feature-ul care conține fiecare punct (x = longitudine, y = latitudine); -1 în afara tuturor."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        c = np.floor((x - self.x0) / self.latura)
+        r = np.floor((y - self.y0) / self.latura)
+        in_grila = (c >= 0) & (c < self.nx) & (r >= 0) & (r < self.ny)
+        celula = np.where(in_grila, r * self.nx + c, 0).astype(np.int64)
+        numar = np.where(in_grila, self.offset[celula + 1] - self.offset[celula], 0)
+        rezultat = np.where(in_grila, self.eticheta[celula], -1)
+
+        granita = np.flatnonzero(numar)
+        if len(granita):
+            rezultat[granita] = self.rezerva[celula[granita]]
+            cumulat = np.cumsum(numar[granita])
+            # Blocuri de puncte de graniță cu cel mult MAX_PERECHI perechi (punct, muchie)
+            limite = np.searchsorted(cumulat, np.arange(MAX_PERECHI, cumulat[-1], MAX_PERECHI), side="right")
+            for bloc in np.split(granita, limite):
+                if len(bloc):
+                    self._granita(bloc, x, y, celula, numar, rezultat)
+        return rezultat
+
+    def _granita(self, puncte, x, y, celula, numar, rezultat):
+        n = numar[puncte]
+        punct = np.repeat(np.arange(len(puncte)), n)
+        intrare = np.repeat(self.offset[celula[puncte]] - (np.cumsum(n) - n), n) + np.arange(len(punct))
+        muchie = self.intrari[intrare]
+        cel = celula[puncte][punct]
+        cx = self.x0 + (cel % self.nx + 0.5) * self.latura
+        cy = self.y0 + (cel // self.nx + 0.5) * self.latura
+        px, py = x[puncte][punct], y[puncte][punct]
+        ax, ay, bx, by = self.ax[muchie], self.ay[muchie], self.bx[muchie], self.by[muchie]
+        # Segmentul centru -> punct traversează muchia dacă fiecare are capetele de o parte și de alta a celuilalt
+        traverseaza = (
+            (_de_partea_pozitiva(ax, ay, bx, by, cx, cy) != _de_partea_pozitiva(ax, ay, bx, by, px, py))
+            & (_de_partea_pozitiva(cx, cy, px, py, ax, ay) != _de_partea_pozitiva(cx, cy, px, py, bx, by))
+        )
+        # Grupuri contigue (punct, județ): paritatea traversărilor schimbă poziția față de centru
+        feature = self.feature_muchie[muchie]
+        inceput = np.flatnonzero(np.concatenate([[True], (punct[1:] != punct[:-1]) | (feature[1:] != feature[:-1])]))
+        paritate = np.add.reduceat(traverseaza.astype(np.int8), inceput) % 2 == 1
+        interior = self.centru_interior[intrare[inceput]] != paritate
+        # Primul județ (în ordinea intrărilor) care conține punctul
+        gasite, primul = np.unique(punct[inceput][interior], return_index=True)
+        rezultat[puncte[gasite]] = feature[inceput][interior][primul]
+
+
+_LOCATOR = None
+
+
+def _init_worker(locator):
+    global _LOCATOR
+    _LOCATOR = locator
+
+
+def _locate_bloc(x, y):
+    return _LOCATOR.locate(x, y)
+
+
+def locate_points(locator, x, y, procese=None, marime_bloc=MARIME_BLOC):
+    """`locator.locate` pentru loturi mari: blocuri de `marime_bloc` puncte, în paralel peste MIN_PARALEL."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    limite = np.arange(marime_bloc, len(x), marime_bloc)
+    blocuri = list(zip(np.split(x, limite), np.split(y, limite)))
+    procese = procese if procese is not None else os.cpu_count() or 1
+    if procese > 1 and len(x) >= MIN_PARALEL and len(blocuri) > 1:
+        # Indexul este trimis o singură dată fiecărui proces (initializer), nu cu fiecare bloc
+        with ProcessPoolExecutor(max_workers=min(procese, len(blocuri)), initializer=_init_worker,
+                                 initargs=(locator,)) as pool:
+            partiale = list(pool.map(_locate_bloc, *zip(*blocuri)))
+    else:
+        partiale = [locator.locate(*bloc) for bloc in blocuri]
+    return np.concatenate(partiale) if partiale else np.empty(0, dtype=np.int64)
+
+
+def county_counts(locator, x, y, coloana="Numar Firme", registry=REGISTRY, procese=None):
+    """Numărul de puncte per județ, în ordinea registrului (ca etapele ETL), și numărul de puncte în afara țării."""
+    feature = locate_points(locator, x, y, procese=procese)
+    ids_feature, _ = registry.ids(locator.geometrie.nume)
+    ids = np.where(feature >= 0, ids_feature[np.maximum(feature, 0)], -1)
+    numar = np.bincount(ids[ids >= 0], minlength=len(registry))
+    return pd.DataFrame({"Judet": registry.names, coloana: numar}), int((ids < 0).sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("puncte", help="CSV cu coordonatele punctelor (ex. firme geocodate)")
+    parser.add_argument("--lon", default="lon")
+    parser.add_argument("--lat", default="lat")
+    parser.add_argument("--geometry", default="baze/ro.json")
+    parser.add_argument("--output", default=None,
+                        help="CSV în formatul numar_firme2023.csv (Judet, Clasa Firma, Numar Firme); implicit: stdout")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    locator = PointLocator(load_packed(args.geometry))
+    total, in_afara = None, 0
+    # Fișierul este citit pe bucăți: memoria nu depinde de numărul de puncte
+    for bucata in pd.read_csv(args.puncte, usecols=[args.lon, args.lat], chunksize=MIN_PARALEL):
+        numar, afara = county_counts(locator, bucata[args.lon], bucata[args.lat], procese=args.processes)
+        total = numar if total is None else total.assign(**{"Numar Firme": total["Numar Firme"] + numar["Numar Firme"]})
+        in_afara += afara
+    if total is None:
+        raise SystemExit(f"{args.puncte} nu conține puncte.")
+    total.insert(1, "Clasa Firma", "Total")
+    if args.output:
+        # Etapele ETL care depind de numărul de firme (firme la 1000 locuitori, competiție, potențial)
+        # se recalculează la următorul `python dashboard/etl.py`
+        total.to_csv(args.output, index=False)
+    else:
+        print(total.to_csv(index=False))
+    if in_afara:
+        print(f"{in_afara} puncte în afara județelor.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Istoricul anual al indicatorilor și scorurilor pe județe: un depozit columnar în care anii doar se adaugă.
+
+Fiecare an este un segment separat (baze/.istoric/<an>/<coloană>.npy, aliniat pe registrul de județe),
+iar manifest.json listează anii în ordinea adăugării. Adăugarea unui an scrie doar segmentul lui:
+scalarea Min-Max se face în cadrul anului, iar evoluția medie (dimensiunea Stabilitate) se obține din
+sumele cumulate ale variațiilor anuale, păstrate în segmentul anului precedent.
+
+Seriile din baze/ acoperă doar salariul mediu și rata șomajului (2019-2023); ceilalți indicatori
+(populație, venit, firme, urbanizare) sunt păstrați la valorile scalate din tabel_grafice.csv.
+"""
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+
+from judete import REGISTRY
+from scoring import DIMENSIUNI, PONDERI_IMPLICITE, normalize_weights
+
+ISTORIC_DIR = "baze/.istoric"
+FORMAT_ISTORIC = 1
+
+# Indicatorii scalați din tabel_grafice.csv care nu au serii anuale
+INDICATORI_FICSI = ["Populatie", "Venit Gospodarie", "Populatia Activa", "Competitie_score", "Urbanizare_score"]
+
+# Sursele din bundle.SURSE din care este construit istoricul
+SURSE_ISTORIC = ("tabel_grafice", "salarii_serie", "somaj_serie")
+
+
+def source_hash(paths):
+    """Amprenta fișierelor sursă; istoricul construit din alte versiuni ale lor este reconstruit."""
+    h = hashlib.sha256(str(FORMAT_ISTORIC).encode())
+    for path in paths:
+        with open(path, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()[:16]
+
+
+def _min_max(valori):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (valori - np.nanmin(valori)) / (np.nanmax(valori) - np.nanmin(valori))
+
+
+def year_columns(salariu, somaj, fixe, anterior=None):
+    """Coloanele segmentului unui an, din valorile brute ale anului și segmentul anului precedent."""
+    salariu = np.asarray(salariu, dtype=float)
+    somaj = np.asarray(somaj, dtype=float)
+    coloane = {"Salariul Mediu": salariu, "Rata Somaj": somaj}
+    if anterior is None:
+        coloane["Variatii Salariu"] = np.zeros_like(salariu)
+        coloane["Variatii Somaj"] = np.zeros_like(somaj)
+        numar_variatii = 0
+    else:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            coloane["Variatii Salariu"] = anterior["Variatii Salariu"] + (salariu / anterior["Salariul Mediu"] - 1) * 100
+            coloane["Variatii Somaj"] = anterior["Variatii Somaj"] + (somaj / anterior["Rata Somaj"] - 1) * 100
+        numar_variatii = anterior["numar_variatii"] + 1
+
+    salariu_s, somaj_s = _min_max(salariu), _min_max(somaj)
+    coloane["Piata_locala_score"] = (fixe["Populatie"] + salariu_s + fixe["Venit Gospodarie"]) / 3
+    coloane["Forta_de_munca_score"] = (fixe["Populatia Activa"] + 1 - somaj_s) / 2
+    coloane["Competitie_score"] = np.asarray(fixe["Competitie_score"], dtype=float)
+    coloane["Urbanizare_score"] = np.asarray(fixe["Urbanizare_score"], dtype=float)
+    if numar_variatii:
+        # Evoluția medie (%) de la primul an până la anul curent
+        evo_salariu = _min_max(coloane["Variatii Salariu"] / numar_variatii)
+        evo_somaj = _min_max(coloane["Variatii Somaj"] / numar_variatii)
+        coloane["Stabilitate_economica_score"] = (evo_salariu + 1 - evo_somaj) / 2
+    else:
+        # Primul an nu are evoluție; ponderea dimensiunii este redistribuită (vezi HistoryStore.potential)
+        coloane["Stabilitate_economica_score"] = np.full_like(salariu, np.nan)
+    for k in coloane:
+        coloane[k] = np.asarray(coloane[k], dtype=float)
+    return coloane, numar_variatii
+
+
+class HistoryStore:
+    """Acces la segmentele anuale; coloanele sunt citite memory-mapped și stivuite pe ani (județe x ani)."""
+
+    def __init__(self, path=ISTORIC_DIR, registry=REGISTRY):
+        self.path = path
+        self.registry = registry
+        try:
+            with open(os.path.join(path, "manifest.json"), "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+            if self.manifest.get("format") != FORMAT_ISTORIC:
+                raise ValueError(f"Format de istoric necunoscut: {self.manifest.get('format')}")
+        except FileNotFoundError:
+            self.manifest = {"format": FORMAT_ISTORIC, "years": [], "variations": {}}
+
+    @property
+    def source(self):
+        """Amprenta surselor din care a fost construit istoricul (None pentru un istoric fără amprentă)."""
+        return self.manifest.get("source")
+
+    @property
+    def years(self):
+        return list(self.manifest["years"])
+
+    def __len__(self):
+        return len(self.manifest["years"])
+
+    def segment(self, an):
+        director = os.path.join(self.path, str(an))
+        coloane = {c: np.load(os.path.join(director, f"{c}.npy"), mmap_mode="r") for c in self.manifest["columns"]}
+        coloane["numar_variatii"] = self.manifest["variations"][str(an)]
+        return coloane
+
+    def column(self, coloana):
+        """Matricea județe x ani a unei coloane."""
+        return np.column_stack([np.load(os.path.join(self.path, str(an), f"{coloana}.npy"), mmap_mode="r") for an in self.years])
+
+    def append_year(self, an, salariu, somaj, fixe):
+        """Adaugă segmentul anului `an` (după ultimul an existent); valorile sunt aliniate pe registru."""
+        if self.years and an <= self.years[-1]:
+            raise ValueError(f"Anul {an} nu este după ultimul an din istoric ({self.years[-1]}).")
+        for nume, valori in (("salariu", salariu), ("somaj", somaj)):
+            if len(valori) != len(self.registry):
+                raise ValueError(f"Sunt necesare {len(self.registry)} valori ({nume}) pentru anul {an}.")
+        anterior = self.segment(self.years[-1]) if self.years else None
+        coloane, numar_variatii = year_columns(salariu, somaj, fixe, anterior)
+
+        # Segmentul este scris într-un director temporar și mutat atomic, apoi manifestul
+        destinatie = os.path.join(self.path, str(an))
+        temporar = f"{destinatie}.{os.getpid()}.tmp"
+        os.makedirs(temporar, exist_ok=True)
+        for nume, valori in coloane.items():
+            np.save(os.path.join(temporar, f"{nume}.npy"), valori)
+        if os.path.isdir(destinatie):
+            shutil.rmtree(destinatie)
+        os.replace(temporar, destinatie)
+
+        manifest = {
+            "format": FORMAT_ISTORIC,
+            "columns": list(coloane),
+            "years": self.years + [an],
+            "variations": {**self.manifest["variations"], str(an): numar_variatii},
+            "source": self.source,
+        }
+        cale = os.path.join(self.path, "manifest.json")
+        with open(f"{cale}.{os.getpid()}.tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(f"{cale}.{os.getpid()}.tmp", cale)
+        self.manifest = manifest
+
+    def dimensions(self):
+        """Scorurile pe dimensiuni ca tensor județe x ani x 5 (în ordinea DIMENSIUNI)."""
+        return np.stack([self.column(d) for d in DIMENSIUNI], axis=2)
+
+    def potential(self, ponderi=PONDERI_IMPLICITE):
+        """Potențialul (0-100) pe județe x ani; dimensiunile lipsă dintr-un an își redistribuie ponderea."""
+        w = normalize_weights(ponderi)
+        scoruri = self.dimensions()
+        disponibil = ~np.isnan(scoruri)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(disponibil, scoruri, 0.0) @ w / (disponibil @ w) * 100
+
+
+def build_history(trend_salarii, trend_somaj, fixe, path=ISTORIC_DIR, sursa=None):
+    """(Re)construiește istoricul din seriile anuale (TrendEngine), an cu an, prin append_year.
+
+    `sursa` (source_hash) este păstrată în manifest, ca istoricul să fie reconstruit când sursele se schimbă.
+    """
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+    store = HistoryStore(path)
+    store.manifest["source"] = sursa
+    if trend_salarii.ani != trend_somaj.ani:
+        raise ValueError("Seriile de salarii și șomaj trebuie să acopere aceiași ani.")
+    for k, an in enumerate(trend_salarii.ani):
+        store.append_year(an, trend_salarii.values[:, k], trend_somaj.values[:, k], fixe)
+    return store
+
+
+def fixed_indicators(grafice):
+    """Indicatorii fără serii anuale, din tabel_grafice aliniat pe registru."""
+    return {c: grafice[c].to_numpy(dtype=float) for c in INDICATORI_FICSI}
+
+
+if __name__ == "__main__":
+    # python dashboard/history.py               -> reconstruiește istoricul din seriile 2019-2023
+    # python dashboard/history.py AN SAL SOMAJ  -> adaugă anul AN din două CSV-uri (Judet, valoare)
+    import pandas as pd
+
+    from bundle import SURSE, clean_frame, load_bundle
+    from trends import TrendEngine
+
+    data_bundle = load_bundle()
+    fixe = fixed_indicators(data_bundle.aligned("tabel_grafice"))
+    if len(sys.argv) == 4:
+        an, fisier_salarii, fisier_somaj = int(sys.argv[1]), sys.argv[2], sys.argv[3]
+        valori = [REGISTRY.align(clean_frame(pd.read_csv(p)))[0].iloc[:, 1].to_numpy(dtype=float) for p in (fisier_salarii, fisier_somaj)]
+        store = HistoryStore()
+        store.append_year(an, valori[0], valori[1], fixe)
+    else:
+        store = build_history(
+            TrendEngine.from_long(data_bundle.table("salarii_serie"), "Perioade", "Salariul Mediu"),
+            TrendEngine.from_long(data_bundle.table("somaj_serie"), "An", "Rata Somaj"),
+            fixe,
+            sursa=source_hash([SURSE[nume] for nume in SURSE_ISTORIC]),
+        )
+    print(f"Istoric: {', '.join(map(str, store.years))} ({store.path})")
@@ -0,0 +1,120 @@
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+# Registrul canonic al județelor: id dens = poziția în listă (ordine alfabetică)
+# (nume canonic, cod ISO 3166-2 fără cratimă, așa cum apare în ro.json)
+JUDETE = (
+    ("Alba", "ROAB"),
+    ("Arad", "ROAR"),
+    ("Arges", "ROAG"),
+    ("Bacau", "ROBC"),
+    ("Bihor", "ROBH"),
+    ("Bistrita-Nasaud", "ROBN"),
+    ("Botosani", "ROBT"),
+    ("Braila", "ROBR"),
+    ("Brasov", "ROBV"),
+    ("Buzau", "ROBZ"),
+    ("Calarasi", "ROCL"),
+    ("Caras-Severin", "ROCS"),
+    ("Cluj", "ROCJ"),
+    ("Constanta", "ROCT"),
+    ("Covasna", "ROCV"),
+    ("Dambovita", "RODB"),
+    ("Dolj", "RODJ"),
+    ("Galati", "ROGL"),
+    ("Giurgiu", "ROGR"),
+    ("Gorj", "ROGJ"),
+    ("Harghita", "ROHR"),
+    ("Hunedoara", "ROHD"),
+    ("Ialomita", "ROIL"),
+    ("Iasi", "ROIS"),
+    ("Ilfov", "ROIF"),
+    ("Maramures", "ROMM"),
+    ("Mehedinti", "ROMH"),
+    ("Municipiul Bucuresti", "ROB"),
+    ("Mures", "ROMS"),
+    ("Neamt", "RONT"),
+    ("Olt", "ROOT"),
+    ("Prahova", "ROPH"),
+    ("Salaj", "ROSJ"),
+    ("Satu Mare", "ROSM"),
+    ("Sibiu", "ROSB"),
+    ("Suceava", "ROSV"),
+    ("Teleorman", "ROTR"),
+    ("Timis", "ROTM"),
+    ("Tulcea", "ROTL"),
+    ("Valcea", "ROVL"),
+    ("Vaslui", "ROVS"),
+    ("Vrancea", "ROVN"),
+)
+
+# Variante de scriere care nu se reduc la numele canonic prin normalizare
+ALIASURI = {
+    "Bucuresti": "Municipiul Bucuresti",
+    "Mun. Bucuresti": "Municipiul Bucuresti",
+}
+
+_PREFIXE = re.compile(r"^(judetul|jud\.?)\s+")
+
+
+def normalize_name(nume):
+    """Cheie de comparație: fără diacritice, spații, cratime sau prefixul "Județul"."""
+    text = unicodedata.normalize("NFKD", str(nume)).encode("ascii", "ignore").decode()
+    text = _PREFIXE.sub("", text.strip().lower())
+    return re.sub(r"[^a-z0-9]", "", text)
+
+
+class CountyRegistry:
+    """Mapează orice variantă de nume (diacritice, spații, coduri GeoJSON) la un id întreg dens."""
+
+    def __init__(self, judete=JUDETE, aliasuri=ALIASURI):
+        self.names = np.array([nume for nume, _ in judete], dtype=object)
+        self.codes = np.array([cod for _, cod in judete], dtype=object)
+        self._index = {}
+        for i, (nume, cod) in enumerate(judete):
+            self._index[normalize_name(nume)] = i
+            self._index[normalize_name(cod)] = i
+            self._index[normalize_name(f"{cod[:2]}-{cod[2:]}")] = i
+        for alias, nume in aliasuri.items():
+            self._index[normalize_name(alias)] = self._index[normalize_name(nume)]
+
+    def __len__(self):
+        return len(self.names)
+
+    def id_of(self, nume):
+        return self._index[normalize_name(nume)]
+
+    def ids(self, nume):
+        """Id-urile pentru o serie de nume (-1 pentru cele nerecunoscute) și lista celor nerecunoscute."""
+        valori = pd.Series(nume, dtype=object)
+        unice = valori.drop_duplicates()
+        chei = {n: self._index.get(normalize_name(n), -1) for n in unice}
+        ids = np.array(valori.map(chei), dtype=np.int64)
+        nepotrivite = sorted({str(n).strip() for n, i in chei.items() if i < 0})
+        return ids, nepotrivite
+
+    def canonical(self, nume):
+        ids, nepotrivite = self.ids(nume)
+        valori = np.asarray(pd.Series(nume, dtype=object), dtype=object)
+        return np.where(ids >= 0, self.names[np.maximum(ids, 0)], valori), nepotrivite
+
+    def align(self, df, coloana="Judet"):
+        """Reordonează un tabel cu un rând per județ pe poziția id-ului; județele lipsă devin NaN."""
+        ids, nepotrivite = self.ids(df[coloana])
+        valid = ids >= 0
+        if pd.Series(ids[valid]).duplicated().any():
+            raise ValueError(f"Tabelul conține mai multe rânduri pentru același județ ({coloana}).")
+        aliniat = (
+            df.loc[valid].drop(columns=[coloana])
+            .set_axis(ids[valid])
+            .reindex(np.arange(len(self)))
+            .reset_index(drop=True)
+        )
+        aliniat.insert(0, coloana, self.names)
+        return aliniat, nepotrivite
+
+
+REGISTRY = CountyRegistry()
@@ -0,0 +1,302 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from bundle import SURSE, load_bundle
+from cube import build_cube, macroregions
+from details import INDICATORI, build_county_details
+from etl import stage
+from figure_cache import FigureCache
+from geometry import file_hash, load_simplified_geojson
+from history import SURSE_ISTORIC, HistoryStore, build_history, fixed_indicators, source_hash
+from judete import REGISTRY
+from metrics import METRICS, instrumented_loader
+from scoring import DIMENSIUNI, ScoringEngine
+from sensitivity import CONCENTRATIE, ESANTIOANE, run_sensitivity
+from shared import SHARED
+from trends import TrendEngine, stability_inputs
+from uat import synthetic_uats
+
+# Lățimea hărții (px) pentru care se alege nivelul de detaliu al geometriei. Streamlit nu transmite serverului
+# lățimea ferestrei (harta se întinde pe lățimea containerului), deci nivelul este fix per instalare:
+# DASHBOARD_LATIME_HARTA îl ajustează (ex. 800 pentru afișaje înguste)
+LATIME_HARTA = int(os.environ.get("DASHBOARD_LATIME_HARTA", "1400"))
+
+# Numărul de UAT-uri sintetice (0 = nivelul UAT dezactivat); nu există încă date reale pe UAT
+UAT_SINTETIC = int(os.environ.get("DASHBOARD_UAT_SINTETIC", "0"))
+
+# Datele sunt servite din stratul partajat (shared.SHARED, vederi read-only comune tuturor sesiunilor);
+# DASHBOARD_SHARED_CACHE=0 revine la st.cache_data (o copie per apel), ex. pentru comparații în load_test.py
+CACHE_PARTAJAT = os.environ.get("DASHBOARD_SHARED_CACHE", "1") != "0"
+cache_date = SHARED if CACHE_PARTAJAT else st.cache_data
+METRICS.register_gauges("shared", SHARED.stats)
+
+
+@instrumented_loader(cache_date)
+def load_geojson(latime_px=LATIME_HARTA):
+    # Geometrie simplificată și cuantizată, aleasă după lățimea hărții (cache pe disc după hash-ul ro.json)
+    try:
+        geojson = load_simplified_geojson("baze/ro.json", latime_px)
+    except FileNotFoundError:
+        st.error("Fișierul ro.json nu a fost găsit. Verifică calea către fișier.")
+        return None
+    # Numele din GeoJSON sunt aduse la forma canonică din registru, ca potrivirea cu datele să nu depindă de scriere
+    nume, nepotrivite = REGISTRY.canonical([f["properties"]["name"] for f in geojson["features"]])
+    for feature, canonic in zip(geojson["features"], nume):
+        feature["properties"]["name"] = canonic
+    if nepotrivite:
+        st.warning(f"Județe nerecunoscute în ro.json (nu vor fi colorate pe hartă): {', '.join(nepotrivite)}")
+    return geojson
+
+
+@cache_date
+def geometry_version():
+    return file_hash("baze/ro.json")
+
+
+@st.cache_resource
+def get_figure_cache():
+    # Figurile finale (JSON) partajate între sesiuni; persistență pe disc opțională
+    cache = FigureCache(disk_dir=os.environ.get("DASHBOARD_FIGURE_CACHE_DIR"))
+    METRICS.register_gauges("figure_cache", cache.stats)
+    return cache
+
+
+def report_unmatched(data_bundle, table):
+    if table in data_bundle.unmatched:
+        st.warning(f"Județe nerecunoscute în {SURSE[table]}: {', '.join(data_bundle.unmatched[table])}")
+
+
+@instrumented_loader(cache_date)
+def load_main_data():
+    try:
+        return load_bundle().table("tabel_final")
+    except FileNotFoundError:
+        st.error("Fișierul tabel_final.csv nu a fost găsit.")
+        return None
+
+
+@instrumented_loader(cache_date)
+def load_tooltip_data():
+    try:
+        return load_bundle().table("tabel_tooltip")
+    except FileNotFoundError:
+        st.error("Fișierul tabel_tooltip.csv nu a fost găsit.")
+        return None
+
+
+@instrumented_loader(st.cache_resource)
+def load_scoring_engine():
+    try:
+        data_bundle = load_bundle()
+        report_unmatched(data_bundle, "tabel_grafice")
+        engine = ScoringEngine.from_frame(data_bundle.aligned("tabel_grafice"))
+    except FileNotFoundError:
+        st.error("Fișierul tabel_grafice.csv nu a fost găsit.")
+        return None
+    # Stabilitatea economică se recalculează direct din seriile 2019-2023 (nu din trenduri.csv)
+    trend_salarii, trend_somaj = load_trend_engines()
+    if trend_salarii is not None:
+        stabilitate = stability_inputs(trend_salarii, trend_somaj)["Stabilitate_economica_score"]
+        engine = engine.with_dimension("Stabilitate_economica_score", stabilitate.to_numpy())
+    return engine
+
+
+@instrumented_loader(st.cache_resource)
+def load_trend_engines():
+    try:
+        data_bundle = load_bundle()
+        return (
+            TrendEngine.from_long(data_bundle.table("salarii_serie"), "Perioade", "Salariul Mediu"),
+            TrendEngine.from_long(data_bundle.table("somaj_serie"), "An", "Rata Somaj"),
+        )
+    except FileNotFoundError:
+        st.warning("Seriile 2019-2023 nu au fost găsite; stabilitatea economică se ia din tabel_grafice.csv.")
+        return None, None
+
+
+@instrumented_loader(cache_date)
+def load_sensitivity(ponderi, esantioane=ESANTIOANE, concentratie=CONCENTRATIE, seed=0):
+    # Cache-uit după configurația eșantionării (ponderi de referință, număr de eșantioane, concentrație, seed)
+    engine = load_scoring_engine()
+    if engine is None:
+        return None
+    return run_sensitivity(engine, ponderi, esantioane, concentratie, seed)
+
+
+@instrumented_loader(st.cache_resource)
+def load_uat_data(n=UAT_SINTETIC):
+    # Set sintetic, generat pe baza geometriei și scorurilor județelor
+    if not n:
+        return None
+    geojson = load_geojson(LATIME_HARTA)
+    engine = load_scoring_engine()
+    if geojson is None or engine is None:
+        return None
+    return synthetic_uats(geojson, engine, n, latime_px=LATIME_HARTA)
+
+
+@instrumented_loader(cache_date)
+def load_all_datasets():
+    # Tabelele vin din bundle-ul binar, aliniate pe id-ul județului din registru (un rând per județ)
+    datasets = {}
+    tables = {
+        'populatie': ("populatie", None),
+        'pop_activa': ("pop_activa", None),
+        'firme': ("firme", {"Clasa Firma": "Total"}),
+        'firme_1000': ("trenduri", None),
+        'somaj': ("somaj", None),
+        'salarii': ("salarii", None)
+    }
+    
+    data_bundle = load_bundle()
+    for key, (table, where) in tables.items():
+        try:
+            df = data_bundle.aligned(table, where)
+            datasets[key] = df[["Judet", *df.select_dtypes("number").columns]]
+            report_unmatched(data_bundle, table)
+        except FileNotFoundError:
+            st.warning(f"Fișierul {SURSE[table]} nu a fost găsit.")
+            datasets[key] = None
+    
+    return datasets
+
+
+@instrumented_loader(cache_date)
+def load_series_data():
+    # Seriile 2019-2023 (salariu mediu, rata șomajului) în format lung, un rând per județ și an
+    try:
+        data_bundle = load_bundle()
+        salarii = data_bundle.table("salarii_serie").rename(columns={"Perioade": "An"})
+        somaj = data_bundle.table("somaj_serie")
+    except FileNotFoundError:
+        return None
+    with METRICS.section("merge:serii"):
+        return salarii.merge(somaj, on=["Judet", "An"], how="outer").sort_values(["Judet", "An"], ignore_index=True)
+
+
+@instrumented_loader(cache_date)
+def load_summary_table():
+    datasets = load_all_datasets()
+    if not all(df is not None for df in datasets.values()):
+        return None
+
+    # Creare tabel rezumativ: tabelele sunt aliniate pe același id de județ, deci îmbinarea e pe poziție
+    with METRICS.section("merge:rezumat"):
+        df_rezumat = pd.concat(
+            [datasets['populatie']] + [
+                datasets[key].drop(columns=["Judet"])
+                for key in ['pop_activa', 'firme', 'firme_1000', 'somaj', 'salarii']
+            ],
+            axis=1,
+        )
+
+    # Redenumire coloane
+    column_mapping = {
+        "Populatie": "Populație 2024",
+        "Pop_Activa_2023": "Populație Activă 2023",
+        "Nr_Firme_2023": "Număr Firme 2023",
+        "Firme_per_1000": "Firme la 1000 locuitori",
+        "Rata_Somaj_2023": "Rată Șomaj 2023 (%)",
+        "Salariu_Mediu_2023": "Salariu Mediu Net 2023 (RON)"
+    }
+    return df_rezumat.rename(columns=column_mapping)
+
+
+@instrumented_loader(st.cache_resource)
+def load_county_details():
+    # Panourile de detalii pentru toate județele, calculate o singură dată (click-ul pe hartă doar le indexează)
+    try:
+        data_bundle = load_bundle()
+        grafice = data_bundle.aligned("tabel_grafice")
+        tooltip = data_bundle.aligned("tabel_tooltip")
+    except FileNotFoundError:
+        return None
+    return build_county_details(grafice, tooltip, load_summary_table(), load_series_data())
+
+
+@instrumented_loader(st.cache_resource)
+def load_cube():
+    # Cubul de agregare (județ / regiune / macroregiune / țară), construit o singură dată per proces
+    engine = load_scoring_engine()
+    rezumat = load_summary_table()
+    try:
+        data_bundle = load_bundle()
+        indicatori = data_bundle.aligned("populatie")
+        venit = data_bundle.table("venit_gosp")
+    except FileNotFoundError:
+        return None
+    if rezumat is not None:
+        coloane = rezumat.drop(columns=["Judet", "Populație 2024"]).select_dtypes("number")
+        indicatori = pd.concat([indicatori, coloane], axis=1)
+    # Venitul gospodăriei este publicat pe regiune; fiecare județ primește valoarea regiunii sale
+    indicatori["Venit Gospodarie"] = indicatori["Regiune"].map(dict(zip(venit["Regiuni"], venit["Valoare"])))
+    return build_cube(indicatori, macroregions(venit), engine.matrice if engine is not None else None)
+
+
+@instrumented_loader(st.cache_resource)
+def load_history():
+    # Istoricul anual (baze/.istoric); construit din seriile 2019-2023 la prima pornire și ori de câte ori
+    # tabel_grafice.csv sau seriile s-au schimbat față de amprenta din manifest
+    try:
+        sursa = source_hash([SURSE[nume] for nume in SURSE_ISTORIC])
+    except FileNotFoundError:
+        return None
+    store = HistoryStore()
+    if len(store) and store.source == sursa:
+        return store
+    trend_salarii, trend_somaj = load_trend_engines()
+    if trend_salarii is None:
+        return None
+    try:
+        grafice = load_bundle().aligned("tabel_grafice")
+    except FileNotFoundError:
+        return None
+    return build_history(trend_salarii, trend_somaj, fixed_indicators(grafice), sursa=sursa)
+
+
+@instrumented_loader(st.cache_resource)
+def load_similarity_index(nivel="Județe"):
+    # Județe: indicatorii scalați din tabel_grafice.csv; UAT: scorurile pe dimensiuni (singurele date pe UAT)
+    # sklearn se importă doar aici: Home folosește același modul de loaders fără să aibă nevoie de el
+    from similarity import similarity_index
+
+    if nivel == "UAT":
+        uat = load_uat_data()
+        return similarity_index(uat.nume, uat.engine.matrice, list(DIMENSIUNI)) if uat is not None else None
+    try:
+        grafice = load_bundle().aligned("tabel_grafice")
+    except FileNotFoundError:
+        return None
+    grafice = grafice[grafice[list(INDICATORI)].notna().any(axis=1)]
+    return similarity_index(grafice["Judet"], grafice[list(INDICATORI)].to_numpy(dtype=float), list(INDICATORI))
+
+
+@instrumented_loader(st.cache_resource)
+def load_typologies():
+    # Jobul de fundal cu toate clusterizările județelor (indicatori scalați + scoruri pe dimensiuni); întoarce un Future
+    from typology import submit_typologies
+
+    try:
+        grafice = load_bundle().aligned("tabel_grafice")
+    except FileNotFoundError:
+        return None
+    coloane = [*INDICATORI, *DIMENSIUNI]
+    grafice = grafice[grafice[coloane].notna().any(axis=1)]
+    return submit_typologies(
+        grafice["Judet"], grafice[coloane].to_numpy(dtype=float), coloane, {**INDICATORI, **DIMENSIUNI}
+    )
+
+
+@instrumented_loader(st.cache_resource)
+def load_whatif_base():
+    # Indicatorii bruți ai județelor (etapa "indicatori" din ETL), în ordinea motorului de scoruri
+    try:
+        indicatori = stage("indicatori")
+    except FileNotFoundError:
+        return None
+    engine = load_scoring_engine()
+    if engine is not None:
+        indicatori = indicatori.set_index("Judet").loc[list(engine.judete)].reset_index()
+    return indicatori
@@ -0,0 +1,107 @@
+"""Harta choropleth ca componentă (st.components.v2) care păstrează geometria în browser.
+
+Figura este împărțită într-o parte statică (geometrie, layout, stilul trace-ului), identificată prin
+cheia ei din cache și trimisă o singură dată per sesiune, și o parte dinamică (culori, customdata,
+locații), singura trimisă când se schimbă ponderile sau nivelul. În browser, partea statică este
+păstrată într-un Map global (supraviețuiește închiderii tab-ului), iar Plotly.react aplică valorile noi.
+
+Componenta confirmă prin starea `static` ce figură statică are; până la confirmare (sau dacă o pierde)
+serverul o retrimite.
+"""
+import json
+import os
+
+import plotly
+import streamlit as st
+
+from metrics import METRICS
+
+# Cheile trace-ului care depind de scoruri; restul figurii este static
+DINAMICE = ("locations", "z", "customdata", "hovertext")
+
+# Harta delta încarcă plotly.js în browser dintr-un URL, deci este opțională: implicit harta folosește
+# st.plotly_chart (funcționează offline și sub CSP). DASHBOARD_HARTA_DELTA=1 o activează; DASHBOARD_PLOTLY_JS
+# indică o copie plotly.js găzduită local (implicit CDN-ul Plotly, versiunea pachetului instalat).
+HARTA_DELTA = os.environ.get("DASHBOARD_HARTA_DELTA", "0") == "1"
+PLOTLY_JS = os.environ.get(
+    "DASHBOARD_PLOTLY_JS", f"https://cdn.plot.ly/plotly-{plotly.offline.get_plotlyjs_version()}.min.js"
+)
+
+JS = """
+const STATICE = (window.__hartaDeltaStatice = window.__hartaDeltaStatice || new Map());
+
+function incarcaPlotly(url) {
+    if (window.Plotly) return Promise.resolve(window.Plotly);
+    if (!window.__hartaDeltaPlotly) {
+        window.__hartaDeltaPlotly = new Promise((rezolva, respinge) => {
+            const script = document.createElement("script");
+            script.src = url;
+            script.onload = () => rezolva(window.Plotly);
+            script.onerror = respinge;
+            document.head.appendChild(script);
+        });
+    }
+    return window.__hartaDeltaPlotly;
+}
+
+export default function (component) {
+    const { data, parentElement, setStateValue } = component;
+    if (data.static) STATICE.set(data.cheie, data.static);
+    const baza = STATICE.get(data.cheie);
+    if (!baza) {
+        // Figura statică s-a pierdut (ex. pagina reîncărcată): serverul o retrimite la rerun
+        setStateValue("static", null);
+        return;
+    }
+    if (data.confirmat !== data.cheie) setStateValue("static", data.cheie);
+
+    const div = parentElement.querySelector(".harta-delta");
+    incarcaPlotly(data.plotly_js).then((Plotly) => {
+        const trace = Object.assign({}, baza.data[0], data.valori);
+        Plotly.react(div, [trace], baza.layout, { responsive: true });
+        if (!div.dataset.click) {
+            div.dataset.click = "1";
+            div.on("plotly_click", (ev) => setStateValue("selectie", ev.points[0].pointIndex));
+        }
+    });
+}
+"""
+
+
+
+def _componenta():
+    # Înregistrarea ține de runtime-ul Streamlit (nu de modul), deci se face la fiecare randare
+    return st.components.v2.component(
+        "harta_delta", html='<div class="harta-delta"></div>', js=JS, isolate_styles=False,
+    )
+
+
+def static_spec(fig):
+    """Figura fără valorile dependente de scoruri (JSON), pentru cache-ul de figuri."""
+    spec = json.loads(fig.to_json(validate=False))
+    for cheie in DINAMICE:
+        spec["data"][0].pop(cheie, None)
+    return json.dumps({"data": spec["data"], "layout": spec["layout"]}, separators=(",", ":"))
+
+
+def delta_map(cheie_static, static_json, valori, key="harta"):
+    """Randează harta; `static_json` este trimis doar dacă browserul nu a confirmat deja `cheie_static`.
+
+    Întoarce indexul punctului selectat (click) sau None.
+    """
+    stare = st.session_state.get(key) or {}
+    confirmat = stare.get("static")
+    data = {
+        "cheie": cheie_static,
+        "confirmat": confirmat,
+        "plotly_js": PLOTLY_JS,
+        "valori": valori,
+        "static": json.loads(static_json) if confirmat != cheie_static else None,
+    }
+    with METRICS.section("componenta:harta"):
+        rezultat = _componenta()(
+            key=key, data=data, default={"static": None, "selectie": None},
+            on_static_change=lambda: None, on_selectie_change=lambda: None,
+        )
+    METRICS.add_payload("componenta:harta", len(json.dumps(data, separators=(",", ":"))))
+    return rezultat.selectie
@@ -0,0 +1,203 @@
+"""Metrici pentru rerun-urile dashboard-ului: timp pe secțiune, hit/miss pe loadere și payload.
+
+Valorile sunt agregate pe proces (toate sesiunile) și, separat, pentru rerun-ul curent al fiecărei
+sesiuni (Streamlit rulează scriptul fiecărei sesiuni pe propriul thread). La finalul unui rerun
+agregatele pot fi scrise în fișierul dat de DASHBOARD_METRICS_FILE: text Prometheus pentru `.prom`,
+altfel o linie JSON per rerun.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+FISIER_METRICI = os.environ.get("DASHBOARD_METRICS_FILE")
+
+
+class Rerun:
+    """Măsurătorile unui singur rerun."""
+
+    def __init__(self, pagina):
+        self.pagina = pagina
+        self.start = time.perf_counter()
+        self.durata = None
+        self.sectiuni = {}
+        self.loadere = {}
+        self.payload = {}
+
+    def snapshot(self):
+        return {
+            "page": self.pagina,
+            "duration_ms": round(self.durata * 1000, 3) if self.durata is not None else None,
+            "sections_ms": {k: round(v * 1000, 3) for k, v in self.sectiuni.items()},
+            "loaders": self.loadere,
+            "payload_bytes": self.payload,
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # prefix -> funcție care întoarce un dict de valori (ex. FigureCache.stats)
+        self._gauges = {}
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # nume -> [număr, sumă secunde, maxim secunde]
+            self.sectiuni = {}
+            # nume -> [apeluri, miss-uri]
+            self.loadere = {}
+            # element -> [număr, sumă bytes]
+            self.payload = {}
+            # pagină -> [număr, sumă secunde]
+            self.reruns = {}
+
+    def register_gauges(self, prefix, functie):
+        self._gauges[prefix] = functie
+
+    def gauges(self):
+        return {f"{prefix}_{k}": v for prefix, functie in self._gauges.items() for k, v in functie().items()}
+
+    @property
+    def current(self):
+        return getattr(self._local, "rerun", None)
+
+    def start_rerun(self, pagina):
+        self._local.rerun = Rerun(pagina)
+        return self._local.rerun
+
+    def end_rerun(self):
+        """Închide rerun-ul curent, actualizează agregatele și scrie fișierul de metrici (dacă e configurat)."""
+        rerun = self.current
+        if rerun is None:
+            return None
+        rerun.durata = time.perf_counter() - rerun.start
+        with self._lock:
+            valori = self.reruns.setdefault(rerun.pagina, [0, 0.0])
+            valori[0] += 1
+            valori[1] += rerun.durata
+        self._local.rerun = None
+        if FISIER_METRICI:
+            try:
+                self.write(FISIER_METRICI, rerun, self.gauges())
+            except OSError:
+                pass
+        return rerun
+
+    @contextmanager
+    def section(self, nume):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            durata = time.perf_counter() - start
+            with self._lock:
+                valori = self.sectiuni.setdefault(nume, [0, 0.0, 0.0])
+                valori[0] += 1
+                valori[1] += durata
+                valori[2] = max(valori[2], durata)
+            rerun = self.current
+            if rerun is not None:
+                rerun.sectiuni[nume] = rerun.sectiuni.get(nume, 0.0) + durata
+
+    def _loader(self, nume, index):
+        with self._lock:
+            self.loadere.setdefault(nume, [0, 0])[index] += 1
+        rerun = self.current
+        if rerun is not None:
+            valori = rerun.loadere.setdefault(nume, {"calls": 0, "misses": 0})
+            valori["calls" if index == 0 else "misses"] += 1
+
+    def add_payload(self, element, nr_bytes):
+        with self._lock:
+            valori = self.payload.setdefault(element, [0, 0])
+            valori[0] += 1
+            valori[1] += nr_bytes
+        rerun = self.current
+        if rerun is not None:
+            rerun.payload[element] = rerun.payload.get(element, 0) + nr_bytes
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "sections": {
+                    k: {"count": n, "total_ms": round(s * 1000, 3), "mean_ms": round(s / n * 1000, 3), "max_ms": round(m * 1000, 3)}
+                    for k, (n, s, m) in self.sectiuni.items()
+                },
+                "loaders": {
+                    k: {"calls": c, "misses": m, "hit_rate": round(1 - m / c, 4) if c else 0.0}
+                    for k, (c, m) in self.loadere.items()
+                },
+                "payload": {k: {"count": n, "total_bytes": b} for k, (n, b) in self.payload.items()},
+                "reruns": {k: {"count": n, "total_ms": round(s * 1000, 3)} for k, (n, s) in self.reruns.items()},
+            }
+
+    def prometheus(self, extra=None):
+        """Agregatele în formatul text Prometheus; `extra` adaugă gauge-uri (nume -> valoare)."""
+        with self._lock:
+            linii = [
+                "# HELP dashboard_section_seconds Timpul de execuție al secțiunilor din rerun.",
+                "# TYPE dashboard_section_seconds summary",
+            ]
+            for nume, (n, s, _) in sorted(self.sectiuni.items()):
+                linii.append(f'dashboard_section_seconds_sum{{section="{nume}"}} {s:.6f}')
+                linii.append(f'dashboard_section_seconds_count{{section="{nume}"}} {n}')
+            linii += ["# HELP dashboard_loader_calls_total Apeluri ale funcțiilor de încărcare.", "# TYPE dashboard_loader_calls_total counter"]
+            linii += [f'dashboard_loader_calls_total{{loader="{k}"}} {c}' for k, (c, _) in sorted(self.loadere.items())]
+            linii += ["# HELP dashboard_loader_misses_total Apeluri care nu au găsit rezultatul în cache.", "# TYPE dashboard_loader_misses_total counter"]
+            linii += [f'dashboard_loader_misses_total{{loader="{k}"}} {m}' for k, (_, m) in sorted(self.loadere.items())]
+            linii += ["# HELP dashboard_payload_bytes Bytes trimiși clientului, pe element.", "# TYPE dashboard_payload_bytes summary"]
+            for nume, (n, b) in sorted(self.payload.items()):
+                linii.append(f'dashboard_payload_bytes_sum{{element="{nume}"}} {b}')
+                linii.append(f'dashboard_payload_bytes_count{{element="{nume}"}} {n}')
+            linii += ["# HELP dashboard_rerun_seconds Durata rerun-urilor complete, pe pagină.", "# TYPE dashboard_rerun_seconds summary"]
+            for pagina, (n, s) in sorted(self.reruns.items()):
+                linii.append(f'dashboard_rerun_seconds_sum{{page="{pagina}"}} {s:.6f}')
+                linii.append(f'dashboard_rerun_seconds_count{{page="{pagina}"}} {n}')
+        for nume, valoare in sorted((extra or {}).items()):
+            linii += [f"# TYPE dashboard_{nume} gauge", f"dashboard_{nume} {valoare}"]
+        return "\n".join(linii) + "\n"
+
+    def write(self, cale, rerun=None, extra=None):
+        if cale.endswith(".prom"):
+            # Scriere atomică: exporterul (ex. node_exporter textfile) nu citește niciodată un fișier parțial
+            temporar = f"{cale}.{os.getpid()}.tmp"
+            with open(temporar, "w", encoding="utf-8") as f:
+                f.write(self.prometheus(extra))
+            os.replace(temporar, cale)
+        else:
+            linie = {"timestamp": round(time.time(), 3), **(rerun.snapshot() if rerun else {}), **(extra or {})}
+            with open(cale, "a", encoding="utf-8") as f:
+                f.write(json.dumps(linie, ensure_ascii=False) + "\n")
+
+
+METRICS = Metrics()
+
+
+def instrumented_loader(cache):
+    """Decorator pentru loadere: aplică `cache` (st.cache_data / st.cache_resource) și numără apelurile,
+    miss-urile (corpul funcției rulează doar la miss) și timpul fiecărui apel.
+    """
+    def decorator(functie):
+        nume = functie.__name__
+
+        @functools.wraps(functie)
+        def corp(*args, **kwargs):
+            METRICS._loader(nume, 1)
+            return functie(*args, **kwargs)
+
+        cached = cache(corp)
+
+        @functools.wraps(functie)
+        def apel(*args, **kwargs):
+            METRICS._loader(nume, 0)
+            with METRICS.section(f"load:{nume}"):
+                return cached(*args, **kwargs)
+
+        apel.clear = cached.clear
+        return apel
+
+    return decorator
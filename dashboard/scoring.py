@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+# Dimensiunile scorului, în ordinea ponderilor w1..w5 din Metodologie
+DIMENSIUNI = {
+    "Piata_locala_score": "Piață locală",
+    "Forta_de_munca_score": "Forță de muncă",
+    "Competitie_score": "Competiție & intensitate economică",
+    "Urbanizare_score": "Infrastructură & urban",
+    "Stabilitate_economica_score": "Stabilitate economică",
+}
+
+# Ponderile publicate: 25/20/25/15/15
+PONDERI_IMPLICITE = np.array([0.25, 0.20, 0.25, 0.15, 0.15])
+
+
+def normalize_weights(ponderi):
+    """Aduce un vector de ponderi (procente sau fracții) la suma 1."""
+    w = np.asarray(ponderi, dtype=float)
+    if w.shape != (len(DIMENSIUNI),):
+        raise ValueError(f"Sunt necesare {len(DIMENSIUNI)} ponderi, primite {w.shape}.")
+    if not np.isfinite(w).all():
+        raise ValueError("Ponderile trebuie să fie numere finite.")
+    if (w < 0).any() or w.sum() <= 0:
+        raise ValueError("Ponderile trebuie să fie pozitive, cu suma mai mare decât 0.")
+    return w / w.sum()
+
+
+def top_k(valori, k, descrescator=True):
+    """Indicii celor mai mari (sau mici) k valori, ordonați; O(n) cu argpartition în loc de o sortare completă."""
+    valori = np.asarray(valori, dtype=float)
+    k = min(k, len(valori))
+    if k == 0:
+        return np.empty(0, dtype=int)
+    cheie = -valori if descrescator else valori
+    candidati = np.argpartition(cheie, k - 1)[:k] if k < len(valori) else np.arange(len(valori))
+    return candidati[np.argsort(cheie[candidati], kind="stable")]
+
+
+def group_mean(valori, grupe, numar_grupe=None, ponderi=None):
+    """Media (opțional ponderată, ex. cu populația) a valorilor pe grupe, cu np.bincount."""
+    valori = np.asarray(valori, dtype=float)
+    ponderi = np.ones(len(valori)) if ponderi is None else np.asarray(ponderi, dtype=float)
+    sume = np.bincount(grupe, weights=valori * ponderi, minlength=numar_grupe or 0)
+    total = np.bincount(grupe, weights=ponderi, minlength=numar_grupe or 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sume / total
+
+
+class ScoringResult:
+    """Scorurile calculate pentru un vector de ponderi, ca array-uri aliniate pe județe."""
+
+    def __init__(self, engine, ponderi, potential, rank, media_tarii, media_regiunii):
+        self.engine = engine
+        self.ponderi = ponderi
+        self.potential = potential
+        self.rank = rank
+        self.media_tarii = media_tarii
+        self.media_regiunii = media_regiunii
+
+    @property
+    def vs_media_tarii(self):
+        return self.potential - self.media_tarii
+
+    @property
+    def vs_media_regiunii(self):
+        return self.potential - self.media_regiunii
+
+    def frame(self):
+        # Aceleași coloane ca tabel_tooltip.csv, plus rangul
+        return pd.DataFrame({
+            "Judet": self.engine.judete,
+            "Regiune": self.engine.regiuni,
+            "Potential": self.potential.round(2),
+            "Rank": self.rank,
+            "Media Tarii": round(self.media_tarii, 2),
+            "Media Regiunii": self.media_regiunii.round(2),
+            "Vs Media Tarii": self.vs_media_tarii.round(2),
+            "Vs Media Regiunii": self.vs_media_regiunii.round(2),
+        })
+
+
+class ScoringEngine:
+    """Motor de scoring: scorurile pe dimensiuni ținute într-o singură matrice (județe x 5).
+
+    Potențialul pentru orice vector de ponderi este un singur produs matrice-vector;
+    mediile regionale se obțin cu np.bincount pe codurile de regiune.
+    """
+
+    def __init__(self, judete, regiuni, matrice):
+        self.judete = np.asarray(judete, dtype=object)
+        self.regiuni = np.asarray(regiuni, dtype=object)
+        self.matrice = np.ascontiguousarray(matrice, dtype=float)
+        self.matrice.flags.writeable = False
+        self.nume_regiuni, self.cod_regiune = np.unique(self.regiuni, return_inverse=True)
+        self.judete_per_regiune = np.bincount(self.cod_regiune)
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls(
+            df["Judet"].str.strip().to_numpy(),
+            df["Regiune"].str.strip().to_numpy(),
+            df[list(DIMENSIUNI)].to_numpy(dtype=float),
+        )
+
+    @classmethod
+    def from_csv(cls, path="dashboard/tabel_grafice.csv"):
+        return cls.from_frame(pd.read_csv(path))
+
+    def with_dimension(self, coloana, valori):
+        """Un motor nou în care scorul unei dimensiuni este înlocuit (ex. recalculat din trenduri)."""
+        matrice = self.matrice.copy()
+        matrice[:, list(DIMENSIUNI).index(coloana)] = valori
+        return ScoringEngine(self.judete, self.regiuni, matrice)
+
+    def __len__(self):
+        return len(self.judete)
+
+    def score(self, ponderi=PONDERI_IMPLICITE):
+        w = normalize_weights(ponderi)
+        # Scor pe scala 0-100, ca în tabel_final.csv
+        potential = self.matrice @ w * 100
+        media_tarii = potential.mean()
+        sume_regiuni = np.bincount(self.cod_regiune, weights=potential)
+        media_regiunii = (sume_regiuni / self.judete_per_regiune)[self.cod_regiune]
+        # Rang 1 = cel mai mare potențial
+        ordine = np.argsort(-potential, kind="stable")
+        rank = np.empty(len(potential), dtype=int)
+        rank[ordine] = np.arange(1, len(potential) + 1)
+        return ScoringResult(self, w, potential, rank, media_tarii, media_regiunii)
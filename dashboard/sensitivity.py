@@ -0,0 +1,91 @@
+"""Analiza de sensibilitate a clasamentului la ponderi (Monte Carlo).
+
+Vectorii de ponderi sunt eșantionați dintr-o distribuție Dirichlet centrată pe ponderile de referință
+(concentrație mare = ponderi apropiate de referință). Fiecare bloc de eșantioane este scorat printr-un
+singur produs matriceal (eșantioane x 5) @ (5 x județe); blocurile rulează în paralel într-un
+ProcessPoolExecutor și întorc doar numărătorile de ranguri (județe x ranguri), deci memoria nu
+depinde de numărul total de eșantioane.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from scoring import normalize_weights
+
+ESANTIOANE = 200_000
+CONCENTRATIE = 100.0
+MARIME_BLOC = 25_000
+# Sub acest număr de eșantioane pornirea proceselor costă mai mult decât calculul
+MIN_PARALEL = 100_000
+
+
+def rank_counts(matrice, alfa, n, seed):
+    """Numărul de apariții ale fiecărui județ pe fiecare rang (1 = cel mai mare potențial), pentru n eșantioane."""
+    rng = np.random.default_rng(seed)
+    numar = matrice.shape[0]
+    ponderi = rng.dirichlet(alfa, n)
+    potential = ponderi @ matrice.T
+    ordine = np.argsort(-potential, axis=1, kind="stable")
+    # ordine[s, r] = județul de pe rangul r în eșantionul s
+    return np.bincount(
+        (ordine * numar + np.arange(numar)).ravel(), minlength=numar * numar
+    ).reshape(numar, numar)
+
+
+class SensitivityResult:
+    def __init__(self, judete, numarari, ponderi, concentratie, rang_referinta):
+        self.judete = np.asarray(judete, dtype=object)
+        self.numarari = numarari
+        self.ponderi = ponderi
+        self.concentratie = concentratie
+        self.rang_referinta = rang_referinta
+        self.esantioane = int(numarari[0].sum())
+
+    @property
+    def distribution(self):
+        """Probabilitatea fiecărui rang, pe județ (județe x ranguri)."""
+        return self.numarari / self.esantioane
+
+    def percentile(self, q):
+        cumulat = np.cumsum(self.numarari, axis=1)
+        # Primul rang la care proporția cumulată atinge q
+        return (cumulat >= q * self.esantioane).argmax(axis=1) + 1
+
+    def frame(self, top=5):
+        ranguri = np.arange(1, self.numarari.shape[1] + 1)
+        p = self.distribution
+        return pd.DataFrame({
+            "Judet": self.judete,
+            "Rang (ponderi de referință)": self.rang_referinta,
+            "Rang median": self.percentile(0.5),
+            "Rang P5": self.percentile(0.05),
+            "Rang P95": self.percentile(0.95),
+            "Rang mediu": (p @ ranguri).round(2),
+            f"P(top {top}) %": (p[:, :top].sum(axis=1) * 100).round(2),
+            f"P(ultimele {top}) %": (p[:, -top:].sum(axis=1) * 100).round(2),
+        }).sort_values("Rang (ponderi de referință)", ignore_index=True)
+
+
+def run_sensitivity(engine, ponderi, esantioane=ESANTIOANE, concentratie=CONCENTRATIE, seed=0,
+                    marime_bloc=MARIME_BLOC, procese=None):
+    """Distribuția rangurilor pentru `esantioane` vectori de ponderi ~ Dirichlet(concentratie * ponderi)."""
+    w = normalize_weights(ponderi)
+    # O pondere 0 ar face distribuția Dirichlet degenerată; o păstrăm aproape de 0
+    alfa = np.maximum(w * concentratie, 1e-3)
+    blocuri = [marime_bloc] * (esantioane // marime_bloc)
+    if esantioane % marime_bloc:
+        blocuri.append(esantioane % marime_bloc)
+    # Semințe independente per bloc: rezultatul nu depinde de numărul de procese
+    seminte = np.random.SeedSequence(seed).spawn(len(blocuri))
+    argumente = [(engine.matrice, alfa, n, s) for n, s in zip(blocuri, seminte)]
+
+    procese = procese if procese is not None else os.cpu_count() or 1
+    if procese > 1 and esantioane >= MIN_PARALEL and len(blocuri) > 1:
+        with ProcessPoolExecutor(max_workers=min(procese, len(blocuri))) as pool:
+            partiale = list(pool.map(rank_counts, *zip(*argumente)))
+    else:
+        partiale = [rank_counts(*a) for a in argumente]
+
+    return SensitivityResult(engine.judete, sum(partiale), w, concentratie, engine.score(w).rank)
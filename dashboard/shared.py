@@ -0,0 +1,181 @@
+"""Strat de date partajat între sesiuni: rezultatele loaderelor sunt păstrate o singură dată per proces,
+imutabile, și fiecare sesiune primește o vedere fără copierea datelor.
+
+st.cache_data serializează rezultatul și întoarce o copie nouă (unpickle) la fiecare apel, din fiecare
+sesiune; cu mulți utilizatori simultan memoria și CPU-ul cresc cu numărul de sesiuni. Aici:
+
+- DataFrame-urile sunt partajate prin copy-on-write (implicit în pandas 3, de aceea requirements.txt cere pandas>=3): fiecare apel primește o
+  copie superficială (`copy(deep=False)`), deci o sesiune care adaugă sau modifică o coloană își
+  modifică doar vederea ei;
+- array-urile numpy devin read-only, dicționarele devin FrozenDict, listele devin tuple;
+- memoria totală este limitată (DASHBOARD_SHARED_MAX_MB); la depășire se elimină intrările folosite
+  cel mai de demult (LRU);
+- un miss este calculat o singură dată chiar dacă mai multe sesiuni îl cer simultan.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+MAX_BYTES = int(float(os.environ.get("DASHBOARD_SHARED_MAX_MB", "512")) * 1024 * 1024)
+
+
+class FrozenDict(dict):
+    """dict read-only; rămâne serializabil JSON (plotly, json) și se copiază ca dict obișnuit."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Datele partajate sunt read-only; lucrează pe o copie (dict(...)).")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __deepcopy__(self, memo):
+        import copy
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+
+def freeze(valoare):
+    """Varianta imutabilă a unui rezultat de loader (recursiv pentru dict/list/tuple și atributele obiectelor)."""
+    if isinstance(valoare, (pd.DataFrame, pd.Series)):
+        # Copy-on-write: vederile sesiunilor nu pot modifica datele originale
+        return valoare
+    if isinstance(valoare, np.ndarray):
+        valoare.flags.writeable = False
+        return valoare
+    if isinstance(valoare, dict):
+        return FrozenDict({k: freeze(v) for k, v in valoare.items()})
+    if isinstance(valoare, (list, tuple)):
+        return tuple(freeze(v) for v in valoare)
+    if hasattr(valoare, "__dict__") and not isinstance(valoare, type):
+        for atribut in vars(valoare).values():
+            if isinstance(atribut, np.ndarray):
+                atribut.flags.writeable = False
+        return valoare
+    return valoare
+
+
+def view(valoare):
+    """Vederea unei sesiuni: copii superficiale ale DataFrame-urilor (fără copierea datelor)."""
+    if isinstance(valoare, (pd.DataFrame, pd.Series)):
+        return valoare.copy(deep=False)
+    if isinstance(valoare, FrozenDict) and any(isinstance(v, (pd.DataFrame, pd.Series)) for v in valoare.values()):
+        return FrozenDict({k: view(v) for k, v in valoare.items()})
+    return valoare
+
+
+def size_of(valoare, _vazute=None):
+    """Estimarea memoriei ocupate (bytes), inclusiv conținutul DataFrame-urilor și array-urilor."""
+    vazute = _vazute if _vazute is not None else set()
+    if id(valoare) in vazute:
+        return 0
+    vazute.add(id(valoare))
+    if isinstance(valoare, pd.DataFrame):
+        return int(valoare.memory_usage(deep=True).sum())
+    if isinstance(valoare, pd.Series):
+        return int(valoare.memory_usage(deep=True))
+    if isinstance(valoare, np.ndarray):
+        return int(valoare.nbytes)
+    marime = sys.getsizeof(valoare)
+    if isinstance(valoare, dict):
+        marime += sum(size_of(k, vazute) + size_of(v, vazute) for k, v in valoare.items())
+    elif isinstance(valoare, (list, tuple)):
+        marime += sum(size_of(v, vazute) for v in valoare)
+    elif hasattr(valoare, "__dict__") and not isinstance(valoare, type):
+        marime += size_of(vars(valoare), vazute)
+    return marime
+
+
+class SharedCache:
+    """Cache LRU pe proces, limitat în bytes, folosit ca decorator de loader (în locul st.cache_data)."""
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._intrari = OrderedDict()
+        self._in_lucru = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, functie):
+        nume = f"{functie.__module__}.{functie.__qualname__}"
+
+        @functools.wraps(functie)
+        def apel(*args, **kwargs):
+            cheie = f"{nume}:{hashlib.sha256(pickle.dumps((args, sorted(kwargs.items())))).hexdigest()}"
+            return view(self.get_or_compute(cheie, lambda: functie(*args, **kwargs)))
+
+        apel.clear = lambda: self.clear(f"{nume}:")
+        return apel
+
+    def get_or_compute(self, cheie, calcul):
+        with self._lock:
+            if cheie in self._intrari:
+                self._intrari.move_to_end(cheie)
+                self.hits += 1
+                return self._intrari[cheie][0]
+            # Un singur calcul per cheie: celelalte sesiuni așteaptă rezultatul
+            eveniment = self._in_lucru.get(cheie)
+            proprietar = eveniment is None
+            if proprietar:
+                eveniment = self._in_lucru[cheie] = threading.Event()
+        if not proprietar:
+            eveniment.wait()
+            with self._lock:
+                if cheie in self._intrari:
+                    self.hits += 1
+                    return self._intrari[cheie][0]
+            # Calculul proprietarului a eșuat sau intrarea a fost deja eliminată
+            return self.get_or_compute(cheie, calcul)
+        try:
+            with self._lock:
+                self.misses += 1
+            valoare = freeze(calcul())
+            self._put(cheie, valoare, size_of(valoare))
+            return valoare
+        finally:
+            with self._lock:
+                del self._in_lucru[cheie]
+            eveniment.set()
+
+    def _put(self, cheie, valoare, marime):
+        with self._lock:
+            if marime > self.max_bytes:
+                # Prea mare pentru cache: rezultatul este întors, dar nu păstrat
+                return
+            self._intrari[cheie] = (valoare, marime)
+            self.bytes += marime
+            while self.bytes > self.max_bytes:
+                _, (_, eliminata) = self._intrari.popitem(last=False)
+                self.bytes -= eliminata
+                self.evictions += 1
+
+    def clear(self, prefix=""):
+        """Elimină intrările (doar cele ale unui loader, dacă `prefix` este dat)."""
+        with self._lock:
+            for cheie in [c for c in self._intrari if c.startswith(prefix)]:
+                self.bytes -= self._intrari.pop(cheie)[1]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._intrari),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+SHARED = SharedCache()
@@ -0,0 +1,106 @@
+"""Căutarea unităților asemănătoare („ce județe seamănă cu Clujul?”) cu un index de vecini pre-calculat.
+
+Caracteristicile sunt indicatorii deja scalați Min-Max din tabel_grafice.csv (la nivel UAT: scorurile pe
+dimensiuni). Pentru fiecare combinație (subset de caracteristici, metrică) indexul sklearn NearestNeighbors
+este construit o singură dată și interogat pentru toate unitățile deodată; o căutare ulterioară este doar
+o indexare în tabelul de vecini, fără parcurgerea datelor. Indexurile sunt memorate după hash-ul datelor,
+deci aceleași date (indiferent de sesiune sau loader) refolosesc același index.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import NearestNeighbors
+
+from analysis_options import K_MAX
+
+# Indexuri păstrate (hash date -> SimilarityIndex); ajung câte unul per nivel
+MAX_INDEXURI = 8
+
+
+class SimilarityIndex:
+    """Vecinii cei mai apropiați ai fiecărei unități, calculați o dată per (subset de trăsături, metrică)."""
+
+    def __init__(self, nume, matrice, coloane):
+        self.nume = np.asarray(nume, dtype=object)
+        self.coloane = list(coloane)
+        matrice = np.array(matrice, dtype=float)
+        # Valorile lipsă sunt înlocuite cu media coloanei (nu influențează distanța mai mult decât „tipic”)
+        medii = np.nanmean(matrice, axis=0)
+        lipsa = np.isnan(matrice)
+        matrice[lipsa] = np.take(medii, np.nonzero(lipsa)[1])
+        matrice.flags.writeable = False
+        self.matrice = matrice
+        self._pozitie = {n: i for i, n in enumerate(self.nume)}
+        self._vecini = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.nume)
+
+    def __contains__(self, nume):
+        return nume in self._pozitie
+
+    def neighbors(self, coloane=None, metrica="euclidean"):
+        """(distanțe, indici) pentru toate unitățile, primii K_MAX vecini (fără unitatea însăși)."""
+        coloane = tuple(coloane or self.coloane)
+        cheie = (coloane, metrica)
+        with self._lock:
+            if cheie in self._vecini:
+                return self._vecini[cheie]
+        x = self.matrice[:, [self.coloane.index(c) for c in coloane]]
+        k = min(K_MAX + 1, len(x))
+        # kd-tree / ball-tree pentru metricile Minkowski, brute pentru cosinus (sklearn alege după metrică)
+        index = NearestNeighbors(n_neighbors=k, metric=metrica).fit(x)
+        distante, indici = index.kneighbors(x)
+        # Unitatea însăși este de regulă primul vecin, dar nu neapărat (duplicate la distanță 0): o scoatem explicit
+        eu = indici == np.arange(len(x))[:, None]
+        fara_eu = ~eu
+        fara_eu[eu.sum(axis=1) == 0, -1] = False
+        distante = distante[fara_eu].reshape(len(x), k - 1)
+        indici = indici[fara_eu].reshape(len(x), k - 1)
+        distante.flags.writeable = indici.flags.writeable = False
+        with self._lock:
+            self._vecini[cheie] = (distante, indici)
+        return distante, indici
+
+    def similar(self, nume, k=5, coloane=None, metrica="euclidean"):
+        """Cele mai asemănătoare `k` unități cu `nume`, cu distanța și valorile trăsăturilor folosite."""
+        coloane = list(coloane or self.coloane)
+        distante, indici = self.neighbors(coloane, metrica)
+        i = self._pozitie[nume]
+        k = min(k, indici.shape[1])
+        vecini = indici[i, :k]
+        df = pd.DataFrame(self.matrice[vecini][:, [self.coloane.index(c) for c in coloane]], columns=coloane)
+        df.insert(0, "Distanta", distante[i, :k])
+        df.insert(0, "Unitate", self.nume[vecini])
+        return df
+
+
+_INDEXURI = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def data_hash(nume, matrice, coloane):
+    h = hashlib.sha256()
+    h.update("\x1f".join(map(str, nume)).encode())
+    h.update("\x1f".join(coloane).encode())
+    h.update(np.ascontiguousarray(matrice, dtype=float).tobytes())
+    return h.hexdigest()
+
+
+def similarity_index(nume, matrice, coloane):
+    """Indexul pentru aceste date; construit doar dacă hash-ul datelor nu a mai fost văzut."""
+    cheie = data_hash(nume, matrice, coloane)
+    with _LOCK:
+        if cheie in _INDEXURI:
+            _INDEXURI.move_to_end(cheie)
+            return _INDEXURI[cheie]
+    index = SimilarityIndex(nume, matrice, coloane)
+    with _LOCK:
+        index = _INDEXURI.setdefault(cheie, index)
+        while len(_INDEXURI) > MAX_INDEXURI:
+            _INDEXURI.popitem(last=False)
+    return index
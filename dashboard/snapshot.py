@@ -0,0 +1,260 @@
+"""Snapshot static al dashboard-ului pentru vizitatorii care doar citesc (ponderile publicate).
+
+Construiește un director HTML autonom: pagina principală cu statisticile rapide, harta, clasamentul și
+tabelul rezumativ. plotly.js, geometria, CSS-ul și scriptul comun sunt fișiere separate, cu hash-ul
+conținutului în nume (pot fi cache-uite oricât: `Cache-Control: immutable`) și comune tuturor paginilor;
+paginile HTML au nume fixe și se revalidează. Fiecare fișier text are și varianta .gz (și .br, dacă
+modulul brotli este instalat), pentru servere care livrează direct fișierele pre-comprimate
+(ex. nginx `gzip_static` / `brotli_static`). Rulare, din rădăcina proiectului:
+
+    python dashboard/snapshot.py --output dist [--app-url https://.../dashboard]
+
+Doar vizualizările interactive (ponderi, what-if, detalii) rămân pe Streamlit.
+"""
+import argparse
+import gzip
+import hashlib
+import html
+import json
+import os
+import shutil
+
+import plotly
+
+from figures import build_bar_figure, build_map_figure
+from loaders import LATIME_HARTA, load_geojson, load_scoring_engine, load_summary_table
+from scoring import PONDERI_IMPLICITE, top_k
+from style import CSS
+
+# Compresia Brotli e opțională: fără modul se scriu doar variantele .gz
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SNAPSHOT_DIR = "dist"
+# Extensiile pentru care se scriu variante comprimate
+COMPRIMATE = (".html", ".js", ".css", ".json", ".csv")
+
+CACHE_ACTIVE = "public, max-age=31536000, immutable"
+CACHE_PAGINI = "public, max-age=0, must-revalidate"
+
+CSS_STATIC = """
+body { font-family: "Source Sans Pro", -apple-system, "Segoe UI", Roboto, sans-serif; margin: 0 auto; max-width: 1460px; padding: 0 24px 40px; color: #31333F; }
+nav { display: flex; gap: 18px; padding: 14px 0; border-bottom: 1px solid #DEE2E6; margin-bottom: 10px; }
+nav a { color: #2E86C1; text-decoration: none; font-weight: 600; }
+nav a.activ { border-bottom: 2px solid #3498DB; }
+.metrici { display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px; }
+.metrica { padding: 8px 0; }
+.metrica .eticheta { font-size: 0.9em; color: #555; }
+.metrica .valoare { font-size: 2em; }
+.coloane { display: grid; grid-template-columns: 1fr 1fr; gap: 24px; }
+table.tabel { border-collapse: collapse; width: 100%; font-size: 0.9em; }
+table.tabel th, table.tabel td { border-bottom: 1px solid #E6E9EF; padding: 4px 8px; text-align: right; }
+table.tabel th:first-child, table.tabel td:first-child { text-align: left; }
+footer { text-align: center; color: #666; font-size: 14px; margin-top: 30px; border-top: 1px solid #DEE2E6; padding-top: 12px; }
+"""
+
+# Desenează figurile din elementele <script type="application/json" data-figura="...">; geometria hărții
+# este descărcată o singură dată (același fișier pentru toate paginile) și pusă în trace înainte de desenare
+JS = """
+(function () {
+    var geometrii = {};
+    function geometrie(url) {
+        if (!geometrii[url]) geometrii[url] = fetch(url).then(function (r) { return r.json(); });
+        return geometrii[url];
+    }
+    document.querySelectorAll("script[data-figura]").forEach(function (el) {
+        var figura = JSON.parse(el.textContent);
+        var div = document.getElementById(el.dataset.figura);
+        var gata = el.dataset.geometrie
+            ? geometrie(el.dataset.geometrie).then(function (g) { figura.data[0].geojson = g; })
+            : Promise.resolve();
+        gata.then(function () { Plotly.newPlot(div, figura.data, figura.layout, {responsive: true}); });
+    });
+})();
+"""
+
+PAGINI = {"index.html": "🏠 Home", "harta.html": "🗺️ Hartă", "clasament.html": "📊 Top Județe", "tabel.html": "📋 Tabel Rezumativ"}
+
+
+def hashed_name(nume, continut):
+    """`nume.ext` -> `nume.<hash>.ext` (primele 12 caractere din sha256 al conținutului)."""
+    baza, ext = os.path.splitext(nume)
+    return f"{baza}.{hashlib.sha256(continut).hexdigest()[:12]}{ext}"
+
+
+class SnapshotBuilder:
+    """Fișierele snapshot-ului (cale -> bytes), scrise atomic împreună cu variantele comprimate."""
+
+    def __init__(self):
+        self.fisiere = {}
+        self.active = {}
+
+    def asset(self, nume, continut):
+        """Adaugă un fișier comun (cu hash în nume) și întoarce calea lui relativă."""
+        if isinstance(continut, str):
+            continut = continut.encode("utf-8")
+        cale = f"assets/{hashed_name(nume, continut)}"
+        self.fisiere[cale] = continut
+        self.active[nume] = cale
+        return cale
+
+    def page(self, nume, titlu, corp, app_url=None):
+        navigare = "".join(
+            f'<a href="{fisier}"{" class=activ" if fisier == nume else ""}>{eticheta}</a>'
+            for fisier, eticheta in PAGINI.items()
+        )
+        if app_url:
+            navigare += f'<a href="{html.escape(app_url)}">⚖️ Ponderi proprii (interactiv)</a>'
+        self.fisiere[nume] = f"""<!DOCTYPE html>
+<html lang="ro">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(titlu)} - Analiza Economică - Județele României</title>
+<link rel="stylesheet" href="{self.active["style.css"]}">
+<script src="{self.active["plotly.min.js"]}" defer></script>
+<script src="{self.active["snapshot.js"]}" defer></script>
+</head>
+<body>
+<nav>{navigare}</nav>
+{corp}
+<footer>📊 Platformă de analiză a potențialului economic al județelor din România<br>
+Snapshot static cu ponderile publicate</footer>
+</body>
+</html>
+""".encode("utf-8")
+
+    def write(self, director):
+        """Scrie snapshot-ul într-un director temporar și îl mută peste `director`.
+
+        Un director existent este înlocuit doar dacă e gol sau conține un snapshot anterior (`manifest.json`).
+        """
+        director = director.rstrip("/")
+        if os.path.lexists(director) and not (
+            os.path.isdir(director)
+            and (not os.listdir(director) or os.path.isfile(os.path.join(director, "manifest.json")))
+        ):
+            raise RuntimeError(f"{director} există și nu conține un snapshot (manifest.json); nu este suprascris.")
+        temporar = f"{director}.{os.getpid()}.tmp"
+        shutil.rmtree(temporar, ignore_errors=True)
+        manifest = {}
+        for cale, continut in sorted(self.fisiere.items()):
+            destinatie = os.path.join(temporar, cale)
+            os.makedirs(os.path.dirname(destinatie), exist_ok=True)
+            with open(destinatie, "wb") as f:
+                f.write(continut)
+            variante = {}
+            if cale.endswith(COMPRIMATE):
+                # mtime=0: aceleași date produc aceiași bytes (build reproductibil)
+                variante["gzip"] = gzip.compress(continut, 9, mtime=0)
+                if brotli is not None:
+                    variante["br"] = brotli.compress(continut, quality=11)
+            for codare, comprimat in variante.items():
+                with open(f"{destinatie}.{'gz' if codare == 'gzip' else 'br'}", "wb") as f:
+                    f.write(comprimat)
+            manifest[cale] = {
+                "bytes": len(continut),
+                **{f"{codare}_bytes": len(comprimat) for codare, comprimat in variante.items()},
+                "cache_control": CACHE_ACTIVE if cale.startswith("assets/") else CACHE_PAGINI,
+            }
+        with open(os.path.join(temporar, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump({"assets": self.active, "files": manifest}, f, ensure_ascii=False, indent=1)
+        # Snapshot-ul vechi este mutat deoparte și șters doar după ce cel nou e la locul lui
+        vechi = f"{director}.{os.getpid()}.old"
+        if os.path.isdir(director):
+            os.replace(director, vechi)
+        try:
+            os.replace(temporar, director)
+        except OSError:
+            if os.path.isdir(vechi):
+                os.replace(vechi, director)
+            raise
+        shutil.rmtree(vechi, ignore_errors=True)
+        return manifest
+
+
+def _figura(element_id, fig, geometrie=None):
+    """Containerul figurii și JSON-ul ei (fără geometrie, dacă `geometrie` este calea fișierului comun)."""
+    spec = json.loads(fig.to_json(validate=False))
+    if geometrie:
+        spec["data"][0].pop("geojson", None)
+    date = json.dumps({"data": spec["data"], "layout": spec["layout"]}, separators=(",", ":"))
+    # "</" nu poate apărea într-un <script>
+    date = date.replace("</", "<\\/")
+    atribut = f' data-geometrie="{geometrie}"' if geometrie else ""
+    return f'<div id="{element_id}"></div>\n<script type="application/json" data-figura="{element_id}"{atribut}>{date}</script>'
+
+
+def _numar(v):
+    return f"{v:,.0f}" if float(v).is_integer() else f"{v:,.2f}"
+
+
+def _metrica(eticheta, valoare):
+    return f'<div class="metrica"><div class="eticheta">{eticheta}</div><div class="valoare">{valoare}</div></div>'
+
+
+def build_snapshot(output=SNAPSHOT_DIR, app_url=None, ponderi=PONDERI_IMPLICITE):
+    engine = load_scoring_engine()
+    geojson = load_geojson(LATIME_HARTA)
+    rezumat = load_summary_table()
+    if engine is None or geojson is None:
+        raise RuntimeError("Lipsesc datele pentru snapshot (tabel_grafice.csv / ro.json).")
+    scoruri = engine.score(ponderi).frame()
+    potential = scoruri["Potential"].to_numpy()
+    nume = scoruri["Judet"].to_numpy()
+
+    builder = SnapshotBuilder()
+    builder.asset("plotly.min.js", plotly.offline.get_plotlyjs())
+    builder.asset("style.css", CSS + CSS_STATIC)
+    builder.asset("snapshot.js", JS)
+    geometrie = builder.asset("geometrie.json", json.dumps(geojson, separators=(",", ":")))
+    csv_scoruri = builder.asset("scoruri.csv", scoruri.to_csv(index=False))
+
+    metrici = "".join([
+        _metrica("Total Județe", len(scoruri)),
+        _metrica("Potențial Maxim", f"{potential.max():.2f}"),
+        _metrica("Potențial Minim", f"{potential.min():.2f}"),
+        _metrica("Media Națională", f"{potential.mean():.2f}"),
+    ])
+    builder.page("index.html", "Home", f"""<h1 class="main-title">📊 Economic Scoreboard România</h1>
+<div class="info-box"><h3>🎯 Scopul Aplicației</h3>
+<p>O imagine de ansamblu asupra potențialului economic regional din România, cu scoruri calculate din date
+actuale și indicatori economici esențiali (ponderile publicate: piață locală, forță de muncă, competiție,
+infrastructură &amp; urban, stabilitate economică).</p></div>
+<div class="section-header">📊 Statistici Rapide</div>
+<div class="metrici">{metrici}</div>""", app_url)
+
+    harta = build_map_figure(scoruri, geojson, LATIME_HARTA)
+    builder.page("harta.html", "Hartă", f"""<div class="section-header">🗺️ Harta Potențialului Economic</div>
+{_figura("harta", harta, geometrie)}""", app_url)
+
+    bar = build_bar_figure(scoruri)
+    liste = []
+    for titlu, indici in (("🏆 Top 5 Județe", top_k(potential, 5)), ("📉 Ultimele 5 Județe", top_k(potential, 5, descrescator=False))):
+        randuri = "".join(f"<li><strong>{html.escape(str(nume[i]))}</strong>: {potential[i]:.2f}</li>" for i in indici)
+        liste.append(f"<div><h3>{titlu}</h3><ol>{randuri}</ol></div>")
+    builder.page("clasament.html", "Top Județe", f"""<div class="section-header">📊 Top Județe după Potențialul Economic</div>
+{_figura("clasament", bar)}
+<div class="coloane">{"".join(liste)}</div>""", app_url)
+
+    tabel_scoruri = scoruri.sort_values("Rank")[["Rank", "Judet", "Regiune", "Potential", "Vs Media Tarii", "Vs Media Regiunii"]]
+    corp = f"""<div class="section-header">📋 Tabel Rezumativ - Indicatori Economici</div>
+{rezumat.to_html(index=False, classes="tabel", border=0, float_format=_numar) if rezumat is not None else ""}
+<div class="section-header">🏆 Scoruri</div>
+{tabel_scoruri.to_html(index=False, classes="tabel", border=0, float_format=lambda v: f"{v:.2f}")}
+<p><a href="{csv_scoruri}" download="scoruri.csv">📥 Descarcă CSV</a></p>"""
+    builder.page("tabel.html", "Tabel Rezumativ", corp, app_url)
+    return builder.write(output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=SNAPSHOT_DIR)
+    parser.add_argument("--app-url", default=None, help="adresa aplicației Streamlit (link către vizualizările interactive)")
+    args = parser.parse_args()
+    fisiere = build_snapshot(args.output, args.app_url)
+    total = sum(f["bytes"] for f in fisiere.values())
+    comprimat = sum(f.get("gzip_bytes", f["bytes"]) for f in fisiere.values())
+    print(f"Snapshot: {len(fisiere)} fișiere în {args.output} ({total / 1024:.0f} KB, {comprimat / 1024:.0f} KB gzip)")
@@ -0,0 +1,41 @@
+"""Stilurile comune: paginile Streamlit și snapshot-ul static (snapshot.py)."""
+
+CSS = """
+.main-title {
+    font-size: 2.5em;
+    color: #1f77b4;
+    text-align: center;
+    margin-bottom: 30px;
+    font-weight: bold;
+}
+.section-header {
+    font-size: 1.8em;
+    color: #2E86C1;
+    border-bottom: 2px solid #3498DB;
+    padding-bottom: 10px;
+    margin: 20px 0;
+}
+.info-box {
+    border-left: 5px solid #3498DB;
+    padding: 15px;
+    margin: 10px 0;
+    border-radius: 5px;
+}
+.methodology-step {
+    border: 1px solid #DEE2E6;
+    border-radius: 8px;
+    padding: 15px;
+    margin: 10px 0;
+}
+.step-number {
+    color: white;
+    border-radius: 50%;
+    width: 30px;
+    height: 30px;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    font-weight: bold;
+    margin-right: 10px;
+}
+"""
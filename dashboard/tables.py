@@ -0,0 +1,14 @@
+import math
+
+# Rânduri pe pagină pentru tabelele mari (nivel UAT); tabelele mici sunt afișate întregi
+PAGINA_RANDURI = 200
+
+
+def page_count(n, randuri=PAGINA_RANDURI):
+    return max(1, math.ceil(n / randuri))
+
+
+def paginate(df, pagina, randuri=PAGINA_RANDURI):
+    """Rândurile paginii cerute (numerotare de la 1); doar această felie este trimisă clientului."""
+    pagina = min(max(int(pagina), 1), page_count(len(df), randuri))
+    return df.iloc[(pagina - 1) * randuri:pagina * randuri]
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+from judete import REGISTRY
+
+
+class TrendEngine:
+    """Serii anuale aliniate pe județe (matrice județe x ani) și indicatorii de trend ai fiecărui județ.
+
+    Toți indicatorii se obțin din sume cumulate per județ, deci adăugarea unui an nou
+    (append_year) costă O(județe), fără recalcularea istoricului.
+    """
+
+    def __init__(self, judete, ani, valori):
+        valori = np.asarray(valori, dtype=float)
+        if valori.shape != (len(judete), len(ani)):
+            raise ValueError(f"Matricea are forma {valori.shape}, așteptat ({len(judete)}, {len(ani)}).")
+        self.judete = np.asarray(judete, dtype=object)
+        self.ani = []
+        self._coloane = []
+        n = len(self.judete)
+        self._primul = np.full(n, np.nan)
+        self._ultimul = np.full(n, np.nan)
+        # Regresie liniară valoare ~ an: sume per județ (Σy, Σxy) și per serie (Σx, Σx²)
+        self._sx = 0.0
+        self._sxx = 0.0
+        self._sy = np.zeros(n)
+        self._sxy = np.zeros(n)
+        # Variații anuale (%): Σ, Σ² și numărul lor
+        self._s_yoy = np.zeros(n)
+        self._s2_yoy = np.zeros(n)
+        self._n_yoy = 0
+        for k, an in enumerate(ani):
+            self.append_year(an, valori[:, k])
+
+    @classmethod
+    def from_long(cls, df, coloana_an, coloana_valoare, registry=REGISTRY):
+        """Pivotează o serie în format lung (Judet, An, Valoare) pe id-urile din registru."""
+        ids, nepotrivite = registry.ids(df["Judet"])
+        if nepotrivite:
+            raise ValueError(f"Județe nerecunoscute în serie: {', '.join(nepotrivite)}")
+        ani, coloana = np.unique(df[coloana_an].to_numpy(dtype=int), return_inverse=True)
+        valori = np.full((len(registry), len(ani)), np.nan)
+        valori[ids, coloana] = df[coloana_valoare].to_numpy(dtype=float)
+        return cls(registry.names, ani.tolist(), valori)
+
+    @property
+    def values(self):
+        return np.column_stack(self._coloane) if self._coloane else np.empty((len(self.judete), 0))
+
+    def append_year(self, an, valori):
+        valori = np.asarray(valori, dtype=float)
+        if valori.shape != (len(self.judete),):
+            raise ValueError(f"Sunt necesare {len(self.judete)} valori pentru anul {an}.")
+        if self.ani and an <= self.ani[-1]:
+            raise ValueError(f"Anul {an} nu este după ultimul an din serie ({self.ani[-1]}).")
+        if self.ani:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                yoy = (valori / self._ultimul - 1) * 100
+            self._s_yoy += yoy
+            self._s2_yoy += yoy ** 2
+            self._n_yoy += 1
+        else:
+            self._primul = valori.copy()
+        x = an - (self.ani[0] if self.ani else an)
+        self._sx += x
+        self._sxx += x * x
+        self._sy += valori
+        self._sxy += x * valori
+        self._ultimul = valori.copy()
+        self.ani.append(an)
+        self._coloane.append(valori)
+
+    def metrics(self):
+        t = len(self.ani)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cagr = ((self._ultimul / self._primul) ** (1 / (t - 1)) - 1) * 100 if t > 1 else np.full(len(self.judete), np.nan)
+            medie_yoy = self._s_yoy / self._n_yoy
+            # Abaterea standard de selecție a variațiilor anuale
+            dispersie = (self._s2_yoy - self._n_yoy * medie_yoy ** 2) / (self._n_yoy - 1)
+            volatilitate = np.sqrt(np.maximum(dispersie, 0))
+            panta = (t * self._sxy - self._sx * self._sy) / (t * self._sxx - self._sx ** 2)
+        return pd.DataFrame({
+            "Judet": self.judete,
+            "CAGR (%)": cagr,
+            "Evolutie medie (%)": medie_yoy,
+            "Panta (pe an)": panta,
+            "Volatilitate (%)": volatilitate,
+        })
+
+
+def _min_max(valori):
+    return (valori - np.nanmin(valori)) / (np.nanmax(valori) - np.nanmin(valori))
+
+
+def stability_inputs(trend_salarii, trend_somaj):
+    """Intrările dimensiunii Stabilitate economică, calculate din trenduri în loc de trenduri.csv.
+
+    Scorul = media dintre evoluția salariului normalizată și complementul evoluției șomajului normalizate.
+    """
+    # Valorile nerotunjite (trenduri.csv le publică rotunjite la 2 zecimale)
+    salariu = _min_max(trend_salarii.metrics()["Evolutie medie (%)"].to_numpy())
+    somaj = _min_max(trend_somaj.metrics()["Evolutie medie (%)"].to_numpy())
+    return pd.DataFrame({
+        "Judet": trend_salarii.judete,
+        "Evolutie_medie_salariu": salariu,
+        "Evolutie_medie_somaj": somaj,
+        "Stabilitate_economica_score": (salariu + 1 - somaj) / 2,
+    })
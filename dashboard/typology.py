@@ -0,0 +1,129 @@
+"""Tipologii de județe („urbanizat cu salarii mari”, „rural stagnant”) prin clusterizare ierarhică.
+
+Caracteristicile sunt indicatorii scalați Min-Max și scorurile pe dimensiuni din tabel_grafice.csv.
+Pentru fiecare metodă de legătură (linkage) arborele ierarhic este construit o singură dată și tăiat
+pentru toate valorile lui k deodată; etichetele, centroizii și scorurile silhouette ale tuturor
+combinațiilor (linkage, k) sunt calculate într-un singur job, pe un thread de fundal, și memorate după
+hash-ul datelor. Schimbarea lui k în interfață este o simplă indexare în rezultat.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.cluster.hierarchy import cut_tree, linkage
+from scipy.spatial.distance import pdist, squareform
+from sklearn.metrics import silhouette_score
+
+from analysis_options import K_VALORI, LINKAGE
+from similarity import data_hash
+
+# Rezultate păstrate (hash date -> Future)
+MAX_REZULTATE = 4
+
+
+class Typology:
+    """O clusterizare: eticheta fiecărei unități (0 = tipologia cu profilul mediu cel mai ridicat), centroizi, silhouette."""
+
+    def __init__(self, etichete, centroizi, silhouette, descrieri):
+        self.etichete = etichete
+        self.centroizi = centroizi
+        self.silhouette = silhouette
+        self.descrieri = descrieri
+
+    def __len__(self):
+        return len(self.centroizi)
+
+
+class TypologySet:
+    """Toate clusterizările (linkage x k) pentru aceleași date."""
+
+    def __init__(self, nume, matrice, coloane, etichete_coloane=None, linkage_uri=LINKAGE, k_valori=K_VALORI):
+        self.nume = np.asarray(nume, dtype=object)
+        self.coloane = list(coloane)
+        self.etichete_coloane = etichete_coloane or {}
+        matrice = np.array(matrice, dtype=float)
+        # Valorile lipsă sunt înlocuite cu media coloanei, ca la indexul de similaritate
+        medii = np.nanmean(matrice, axis=0)
+        lipsa = np.isnan(matrice)
+        matrice[lipsa] = np.take(medii, np.nonzero(lipsa)[1])
+        matrice.flags.writeable = False
+        self.matrice = matrice
+        self.k_valori = tuple(k for k in k_valori if 2 <= k < len(matrice))
+        distante = squareform(pdist(matrice))
+        self._rezultate = {}
+        for metoda in linkage_uri:
+            arbore = linkage(matrice, method=metoda)
+            # cut_tree taie arborele pentru toate valorile k într-o singură trecere (n x len(k))
+            taieturi = cut_tree(arbore, n_clusters=self.k_valori) if self.k_valori else np.empty((len(matrice), 0))
+            for j, k in enumerate(self.k_valori):
+                self._rezultate[(metoda, k)] = self._tipologie(taieturi[:, j], distante)
+
+    def _tipologie(self, etichete, distante):
+        k = etichete.max() + 1
+        centroizi = np.vstack([self.matrice[etichete == c].mean(axis=0) for c in range(k)])
+        # Renumerotare stabilă: tipologia 0 are media trăsăturilor cea mai mare
+        ordine = np.argsort(-centroizi.mean(axis=1), kind="stable")
+        renumerotare = np.empty(k, dtype=int)
+        renumerotare[ordine] = np.arange(k)
+        etichete = renumerotare[etichete]
+        centroizi = centroizi[ordine]
+        silhouette = float(silhouette_score(distante, etichete, metric="precomputed"))
+        for tablou in (etichete, centroizi):
+            tablou.flags.writeable = False
+        return Typology(etichete, centroizi, silhouette, [self._descriere(c) for c in centroizi])
+
+    def _descriere(self, centroid, trasaturi=2):
+        """Trăsăturile prin care tipologia se abate cel mai mult de la media țării (în deviații standard)."""
+        abatere = (centroid - self.matrice.mean(axis=0)) / np.where(self.matrice.std(axis=0) > 0, self.matrice.std(axis=0), 1)
+        principale = np.argsort(-np.abs(abatere), kind="stable")[:trasaturi]
+        return ", ".join(
+            f"{self.etichete_coloane.get(self.coloane[i], self.coloane[i])} {'↑' if abatere[i] > 0 else '↓'}"
+            for i in principale
+        )
+
+    def get(self, metoda, k):
+        return self._rezultate[(metoda, k)]
+
+    def best_k(self, metoda):
+        """k cu scorul silhouette cel mai mare pentru metoda dată."""
+        return max(self.k_valori, key=lambda k: self._rezultate[(metoda, k)].silhouette)
+
+    def scores(self):
+        """Scorurile silhouette: k pe rânduri, metodele pe coloane."""
+        metode = list(dict.fromkeys(m for m, _ in self._rezultate))
+        return pd.DataFrame(
+            {LINKAGE.get(m, m): [self._rezultate[(m, k)].silhouette for k in self.k_valori] for m in metode},
+            index=pd.Index(self.k_valori, name="k"),
+        )
+
+    def summary(self, metoda, k):
+        """Tipologiile: numărul de unități, descrierea și centroidul pe fiecare trăsătură."""
+        tipologie = self.get(metoda, k)
+        df = pd.DataFrame(tipologie.centroizi.round(3), columns=[self.etichete_coloane.get(c, c) for c in self.coloane])
+        df.insert(0, "Profil", tipologie.descrieri)
+        df.insert(0, "Unitati", np.bincount(tipologie.etichete, minlength=k))
+        df.insert(0, "Tipologie", np.arange(1, k + 1))
+        return df
+
+
+_REZULTATE = OrderedDict()
+_LOCK = threading.Lock()
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tipologii")
+
+
+def submit_typologies(nume, matrice, coloane, etichete_coloane=None):
+    """Pornește (o singură dată per hash al datelor) jobul care calculează toate clusterizările; întoarce un Future."""
+    cheie = data_hash(nume, matrice, coloane)
+    with _LOCK:
+        viitor = _REZULTATE.get(cheie)
+        # Un job eșuat nu rămâne în cache: următoarea cerere îl repornește
+        if viitor is not None and not (viitor.done() and viitor.exception() is not None):
+            _REZULTATE.move_to_end(cheie)
+            return viitor
+        viitor = _EXECUTOR.submit(TypologySet, nume, matrice, coloane, etichete_coloane)
+        _REZULTATE[cheie] = viitor
+        while len(_REZULTATE) > MAX_REZULTATE:
+            _REZULTATE.popitem(last=False)
+    return viitor
@@ -0,0 +1,120 @@
+"""Nivelul UAT (comune, orașe, municipii): scoruri, geometrie și agregare pe județe și regiuni.
+
+Arborele nu conține încă indicatori la nivel de UAT; `synthetic_uats` generează un set de test
+(~3.200 de unități, cât are România) pentru validarea căii de randare și a bugetelor de latență.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+
+from geometry import NIVELURI, GridIndex, build_levels, pick_level, to_geojson
+from judete import REGISTRY
+from scoring import ScoringEngine, group_mean
+
+NUMAR_UAT = 3200
+
+
+class UatData:
+    """Unitățile administrativ-teritoriale aliniate pe poziție: cod, nume, județ, scoruri pe dimensiuni, populație."""
+
+    def __init__(self, coduri, nume, id_judet, matrice, populatie, geojson, regiuni_judete, registry=REGISTRY):
+        self.coduri = np.asarray(coduri)
+        self.nume = np.asarray(nume, dtype=object)
+        self.id_judet = np.asarray(id_judet, dtype=int)
+        self.populatie = np.asarray(populatie, dtype=float)
+        self.geojson = geojson
+        self.registry = registry
+        self.regiuni_judete = np.asarray(regiuni_judete, dtype=object)
+        self.nume_regiuni, self.cod_regiune_judet = np.unique(self.regiuni_judete, return_inverse=True)
+        # Media regiunii din tooltip rămâne media regiunii de dezvoltare (ca la nivel de județ)
+        self.engine = ScoringEngine(self.nume, self.regiuni_judete[self.id_judet], matrice)
+
+    def __len__(self):
+        return len(self.coduri)
+
+    def frame(self, rezultat):
+        df = rezultat.frame().rename(columns={"Judet": "UAT"})
+        df.insert(1, "Cod", self.coduri)
+        df.insert(2, "Judet", self.registry.names[self.id_judet])
+        return df
+
+    def aggregate(self, potential, nivel="Judet"):
+        """Agregarea potențialului UAT pe județe sau regiuni (medie ponderată cu populația, minim, maxim)."""
+        if nivel == "Judet":
+            grupe, nume = self.id_judet, self.registry.names
+        else:
+            grupe, nume = self.cod_regiune_judet[self.id_judet], self.nume_regiuni
+        numar_grupe = len(nume)
+        minim = np.full(numar_grupe, np.inf)
+        maxim = np.full(numar_grupe, -np.inf)
+        np.minimum.at(minim, grupe, potential)
+        np.maximum.at(maxim, grupe, potential)
+        df = pd.DataFrame({
+            nivel: nume,
+            "UAT-uri": np.bincount(grupe, minlength=numar_grupe),
+            "Populatie": np.bincount(grupe, weights=self.populatie, minlength=numar_grupe).astype(np.int64),
+            "Potential mediu": group_mean(potential, grupe, numar_grupe, self.populatie).round(2),
+            "Potential minim": minim.round(2),
+            "Potential maxim": maxim.round(2),
+        })
+        return df[df["UAT-uri"] > 0].sort_values("Potential mediu", ascending=False, ignore_index=True)
+
+
+def _patrat(x, y, latura):
+    h = latura / 2
+    return [[x - h, y - h], [x + h, y - h], [x + h, y + h], [x - h, y + h], [x - h, y - h]]
+
+
+def synthetic_uats(judete_geojson, engine, n=NUMAR_UAT, seed=0, latime_px=1400, registry=REGISTRY):
+    """Set sintetic de ~n UAT-uri: o grilă națională de celule pătrate, fiecare atribuită județului
+    care îi conține centrul (prin GridIndex). Scorurile sunt cele ale județului plus zgomot.
+    """
+    rng = np.random.default_rng(seed)
+    index = GridIndex(judete_geojson)
+    x0, y0 = index.bbox[:, :2].min(axis=0)
+    x1, y1 = index.bbox[:, 2:].max(axis=0)
+
+    # Fracția din bbox acoperită de țară, estimată din puncte aleatoare
+    proba = index.locate(rng.uniform(x0, x1, 20_000), rng.uniform(y0, y1, 20_000))
+    suprafata = (x1 - x0) * (y1 - y0) * (proba >= 0).mean()
+    latura = math.sqrt(suprafata / n)
+
+    xs, ys = np.meshgrid(np.arange(x0 + latura / 2, x1, latura), np.arange(y0 + latura / 2, y1, latura))
+    xs, ys = xs.ravel(), ys.ravel()
+    feature = index.locate(xs, ys)
+    interior = feature >= 0
+    xs, ys, feature = xs[interior], ys[interior], feature[interior]
+    ids_feature, _ = registry.ids([f["properties"]["name"] for f in judete_geojson["features"]])
+    id_judet = ids_feature[feature]
+    valid = id_judet >= 0
+    xs, ys, id_judet = xs[valid], ys[valid], id_judet[valid]
+
+    # Numerotare în cadrul fiecărui județ, în ordinea celulelor
+    ordine = np.lexsort((np.arange(len(id_judet)), id_judet))
+    xs, ys, id_judet = xs[ordine], ys[ordine], id_judet[ordine]
+    primul = np.searchsorted(id_judet, id_judet)
+    numar_in_judet = np.arange(len(id_judet)) - primul + 1
+
+    coduri = np.arange(1, len(id_judet) + 1)
+    nume = [f"{registry.names[j]} {k:03d}" for j, k in zip(id_judet, numar_in_judet)]
+    id_engine, _ = registry.ids(engine.judete)
+    scoruri_judete = np.full((len(registry), engine.matrice.shape[1]), np.nan)
+    scoruri_judete[id_engine] = engine.matrice
+    regiuni_judete = np.full(len(registry), "", dtype=object)
+    regiuni_judete[id_engine] = engine.regiuni
+    matrice = np.clip(scoruri_judete[id_judet] + rng.normal(0, 0.08, (len(id_judet), engine.matrice.shape[1])), 0, 1)
+    populatie = np.round(rng.lognormal(8.2, 0.9, len(id_judet)))
+
+    geojson = {"type": "FeatureCollection", "features": [
+        {
+            "type": "Feature",
+            "properties": {"cod": int(cod), "name": eticheta},
+            "geometry": {"type": "Polygon", "coordinates": [_patrat(x, y, latura)]},
+        }
+        for cod, eticheta, x, y in zip(coduri, nume, xs, ys)
+    ]}
+    # Aceeași cale ca ro.json: arce comune, cuantizare și nivelul de detaliu potrivit lățimii hărții
+    topologie = build_levels(geojson, NIVELURI)
+    geojson = to_geojson(topologie, pick_level(topologie, latime_px))
+    return UatData(coduri, nume, id_judet, matrice, populatie, geojson, regiuni_judete, registry)
@@ -0,0 +1,600 @@
+import pandas as pd
+import streamlit as st
+
+from analysis_options import K_MAX, LINKAGE, METRICI
+from controls import current_scores, level_selector, weight_sliders
+from cube import ETICHETE_NIVEL, STATISTICI, TARA
+from details import INDICATORI, region_position
+from export import FORMATE, export_bytes, parquet_available
+from figure_cache import content_hash
+from figures import (
+    build_animated_map_figure, build_bar_figure, build_cluster_map_figure, build_map_figure, build_rank_band_figure,
+    cluster_map_values, map_values,
+)
+from judete import REGISTRY
+from loaders import (
+    LATIME_HARTA, geometry_version, get_figure_cache, load_county_details, load_cube, load_geojson,
+    load_history, load_scoring_engine, load_sensitivity, load_series_data, load_similarity_index, load_summary_table,
+    load_typologies, load_whatif_base,
+)
+from map_component import HARTA_DELTA, delta_map, static_spec
+from metrics import METRICS
+from scoring import DIMENSIUNI, top_k
+from tables import page_count, paginate
+from whatif import EDITABILE, WhatIfScenario
+
+# Numărul maxim de bare din grafic; la nivel UAT graficul conține doar primele unități
+MAX_BARE = 100
+
+st.markdown('<h1 class="main-title">📊 Dashboard Economic Score</h1>', unsafe_allow_html=True)
+
+ponderi = weight_sliders()
+nivel, uat = level_selector()
+coloana_nume = "UAT" if nivel == "UAT" else "Judet"
+unitati = "UAT-uri" if nivel == "UAT" else "județe"
+titlu_unitati = "UAT-uri" if nivel == "UAT" else "Județe"
+
+engine = load_scoring_engine()
+figure_cache = get_figure_cache()
+scoruri, rezultat = current_scores(ponderi, nivel, uat)
+
+
+def afiseaza_detalii(rand):
+    """Panoul de detalii al județului din rândul selectat (la nivel UAT: județul din care face parte UAT-ul)."""
+    detalii = load_county_details()
+    detaliu = detalii.get(REGISTRY.id_of(rand["Judet"])) if detalii is not None else None
+    if detaliu is None:
+        st.warning(f"Nu există detalii pentru {rand['Judet']}.")
+        return
+    
+    st.markdown(f'<div class="section-header">🔎 {detaliu["judet"]} - {detaliu["regiune"]}</div>', unsafe_allow_html=True)
+    if "UAT" in rand:
+        st.caption(f"UAT selectat: {rand['UAT']} (potențial {rand['Potential']:.2f}). Detaliile de mai jos sunt ale județului.")
+    
+    loc, din = region_position(detaliu)
+    comparatie = detaliu["comparatie"]
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Potențial (ponderi curente)", f"{rand['Potential']:.2f}", f"{rand['Vs Media Tarii']:+.2f} vs media țării")
+    with col2:
+        st.metric("Potențial publicat", f"{comparatie['Potential']:.2f}", f"{comparatie['Vs Media Regiunii']:+.2f} vs media regiunii")
+    with col3:
+        st.metric("Media Regiunii (publicată)", f"{comparatie['Media Regiunii']:.2f}")
+    with col4:
+        st.metric("Loc în regiune", f"{loc} din {din}")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**📐 Scoruri pe dimensiuni**")
+        st.dataframe(detaliu["dimensiuni"], use_container_width=True, hide_index=True)
+        st.markdown("**📋 Indicatori (tabel_grafice.csv, scalați 0-1)**")
+        st.dataframe(detaliu["indicatori"], use_container_width=True, hide_index=True)
+    with col2:
+        if detaliu["serii"] is not None and len(detaliu["serii"]):
+            st.markdown("**💰 Salariul mediu net 2019-2023 (RON)**")
+            st.line_chart(detaliu["serii"]["Salariul Mediu"], height=200)
+            st.markdown("**📉 Rata șomajului 2019-2023 (%)**")
+            st.line_chart(detaliu["serii"]["Rata Somaj"], height=200)
+        st.markdown(f"**🏘️ Județele din regiunea {detaliu['regiune']} (potențial publicat)**")
+        st.dataframe(detaliu["regiune_judete"], use_container_width=True, hide_index=True)
+
+    afiseaza_similare(rand["UAT"] if "UAT" in rand else rand["Judet"])
+
+
+def afiseaza_similare(nume):
+    """Unitățile cele mai asemănătoare cu `nume`, din indexul de vecini (trăsături și metrică la alegere)."""
+    index = load_similarity_index(nivel)
+    if index is None or nume not in index:
+        return
+    etichete = DIMENSIUNI if nivel == "UAT" else INDICATORI
+    st.markdown(f"**🧬 {titlu_unitati} asemănătoare cu {nume}**")
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        coloane = st.multiselect(
+            "Trăsături comparate", index.coloane, default=index.coloane, format_func=etichete.get, key=f"sim_coloane_{nivel}"
+        )
+    with col2:
+        metrica = st.selectbox("Distanță", list(METRICI), format_func=METRICI.get, key="sim_metrica")
+    with col3:
+        k = st.number_input("Număr rezultate", 1, K_MAX, 5, key="sim_k")
+    if not coloane:
+        st.info("Alege cel puțin o trăsătură.")
+        return
+    with METRICS.section("similaritate"):
+        df = index.similar(nume, int(k), coloane, metrica)
+    df = df.round(3).assign(Distanta=df["Distanta"].round(4))
+    df = df.rename(columns={"Unitate": "UAT" if nivel == "UAT" else "Județ", "Distanta": f"Distanță ({METRICI[metrica]})", **etichete})
+    st.dataframe(df, use_container_width=True, hide_index=True)
+    st.caption("Trăsăturile sunt scalate 0-1; distanța mică înseamnă profil asemănător.")
+
+
+@st.fragment
+def harta_cu_detalii(df, fig=None, delta=None):
+    """Harta și panoul de detalii. Un click pe hartă rulează doar acest fragment: figura vine din
+    argumentele ultimului rerun complet, iar panoul din payload-ul pre-calculat.
+
+    Cu `delta` = (cheie statică, figura statică, valori) harta este componenta care păstrează geometria
+    în browser; altfel (`fig`) este un st.plotly_chart obișnuit.
+    """
+    if delta is not None:
+        selectie = delta_map(*delta, key=f"harta_{nivel}")
+    else:
+        with METRICS.section("plotly_chart:harta"):
+            eveniment = st.plotly_chart(fig, use_container_width=True, on_select="rerun", selection_mode="points", key="harta")
+        puncte = eveniment.selection.points if eveniment is not None else []
+        selectie = puncte[0]["point_index"] if puncte else None
+    if selectie is None:
+        st.caption("👆 Click pe un județ pentru detalii: indicatori, serii 2019-2023 și comparația cu regiunea.")
+        return
+    with METRICS.section("fragment:detalii"):
+        afiseaza_detalii(df.iloc[selectie])
+
+
+def tab_harta():
+    st.markdown('<div class="section-header">🗺️ Harta Interactivă a Potențialului Economic</div>', unsafe_allow_html=True)
+
+    if nivel == "UAT":
+        geojson_data = uat.geojson
+        optiuni_harta = dict(
+            nume="UAT", locatii="Cod", featureidkey="properties.cod",
+            titlu="Potențialul Economic al UAT-urilor - Hover pentru detalii",
+        )
+    else:
+        geojson_data = load_geojson(LATIME_HARTA)
+        optiuni_harta = {}
+
+    colorare = "Potențial"
+    if nivel != "UAT":
+        colorare = st.radio("Colorare", ["Potențial", "Tipologie"], horizontal=True, key="harta_colorare")
+
+    if scoruri is not None and geojson_data is not None and colorare == "Tipologie":
+        harta_tipologii(scoruri, geojson_data)
+    elif scoruri is not None and geojson_data is not None:
+        # Scorurile conțin deja coloanele pentru tooltip (regiune, medii, diferențe)
+        df_combined = scoruri
+        if HARTA_DELTA:
+            # Partea statică (geometrie, layout) nu depinde de ponderi; la fiecare schimbare pleacă doar valorile
+            cheie_static = content_hash("harta-static", nivel, len(df_combined), LATIME_HARTA, geometry_version())
+            with METRICS.section("figura:harta"):
+                static_json = figure_cache.get_or_build_spec(
+                    cheie_static,
+                    lambda: static_spec(build_map_figure(df_combined, geojson_data, LATIME_HARTA, **optiuni_harta)),
+                )
+                valori = map_values(df_combined, optiuni_harta.get("nume", "Judet"), optiuni_harta.get("locatii", "Judet"))
+            harta_cu_detalii(df_combined, delta=(cheie_static, static_json, valori))
+        else:
+            cheie_harta = content_hash("harta", nivel, df_combined, list(ponderi), LATIME_HARTA, geometry_version())
+            with METRICS.section("figura:harta"):
+                fig = figure_cache.get_or_build(
+                    cheie_harta, lambda: build_map_figure(df_combined, geojson_data, LATIME_HARTA, **optiuni_harta)
+                )
+            METRICS.add_payload("plotly_chart:harta", figure_cache.size_of(cheie_harta) or 0)
+            harta_cu_detalii(df_combined, fig=fig)
+
+        # Informații despre tooltip
+        st.info("💡 **Interacțiune:** Fă hover peste orice județ pentru a vedea informații detaliate: regiune, comparații cu media națională și regională! Click pe județ pentru panoul de detalii.")
+
+        # Legendă pentru înțelegerea comparațiilor
+        with st.expander("📖 Cum să interpretezi datele din hover"):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(f"""
+                **📊 Indicatori afișați:**
+                - **Potențial Economic**: Scorul calculat pentru județ
+                - **Media Țării**: Media națională ({df_combined['Media Tarii'].iloc[0]:.2f})
+                - **Media Regiunii**: Media pentru regiunea din care face parte județul
+                """)
+            with col2:
+                st.markdown("""
+                **📈 Comparații:**
+                - **vs Media Țării**: Diferența față de media națională
+                - **vs Media Regiunii**: Diferența față de media regională
+                """)
+
+    else:
+        st.error("Nu s-au putut încărca toate fișierele necesare pentru hartă (tabel_grafice.csv, ro.json).")
+
+
+def harta_tipologii(df, geojson_data):
+    """Harta colorată pe tipologii (clusterizare ierarhică a județelor); k și metoda doar indexează rezultatele."""
+    viitor = load_typologies()
+    if viitor is None:
+        st.error("Nu s-au putut încărca indicatorii pentru tipologii (tabel_grafice.csv).")
+        return
+    if not viitor.done():
+        with st.spinner("Se calculează tipologiile..."):
+            viitor.result()
+    if viitor.exception() is not None:
+        load_typologies.clear()
+        st.error(f"Calculul tipologiilor a eșuat: {viitor.exception()}")
+        return
+    tipologii = viitor.result()
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        metoda = st.selectbox("Legătură (linkage)", list(LINKAGE), format_func=LINKAGE.get, key="tip_linkage")
+    with col2:
+        k = st.select_slider("Număr de tipologii (k)", list(tipologii.k_valori), value=4, key="tip_k")
+    tipologie = tipologii.get(metoda, k)
+    with col3:
+        st.metric("Silhouette", f"{tipologie.silhouette:.3f}", help=f"Cel mai bun k pentru această legătură: {tipologii.best_k(metoda)}")
+
+    # Rândurile scorurilor fără tipologie (județe fără indicatori) nu apar pe hartă
+    pozitie = {n: i for i, n in enumerate(tipologii.nume)}
+    df = df[df["Judet"].isin(pozitie)].reset_index(drop=True)
+    etichete = tipologie.etichete[[pozitie[j] for j in df["Judet"]]]
+    valori = cluster_map_values(df, etichete, tipologie.descrieri)
+    cheie_static = content_hash("harta-tipologii-static", len(df), LATIME_HARTA, geometry_version())
+    with METRICS.section("figura:harta"):
+        if HARTA_DELTA:
+            static_json = figure_cache.get_or_build_spec(
+                cheie_static, lambda: static_spec(build_cluster_map_figure(geojson_data, LATIME_HARTA)),
+            )
+            harta_cu_detalii(df, delta=(cheie_static, static_json, valori))
+        else:
+            cheie_harta = content_hash("harta-tipologii", cheie_static, metoda, k, df)
+            fig = figure_cache.get_or_build(
+                cheie_harta, lambda: build_cluster_map_figure(geojson_data, LATIME_HARTA).update_traces(**valori),
+            )
+            harta_cu_detalii(df, fig=fig)
+
+    st.markdown("**🧩 Tipologii (centroizi pe trăsături scalate 0-1)**")
+    st.dataframe(tipologii.summary(metoda, k), use_container_width=True, hide_index=True)
+    with st.expander("📐 Scorul silhouette pentru toate combinațiile (k, legătură)"):
+        st.dataframe(tipologii.scores().round(3), use_container_width=True)
+        st.caption("Silhouette apropiat de 1: tipologii bine separate; aproape de 0: granițe neclare între tipologii.")
+
+
+def tab_top():
+    st.markdown(f'<div class="section-header">📊 Top {titlu_unitati} după Potențial Economic</div>', unsafe_allow_html=True)
+
+    if scoruri is not None:
+        # Selecție top-k vectorizată (argpartition), fără sortarea întregului tabel
+        potential = scoruri["Potential"].to_numpy()
+        df = scoruri.iloc[top_k(potential, MAX_BARE)]
+
+        cheie_bar = content_hash("bar", nivel, df, list(ponderi))
+        with METRICS.section("figura:bar"):
+            fig = figure_cache.get_or_build(
+                cheie_bar,
+                lambda: build_bar_figure(df, x=coloana_nume, titlu=f"Clasificarea {'UAT-urilor' if nivel == 'UAT' else 'Județelor'} după Potențial Economic"),
+            )
+
+        with METRICS.section("plotly_chart:bar"):
+            st.plotly_chart(fig, use_container_width=True)
+        METRICS.add_payload("plotly_chart:bar", figure_cache.size_of(cheie_bar) or 0)
+
+        if len(df) < len(scoruri):
+            st.info(
+                f"📊 Graficul conține primele {len(df)} {unitati} din {len(scoruri)} total, "
+                f"câte {min(10, len(df))} vizibile odată. Folosește slider-ul pentru a naviga prin ele."
+            )
+        else:
+            st.info(
+                f"📊 Graficul conține toate cele {len(df)} {unitati}, câte {min(10, len(df))} vizibile odată. "
+                "Folosește slider-ul de sub grafic pentru a le parcurge."
+            )
+
+        # Top 5 și Bottom 5
+        nume = scoruri[coloana_nume].to_numpy()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader(f"🏆 Top 5 {titlu_unitati}")
+            st.markdown("  \n".join(f"**{nume[i]}**: {potential[i]:.2f}" for i in top_k(potential, 5)))
+
+        with col2:
+            st.subheader(f"📉 Ultimele 5 {titlu_unitati}")
+            st.markdown("  \n".join(f"**{nume[i]}**: {potential[i]:.2f}" for i in top_k(potential, 5, descrescator=False)))
+
+def tab_tabel():
+    st.markdown('<div class="section-header">📋 Tabel Rezumativ - Indicatori Economici</div>', unsafe_allow_html=True)
+
+    if nivel == "UAT":
+        # Scorurile UAT paginate: doar pagina curentă este trimisă clientului
+        numar_pagini = page_count(len(scoruri))
+        pagina = st.number_input(f"Pagina (din {numar_pagini})", 1, numar_pagini, 1, key="pagina_uat")
+        with METRICS.section("dataframe:uat"):
+            st.dataframe(paginate(scoruri.sort_values("Rank"), pagina), use_container_width=True, hide_index=True)
+        st.download_button(
+            label="📥 Descarcă CSV (toate UAT-urile)",
+            data=lambda: export_bytes({'Scoruri_UAT': scoruri}, "csv"),
+            file_name='scoruri_uat.csv',
+            mime=FORMATE["csv"],
+        )
+
+        # Agregare pe județe și regiuni (medie ponderată cu populația)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("### 🏛️ Pe județe")
+            st.dataframe(uat.aggregate(rezultat.potential, "Judet"), use_container_width=True, hide_index=True)
+        with col2:
+            st.markdown("### 🗺️ Pe regiuni")
+            st.dataframe(uat.aggregate(rezultat.potential, "Regiune"), use_container_width=True, hide_index=True)
+    else:
+        df_rezumat = load_summary_table()
+
+        # Verifică dacă toate dataset-urile au fost încărcate
+        if df_rezumat is not None:
+            # Afișare tabel
+            with METRICS.section("dataframe:rezumat"):
+                st.dataframe(df_rezumat, use_container_width=True, hide_index=True)
+
+
+            # Opțiuni de export: fișierele sunt generate doar la click, cache-uite după conținut
+            def export_sheets(df_rezumat=df_rezumat):
+                sheets = {'Indicatori_Economici': df_rezumat}
+                serii = load_series_data()
+                if serii is not None:
+                    sheets['Serii_2019_2023'] = serii
+                if engine is not None:
+                    sheets['Scoruri'] = pd.concat(
+                        [scoruri, pd.DataFrame(engine.matrice, columns=list(DIMENSIUNI))], axis=1
+                    )
+                return sheets
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.download_button(
+                    label="📥 Descarcă CSV",
+                    data=lambda: export_bytes({'Indicatori_Economici': df_rezumat}, "csv"),
+                    file_name='tabel_rezumativ_economic.csv',
+                    mime=FORMATE["csv"],
+                )
+
+            with col2:
+                # Excel cu mai multe foi: rezumat, serii anuale, scoruri
+                st.download_button(
+                    label="📥 Descarcă Excel",
+                    data=lambda: export_bytes(export_sheets(), "xlsx"),
+                    file_name='tabel_rezumativ_economic.xlsx',
+                    mime=FORMATE["xlsx"],
+                )
+
+            with col3:
+                if parquet_available():
+                    st.download_button(
+                        label="📥 Descarcă Parquet",
+                        data=lambda: export_bytes({'Indicatori_Economici': df_rezumat}, "parquet"),
+                        file_name='tabel_rezumativ_economic.parquet',
+                        mime=FORMATE["parquet"],
+                    )
+
+            # Statistici despre tabel; totalurile și mediile naționale vin din cub (calculate o singură dată)
+            cub = load_cube()
+            st.markdown("### 📈 Statistici Rapide")
+            col1, col2, col3, col4, col5 = st.columns(5)
+
+            numeric_cols = df_rezumat.select_dtypes(include=['float64', 'int64']).columns
+            if len(numeric_cols) > 0:
+                with col1:
+                    st.metric("Județe Analizate", len(df_rezumat))
+                with col2:
+                    if cub is not None and "Populatie" in cub.masuri:
+                        st.metric("Populație Totală", f"{cub.value('Tara', TARA, 'Populatie', 'suma'):,.0f}")
+                with col3:
+                    if cub is not None and "Numar Firme" in cub.masuri:
+                        st.metric("Total Firme", f"{cub.value('Tara', TARA, 'Numar Firme', 'suma'):,.0f}")
+                with col4:
+                    if cub is not None and "Salariul Mediu Net (RON)" in cub.masuri:
+                        st.metric("Salariul Mediu Național", f"{cub.value('Tara', TARA, 'Salariul Mediu Net (RON)'):.0f} RON")
+                with col5:
+                    if cub is not None and "Rata Somaj (%)" in cub.masuri:
+                        st.metric("Rata Medie a Șomajului", f"{cub.value('Tara', TARA, 'Rata Somaj (%)'):.2f}%")
+
+            if cub is not None:
+                agregari_cub(cub)
+        else:
+            st.error("Nu s-au putut încărca toate bazele de date necesare pentru tabelul rezumativ.")
+
+
+def tabel_cub(cub, nivel, statistica, grupe=None):
+    df = cub.frame(nivel, statistica)
+    if grupe is not None:
+        df = df[df[nivel].isin(grupe)]
+    if statistica in ("medie", "medie_ponderata"):
+        # Potențialul pentru ponderile curente: mediile dimensiunilor înmulțite cu ponderile
+        potential = cub.potential(nivel, ponderi, statistica)
+        df = df.assign(**{"Potențial (ponderi curente)": potential[df.index]}).sort_values(
+            "Potențial (ponderi curente)", ascending=False
+        )
+    return df.rename(columns={**DIMENSIUNI, nivel: ETICHETE_NIVEL[nivel]}).round(2)
+
+
+def agregari_cub(cub):
+    st.markdown("### 🧮 Agregări pe regiuni, macroregiuni și la nivel național")
+    col1, col2 = st.columns(2)
+    with col1:
+        nivel_agregare = st.radio(
+            "Nivel", ["Regiune", "Macroregiune", "Tara"], format_func=ETICHETE_NIVEL.get, horizontal=True, key="cub_nivel"
+        )
+    with col2:
+        statistica = st.selectbox("Statistică", list(STATISTICI), index=2, format_func=STATISTICI.get, key="cub_statistica")
+    with METRICS.section("dataframe:cub"):
+        st.dataframe(tabel_cub(cub, nivel_agregare, statistica), use_container_width=True, hide_index=True)
+
+    # Drill-down: componentele unei grupe pe nivelul imediat inferior
+    grupa = st.selectbox(f"🔽 Detaliază ({ETICHETE_NIVEL[nivel_agregare]})", cub.names(nivel_agregare), key=f"cub_grupa_{nivel_agregare}")
+    jos, componente = cub.children(nivel_agregare, grupa)
+    st.dataframe(tabel_cub(cub, jos, statistica, componente), use_container_width=True, hide_index=True)
+
+
+def tab_sensibilitate():
+    st.markdown('<div class="section-header">🎲 Cât de stabil este clasamentul?</div>', unsafe_allow_html=True)
+    st.markdown("""
+    Ponderile w1..w5 au fost stabilite intern. Simularea Monte Carlo eșantionează vectori de ponderi
+    dintr-o distribuție Dirichlet centrată pe ponderile curente și recalculează clasamentul județelor
+    pentru fiecare vector. O concentrație mare înseamnă ponderi apropiate de cele curente.
+    """)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        esantioane = st.select_slider(
+            "Număr de eșantioane", [10_000, 50_000, 100_000, 200_000, 500_000], value=200_000,
+            format_func=lambda n: f"{n:,}".replace(",", "."),
+        )
+    with col2:
+        concentratie = st.select_slider("Concentrație Dirichlet", [20, 50, 100, 200, 500], value=100)
+
+    # Sensibilitatea se calculează pe județe (scorurile din tabel_grafice.csv), indiferent de nivelul hărții
+    with METRICS.section("sensibilitate"), st.spinner("Se rulează simularea Monte Carlo..."):
+        sensibilitate = load_sensitivity(tuple(float(w) for w in ponderi), esantioane, float(concentratie))
+
+    if sensibilitate is not None:
+        df_sens = sensibilitate.frame()
+        cheie_sens = content_hash("sensibilitate", df_sens)
+        with METRICS.section("figura:sensibilitate"):
+            fig = figure_cache.get_or_build(cheie_sens, lambda: build_rank_band_figure(df_sens))
+        st.plotly_chart(fig, use_container_width=True)
+
+        stabile = int((df_sens["Rang P95"] - df_sens["Rang P5"] <= 2).sum())
+        st.info(
+            f"🎲 {sensibilitate.esantioane:,} vectori de ponderi simulați. ".replace(",", ".")
+            + f"{stabile} din {len(df_sens)} județe rămân într-o bandă de cel mult 2 ranguri (P5-P95)."
+        )
+        st.dataframe(df_sens, use_container_width=True, hide_index=True)
+    else:
+        st.error("Nu s-au putut încărca scorurile pe dimensiuni (tabel_grafice.csv).")
+
+
+def tab_evolutie():
+    st.markdown('<div class="section-header">📅 Evoluția Potențialului pe Ani</div>', unsafe_allow_html=True)
+    istoric = load_history()
+    geojson_data = load_geojson(LATIME_HARTA)
+    if istoric is None or not len(istoric) or geojson_data is None:
+        st.error("Nu s-a putut construi istoricul (seriile 2019-2023 sau ro.json lipsesc).")
+        return
+    if nivel == "UAT":
+        st.info("Istoricul este disponibil doar la nivel de județ; harta de mai jos arată județele.")
+
+    ani = istoric.years
+    potential = istoric.potential(ponderi)
+    judete = istoric.registry.names
+    cheie = content_hash("evolutie", potential, ani, LATIME_HARTA, geometry_version())
+    with METRICS.section("figura:evolutie"):
+        fig = figure_cache.get_or_build(cheie, lambda: build_animated_map_figure(judete, ani, potential, geojson_data, LATIME_HARTA))
+    with METRICS.section("plotly_chart:evolutie"):
+        st.plotly_chart(fig, use_container_width=True)
+    METRICS.add_payload("plotly_chart:evolutie", figure_cache.size_of(cheie) or 0)
+
+    st.caption(
+        f"Salariul mediu și rata șomajului variază pe ani ({ani[0]}-{ani[-1]}, scalate Min-Max în cadrul fiecărui an); "
+        "populația, venitul, firmele și urbanizarea rămân la valorile din tabel_grafice.csv. Stabilitatea economică "
+        "folosește evoluția medie de la primul an până la anul afișat; în primul an ponderea ei este redistribuită."
+    )
+    tabel = pd.DataFrame(potential.round(2), columns=[str(an) for an in ani])
+    tabel.insert(0, "Judet", judete)
+    tabel[f"Δ {ani[0]}-{ani[-1]}"] = (tabel[str(ani[-1])] - tabel[str(ani[0])]).round(2)
+    st.dataframe(tabel.sort_values(str(ani[-1]), ascending=False), use_container_width=True, hide_index=True)
+
+
+def _scenariu_nou(nume, scenariu):
+    """Scenariul și starea editorului lui: valorile afișate la creare și celulele deja aplicate."""
+    st.session_state["whatif_id"] = st.session_state.get("whatif_id", 0) + 1
+    st.session_state["whatif_scenarii"][nume] = {
+        "scenariu": scenariu,
+        "baza": scenariu.raw()[["Judet", *EDITABILE]],
+        "aplicate": {},
+        "editor": f"whatif_editor_{st.session_state['whatif_id']}",
+        "ultima": None,
+    }
+    st.session_state["whatif_activ"] = nume
+
+
+def _copiaza_scenariu():
+    scenarii = st.session_state["whatif_scenarii"]
+    nume = f"Scenariul {st.session_state['whatif_id'] + 1}"
+    _scenariu_nou(nume, scenarii[st.session_state["whatif_activ"]]["scenariu"].copy())
+
+
+def _reseteaza_scenariu(baza):
+    _scenariu_nou(st.session_state["whatif_activ"], WhatIfScenario(baza, ponderi))
+
+
+def _aplica_editari(intrare):
+    """Aplică incremental celulele schimbate în editor; o celulă ștearsă revine la valoarea afișată inițial."""
+    scenariu, baza, aplicate = intrare["scenariu"], intrare["baza"], intrare["aplicate"]
+    editari = st.session_state[intrare["editor"]]["edited_rows"]
+    dorite = {
+        (rand, coloana): valoare
+        for rand, valori in editari.items() for coloana, valoare in valori.items() if valoare is not None
+    }
+    diferente, durata = [], 0.0
+    for (rand, coloana) in [c for c in aplicate if c not in dorite]:
+        diferente.append(scenariu.set(baza["Judet"].iat[int(rand)], coloana, baza[coloana].iat[int(rand)]))
+        durata += scenariu.ultima_durata
+        del aplicate[(rand, coloana)]
+    for (rand, coloana), valoare in dorite.items():
+        if aplicate.get((rand, coloana)) != valoare:
+            diferente.append(scenariu.set(baza["Judet"].iat[int(rand)], coloana, valoare))
+            durata += scenariu.ultima_durata
+            aplicate[(rand, coloana)] = valoare
+    if diferente:
+        intrare["ultima"] = (diferente[-1], durata, len(diferente))
+
+
+def tab_whatif():
+    st.markdown('<div class="section-header">🧪 Scenarii What-if</div>', unsafe_allow_html=True)
+    st.markdown("""
+    Modificați indicatorii bruți ai unui județ (de exemplu rata șomajului din Vaslui la 4%) și vedeți cum
+    se schimbă potențialul și clasamentul. Se recalculează doar coloanele scalate, dimensiunile și rangurile
+    afectate de modificare. Venitul gospodăriei este publicat pe regiune și se aplică tuturor județelor din
+    regiune; firmele la 1000 de locuitori se recalculează din numărul de firme și populație.
+    """)
+    if nivel == "UAT":
+        st.caption("Scenariile se calculează pe județe, indiferent de nivelul hărții.")
+
+    baza = load_whatif_base()
+    if baza is None:
+        st.error("Nu s-au putut încărca indicatorii bruți (datele sursă ale ETL-ului).")
+        return
+    if not st.session_state.get("whatif_scenarii"):
+        st.session_state["whatif_scenarii"] = {}
+        _scenariu_nou("Scenariul 1", WhatIfScenario(baza, ponderi))
+    scenarii = st.session_state["whatif_scenarii"]
+
+    col1, col2, col3 = st.columns([2, 1, 1], vertical_alignment="bottom")
+    with col1:
+        st.selectbox("Scenariu", list(scenarii), key="whatif_activ")
+    with col2:
+        st.button("📄 Copiază scenariul", on_click=_copiaza_scenariu, use_container_width=True)
+    with col3:
+        st.button("↩️ Resetează", on_click=_reseteaza_scenariu, args=(baza,), use_container_width=True)
+
+    intrare = scenarii[st.session_state["whatif_activ"]]
+    scenariu = intrare["scenariu"]
+    # Ponderile din bara laterală se aplică tuturor scenariilor (recalculare completă doar dacă s-au schimbat)
+    scenariu.set_weights(ponderi)
+
+    st.data_editor(
+        intrare["baza"], key=intrare["editor"], on_change=_aplica_editari, args=(intrare,),
+        disabled=["Judet"], hide_index=True, num_rows="fixed", use_container_width=True,
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Celule modificate", len(scenariu.edits()))
+    with col2:
+        if intrare["ultima"] is not None:
+            st.metric("Ultima recalculare", f"{intrare['ultima'][1] * 1000:.2f} ms")
+
+    if intrare["ultima"] is not None:
+        st.markdown("**Efectul ultimei modificări**")
+        st.dataframe(intrare["ultima"][0].round(2), use_container_width=True, hide_index=True)
+
+    diferenta = scenariu.diff()
+    if len(diferenta):
+        st.markdown("**Scenariul față de datele publicate**")
+        st.dataframe(diferenta.round(2), use_container_width=True, hide_index=True)
+        st.dataframe(scenariu.edits(), use_container_width=True, hide_index=True)
+
+
+# Tab-uri pentru organizarea conținutului; doar tab-ul deschis rulează (schimbarea tab-ului face rerun)
+taburi = st.tabs(
+    ["🗺️ Hartă Interactivă", "📊 Top Județe", "📋 Tabel Rezumativ", "🎲 Sensibilitate Ponderi", "📅 Evoluție pe Ani",
+     "🧪 What-if"],
+    key="tab_dashboard", on_change="rerun",
+)
+for tab, afiseaza in zip(taburi, (tab_harta, tab_top, tab_tabel, tab_sensibilitate, tab_evolutie, tab_whatif)):
+    if tab.open:
+        with tab:
+            afiseaza()
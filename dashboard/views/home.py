@@ -0,0 +1,66 @@
+import streamlit as st
+
+st.markdown('<h1 class="main-title">📊 Economic Scoreboard România</h1>', unsafe_allow_html=True)
+
+st.markdown("""
+<div class="info-box">
+    <h3>🎯 Scopul Aplicației</h3>
+    <p>O platformă interactivă care oferă o imagine de ansamblu asupra potențialului economic regional din România, 
+        cu scoruri calculate din date actuale și indicatori economici esențiali.</p>
+</div>
+""", unsafe_allow_html=True)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown('<div class="section-header">🔍 Ce vei găsi în aplicație</div>', unsafe_allow_html=True)
+    st.markdown("""
+    **📊 Dashboard Interactiv:**
+    - **Hartă Interactivă**: Vizualizarea potențialului economic pe hartă
+    - **Grafice Comparative**: Top județe după indicatori economici
+    - **Tabel Rezumativ**: Date complete și posibilitate de export
+
+    **📈 Dimensiuni Analizate:**
+    - Piață locală
+    - Forță de muncă
+    - Competiție & intensitate economică
+    - Infrastructură & urban
+    - Stabilitate economică
+    """)
+
+with col2:
+    st.markdown('<div class="section-header">📋 Surse de Date</div>', unsafe_allow_html=True)
+    st.markdown("""
+    **🏛️ Instituții Oficiale:**
+    - **INS** (Institutul Național de Statistică)
+
+    """)
+
+    st.markdown("""
+<div class="info-box">
+    <h3>💡 Cum să folosești aplicația</h3>
+    <p><strong>1. Dashboard:</strong> Explorează datele prin hărți interactive și grafice</p>
+    <p><strong>2. Tabel Rezumativ:</strong> Consultă datele detaliate și exportă rezultatele</p>
+    <p><strong>3. Metodologie:</strong> Înțelege cum au fost procesate și calculate datele</p>
+</div>
+""", unsafe_allow_html=True)
+
+# Statistici rapide: datele și modulele grele se încarcă abia după ce conținutul static a fost trimis
+from controls import current_scores, level_selector, weight_sliders
+
+ponderi = weight_sliders()
+nivel, uat = level_selector()
+titlu_unitati = "UAT-uri" if nivel == "UAT" else "Județe"
+df, _ = current_scores(ponderi, nivel, uat)
+if df is not None:
+    st.markdown('<div class="section-header">📊 Statistici Rapide</div>', unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(f"Total {titlu_unitati}", len(df))
+    with col2:
+        st.metric("Potențial Maxim", f"{df['Potential'].max():.2f}")
+    with col3:
+        st.metric("Potențial Minim", f"{df['Potential'].min():.2f}")
+    with col4:
+        st.metric("Media Națională", f"{df['Potential'].mean():.2f}")
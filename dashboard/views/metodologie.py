@@ -0,0 +1,164 @@
+import streamlit as st
+
+st.markdown('<h1 class="main-title">🔬 Metodologia de Dezvoltare</h1>', unsafe_allow_html=True)
+
+st.markdown("""
+<div class="info-box">
+    <h3>📋 Prezentare Generală</h3>
+    <p>Această secțiune detaliază pas cu pas procesul de dezvoltare al aplicației de analiză economică, 
+    de la colectarea datelor până la implementarea finală.</p>
+</div>
+""", unsafe_allow_html=True)
+
+# Pasul 1
+st.markdown("""
+<div class="methodology-step">
+    <h3><span class="step-number">1</span>Colectarea și Organizarea Datelor</h3>
+    <p><strong>Surse de date utilizate:</strong></p>
+    <ul>
+        <li><strong>populatie_2024.csv</strong> - Date despre populația pe județe (INS)</li>
+        <li><strong>populatia_activa_2023.csv</strong> - Populația activă pe județe (INS)</li>
+        <li><strong>numar_firme2023.csv</strong> - Numărul de firme înregistrate (INS)</li>
+        <li><strong>trenduri.csv</strong> - Evolutia salariului mediu/ratei șomajului (Calcul realizat pe baza evoluției ratei șomajului și a salariului mediu (2019–2023), conform datelor INS.)</li>
+        <li><strong>rata_somaj_2023.csv</strong> - Rata șomajului pe județe (INS)</li>
+        <li><strong>salariul_mediu2023.csv</strong> - Salariul mediu net (INS)</li>
+        <li><strong>venit_gosp_2024.csv</strong> - Venitul mediu lunar al unei gospodarii per Regiune (INS)</li>
+        <li><strong>procent_urbanizare.csv</strong> - Procentul urbanizării fiecărui județ (INS)</li>
+        <li><strong>firme_per_mie.csv</strong> - Numărul de firme per 1000 locuitori (Indicator construit folosind date din numar_firme2023.csv și populatie_2024.csv.)</li>
+        <li><strong>ro.json</strong> - Coordonatele geografice ale județelor (simplemaps.com)</li>
+    </ul>
+    <p><strong>Provocări întâlnite:</strong> Standardizarea formatului datelor, eliminarea duplicatelor, 
+    gestionarea valorilor lipsă.</p>
+</div>
+""", unsafe_allow_html=True)
+
+# Pasul 2
+st.markdown("""
+<div class="methodology-step">
+    <h3><span class="step-number">2</span>Preprocesarea și Curățarea Datelor</h3>
+    <p><strong>Operații efectuate:</strong></p>
+    <ul>
+        <li>Eliminarea coloanelor de index automat generate ("Unnamed: 0")</li>
+        <li>Agregarea datelor prin gruparea după județ folosind media valorilor</li>
+        <li>Standardizarea numelor județelor pentru consistență</li>
+        <li>Scalarea Min-Max a fost aplicată tuturor indicatorilor pentru a construi un scor comparabil între județe.</li>
+        <li>Gruparea variabilelor în funcție de dimensiunile economice pe care le reflectă, pentru o analiză structurată.</li>
+        <li>Trendurile 2019–2023 (evoluția medie anuală, CAGR, pantă, volatilitate) sunt calculate în aplicație din seriile anuale și alimentează dimensiunea Stabilitate economică.</li>
+    </ul>
+</div>
+""", unsafe_allow_html=True)
+
+# Pasul 3
+st.markdown("""
+<div class="methodology-step">
+    <h3><span class="step-number">3</span>Calculul Indicatorului de Potențial Economic</h3>
+    <p><strong>Formula utilizată:</strong></p>
+    <p>Potențialul Economic = w1 * Piață locală + w2 * Forță de muncă + w3 * Competiție & intensitate economică + w4 * Infrastructură & urban + w5 * Stabilitate economică </p>
+    <p><strong>Ponderile aplicate:</strong></p>
+    <ul>
+        <li>Piață locală: w1 = 25%</li>
+        <li>Forță de muncă: w2 = 20%</li>
+        <li>Competiție & intensitate economică: w3 = 25%</li>
+        <li>Infrastructură & urban: w4 = 15%</li>
+        <li>Stabilitate economică: w5 = 15%</li>
+    </ul>
+    <p><em>Nota: Valorile au fost normalizate pe scala 0-100 pentru comparabilitate. 
+        Procentele (greutățile) au fost stabilite intern, pe baza importanței percepute a fiecărei dimensiuni în contextul analizei.
+        Ponderile pot fi ajustate din bara laterală (⚖️ Ponderi dimensiuni); harta, graficul și statisticile se recalculează instantaneu.
+        Stabilitatea clasamentului la variația ponderilor este estimată prin simulare Monte Carlo (tab-ul 🎲 Sensibilitate Ponderi).</em></p>
+</div>
+""", unsafe_allow_html=True)
+
+# Pasul 4
+st.markdown("""
+<div class="methodology-step">
+    <h3><span class="step-number">4</span>Dezvoltarea Componentelor de Vizualizare</h3>
+    <p><strong>1. Harta Interactivă:</strong></p>
+    <ul>
+        <li>Utilizare Plotly Express cu date GeoJSON</li>
+        <li>Scală de culori Viridis pentru diferențierea valorilor</li>
+        <li>Configurare proiecție Mercator pentru România</li>
+        <li>Geometrie simplificată pe arce comune (fără goluri între județe) și coordonate rotunjite, la nivelul de detaliu potrivit lățimii hărții</li>
+    </ul>
+    <p><strong>2. Graficul Bar Chart:</strong></p>
+    <ul>
+        <li>Sortarea județelor descrescător după potențial</li>
+        <li>Slider interactiv pentru navigarea prin toate județele</li>
+        <li>Afișarea valorilor exacte pe fiecare bară</li>
+    </ul>
+    <p><strong>3. Tabelul Rezumativ:</strong></p>
+    <ul>
+        <li>Combinarea indicatorilor rezumativi într-un singur tabel</li>
+        <li>Funcționalitate de export în CSV, Excel (mai multe foi) și Parquet, generată doar la descărcare</li>
+        <li>Calculul statisticilor sumare</li>
+    </ul>
+</div>
+""", unsafe_allow_html=True)
+
+# Pasul 5
+st.markdown("""
+<div class="methodology-step">
+    <h3><span class="step-number">5</span>Integrarea în Aplicația Streamlit</h3>
+    <p><strong>Arhitectura aplicației:</strong></p>
+    <ul>
+        <li><strong>Sidebar Navigation:</strong> Meniu pentru navigarea între secțiuni</li>
+        <li><strong>Caching:</strong> Datele sunt încărcate o singură dată per proces și partajate read-only între sesiuni</li>
+        <li><strong>Responsive Design:</strong> Layout adaptat pentru diferite rezoluții</li>
+        <li><strong>Error Handling:</strong> Gestionarea cazurilor când fișierele lipsesc</li>
+    </ul>
+    <p><strong>Tehnologii utilizate:</strong></p>
+    <ul>
+        <li>Streamlit - Framework pentru aplicații web</li>
+        <li>Plotly - Vizualizări interactive</li>
+        <li>Pandas - Manipularea datelor</li>
+        <li>JSON - Procesarea datelor geografice</li>
+    </ul>
+</div>
+""", unsafe_allow_html=True)
+
+# Pasul 6
+st.markdown("""
+<div class="methodology-step">
+    <h3><span class="step-number">6</span>Testare și Optimizare</h3>
+    <p><strong>Aspecte testate:</strong></p>
+    <ul>
+        <li>Funcționalitatea tuturor componentelor interactive</li>
+        <li>Compatibilitatea cu diferite browsere</li>
+        <li>Responsivitatea pe dispozitive mobile</li>
+    </ul>
+    <p><strong>Optimizări implementate:</strong></p>
+    <ul>
+        <li>Caching pentru datele statice</li>
+        <li>Lazy loading pentru componentele mari</li>
+        <li>Compresie pentru fișierele de export</li>
+    </ul>
+</div>
+""", unsafe_allow_html=True)
+
+# Provocări și soluții
+st.markdown('<div class="section-header">⚡ Provocări Întâlnite și Soluții</div>', unsafe_allow_html=True)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("""
+    **🚧 Provocări:**
+    - **Date inconsistente**: Formate diferite între surse
+    - **Performanță**: Încărcare lentă pentru hărți mari  
+    """)
+
+with col2:
+    st.markdown("""
+    **✅ Soluții:**
+    - **Standardizare**: Etapă de curățare și scalare a datelor, realizată după intervențiile manuale.
+    - **Optimizare**: Caching și lazy loading
+    """)
+
+# Concluzii
+st.markdown("""
+<div class="info-box">
+    <h3>🎯 Rezultate Obținute</h3>
+    <p>Aplicația finală oferă o platformă completă pentru analiza potențialului economic al județelor din România, cu vizualizări interactive, export de date și metodologie transparentă. 
+    Sistemul poate fi extins cu indicatori suplimentari și actualizări automate ale datelor.</p>
+</div>
+""", unsafe_allow_html=True)
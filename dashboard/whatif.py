@@ -0,0 +1,282 @@
+"""Scenarii „what-if”: indicatorii bruți ai unor județe sunt modificați și scorurile recalculate incremental.
+
+Scalarea Min-Max face ca o singură modificare să poată muta minimul sau maximul coloanei și deci scorul
+tuturor județelor. Scenariul ține, pe fiecare coloană, extremele și câte județe le ating; la o modificare:
+
+- coloanele afectate sunt cele editate plus cele derivate (firme la 1000 locuitori din număr de firme și
+  populație; venitul gospodăriei, publicat pe regiune, se schimbă pentru toată regiunea);
+- dacă extremele coloanei nu se schimbă, sunt rescalate doar celulele modificate, altfel toată coloana;
+- sunt recalculate doar dimensiunile care depind de coloanele rescalate, doar pe rândurile atinse;
+- potențialul, mediile (țară, regiune) și rangurile sunt actualizate doar pentru rândurile schimbate:
+  rangurile se modifică numai între vechea și noua poziție a fiecărui județ.
+
+Fiecare modificare întoarce diferența față de starea dinainte; `diff()` dă diferența față de datele
+publicate. Modificările se stivuiesc și pot fi anulate (`undo`).
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from details import INDICATORI
+from scoring import DIMENSIUNI, PONDERI_IMPLICITE, normalize_weights
+
+# Dimensiune -> indicatorii scalați din care se calculează și formula (aceleași ca în etl.dimensiuni)
+FORMULE = {
+    "Piata_locala_score": (("Populatie", "Salariul Mediu", "Venit Gospodarie"), lambda p, s, v: (p + s + v) / 3),
+    "Forta_de_munca_score": (("Populatia Activa", "Rata Somaj"), lambda a, r: (a + 1 - r) / 2),
+    "Competitie_score": (("Numar Firme", "Firme per 1000 locuitori"), lambda f, m: 1 - (f + m) / 2),
+    "Urbanizare_score": (("Procent Urbanizare",), lambda u: u),
+    "Stabilitate_economica_score": (("Evolutie_medie_salariu", "Evolutie_medie_somaj"), lambda s, r: (s + 1 - r) / 2),
+}
+
+# Indicatorii care se pot edita (firme la 1000 locuitori este derivat)
+EDITABILE = [c for c in INDICATORI if c != "Firme per 1000 locuitori"]
+
+# Indicatorul -> dimensiunile care depind de el
+_DEPENDENTE = {c: [d for d, (intrari, _) in FORMULE.items() if c in intrari] for c in INDICATORI}
+
+
+def _ranguri(potential):
+    """Ordinea (potențial descrescător, la egalitate indexul) și rangul fiecărui județ (1 = cel mai mare)."""
+    ordine = np.lexsort((np.arange(len(potential)), -potential))
+    rank = np.empty(len(potential), dtype=int)
+    rank[ordine] = np.arange(1, len(potential) + 1)
+    return ordine, rank
+
+
+def _pozitii(ordine, randuri):
+    """Poziția rândurilor `randuri` în `ordine`."""
+    pozitie = np.empty(len(ordine), dtype=int)
+    pozitie[ordine] = np.arange(len(ordine))
+    return pozitie[randuri]
+
+
+class WhatIfScenario:
+    """Un scenariu: indicatorii bruți, scalați, scorurile pe dimensiuni, potențialul și rangurile, ținute la zi."""
+
+    def __init__(self, indicatori, ponderi=PONDERI_IMPLICITE):
+        self.judete = indicatori["Judet"].to_numpy(dtype=object)
+        self.regiuni = indicatori["Regiune"].to_numpy(dtype=object)
+        self.nume_regiuni, self.cod_regiune = np.unique(self.regiuni, return_inverse=True)
+        self.judete_per_regiune = np.bincount(self.cod_regiune)
+        self._pozitie = {j: i for i, j in enumerate(self.judete)}
+        self.coloane = list(INDICATORI)
+        self._coloana = {c: k for k, c in enumerate(self.coloane)}
+        self.bruti = indicatori[self.coloane].to_numpy(dtype=float).copy()
+        self.initiali = self.bruti.copy()
+        self.initiali.flags.writeable = False
+        self.istoric = []
+        self.ultima_durata = None
+        self._recalculeaza(ponderi)
+        self.matrice_initiala = self.matrice.copy()
+        self.matrice_initiala.flags.writeable = False
+        self.potential_initial = self.potential.copy()
+        self.rank_initial = self.rank.copy()
+
+    def copy(self):
+        """Un scenariu nou pornind de la starea curentă (aceleași date inițiale)."""
+        nou = object.__new__(WhatIfScenario)
+        nou.__dict__.update(self.__dict__)
+        for nume in ("bruti", "minime", "maxime", "nr_min", "nr_max", "scalati", "matrice", "potential",
+                     "rank", "ordine", "sume_regiuni"):
+            setattr(nou, nume, getattr(self, nume).copy())
+        nou.istoric = list(self.istoric)
+        return nou
+
+    # --- Recalcularea completă (la creare sau când se schimbă ponderile) ---
+
+    def _recalculeaza(self, ponderi):
+        self.w = normalize_weights(ponderi)
+        self.minime = self.bruti.min(axis=0)
+        self.maxime = self.bruti.max(axis=0)
+        self.nr_min = (self.bruti == self.minime).sum(axis=0)
+        self.nr_max = (self.bruti == self.maxime).sum(axis=0)
+        self.scalati = (self.bruti - self.minime) / (self.maxime - self.minime)
+        self.matrice = np.column_stack([self._dimensiune(d, slice(None)) for d in DIMENSIUNI])
+        self.potential = self.matrice @ self.w * 100
+        self.sume_regiuni = np.bincount(self.cod_regiune, weights=self.potential)
+        self.suma = self.potential.sum()
+        self.ordine, self.rank = _ranguri(self.potential)
+
+    def set_weights(self, ponderi):
+        """Alte ponderi: recalculare completă (scenariul și referința publicată, cu aceleași ponderi)."""
+        if not np.allclose(normalize_weights(ponderi), self.w):
+            self._recalculeaza(ponderi)
+            self.potential_initial = self.matrice_initiala @ self.w * 100
+            self.rank_initial = _ranguri(self.potential_initial)[1]
+
+    def _dimensiune(self, dimensiune, randuri):
+        intrari, formula = FORMULE[dimensiune]
+        return formula(*(self.scalati[randuri, self._coloana[c]] for c in intrari))
+
+    # --- Modificări incrementale ---
+
+    def _celule(self, judet, coloana, valoare):
+        """Celulele brute care se schimbă: (coloană, rânduri, valori), inclusiv coloanele derivate."""
+        if coloana not in EDITABILE:
+            raise ValueError(f"Indicatorul {coloana} nu se poate modifica direct.")
+        i = self._pozitie[judet]
+        if coloana == "Venit Gospodarie":
+            # Venitul este publicat pe regiune: se aplică tuturor județelor din regiune
+            randuri = np.flatnonzero(self.cod_regiune == self.cod_regiune[i])
+        else:
+            randuri = np.array([i])
+        celule = [(coloana, randuri, np.full(len(randuri), float(valoare)))]
+        if coloana in ("Numar Firme", "Populatie"):
+            firme = float(valoare) if coloana == "Numar Firme" else self.bruti[i, self._coloana["Numar Firme"]]
+            populatie = float(valoare) if coloana == "Populatie" else self.bruti[i, self._coloana["Populatie"]]
+            celule.append(("Firme per 1000 locuitori", randuri, np.array([firme / populatie * 1000])))
+        return celule
+
+    def _rescaleaza(self, k, randuri, vechi, noi):
+        """Actualizează extremele coloanei `k`; întoarce rândurile al căror scor scalat s-a schimbat."""
+        bruti = self.bruti[:, k]
+        minim, maxim = self.minime[k], self.maxime[k]
+        # Numărul de apariții ale extremelor, fără recitirea coloanei
+        nr_min = self.nr_min[k] - (vechi == minim).sum()
+        nr_max = self.nr_max[k] - (vechi == maxim).sum()
+        if noi.min() < minim or nr_min == 0:
+            minim = bruti.min() if noi.min() >= minim else noi.min()
+            nr_min = (bruti == minim).sum()
+        else:
+            nr_min += (noi == minim).sum()
+        if noi.max() > maxim or nr_max == 0:
+            maxim = bruti.max() if noi.max() <= maxim else noi.max()
+            nr_max = (bruti == maxim).sum()
+        else:
+            nr_max += (noi == maxim).sum()
+        self.nr_min[k], self.nr_max[k] = nr_min, nr_max
+        if minim != self.minime[k] or maxim != self.maxime[k]:
+            self.minime[k], self.maxime[k] = minim, maxim
+            self.scalati[:, k] = (bruti - minim) / (maxim - minim)
+            return slice(None)
+        self.scalati[randuri, k] = (bruti[randuri] - minim) / (maxim - minim)
+        return randuri
+
+    def _reordoneaza(self, randuri):
+        """Rangurile după schimbarea potențialului pe `randuri`: doar intervalul dintre pozițiile vechi și noi."""
+        if len(randuri) == 0:
+            return
+        if len(randuri) > 16:
+            self.ordine, self.rank = _ranguri(self.potential)
+            return
+        pozitii_vechi = self.rank[randuri] - 1
+        ramase = np.delete(self.ordine, pozitii_vechi)
+        cheie = -self.potential[ramase]
+        for r in sorted(randuri, key=lambda r: (-self.potential[r], r)):
+            # Poziția în ordinea (potențial descrescător, index crescător), ca la lexsort
+            p = np.searchsorted(cheie, -self.potential[r], side="left")
+            while p < len(ramase) and cheie[p] == -self.potential[r] and ramase[p] < r:
+                p += 1
+            ramase = np.insert(ramase, p, r)
+            cheie = np.insert(cheie, p, -self.potential[r])
+        pozitii_noi = _pozitii(ramase, randuri)
+        start, stop = min(pozitii_vechi.min(), pozitii_noi.min()), max(pozitii_vechi.max(), pozitii_noi.max()) + 1
+        self.ordine = ramase
+        self.rank[ramase[start:stop]] = np.arange(start + 1, stop + 1)
+
+    def set(self, judet, coloana, valoare):
+        """Modifică un indicator brut și întoarce diferența (rândurile cu potențial sau rang schimbat)."""
+        start = time.perf_counter()
+        potential_vechi, rank_vechi = self.potential.copy(), self.rank.copy()
+        celule = self._celule(judet, coloana, valoare)
+        self.istoric.append([(c, r, self.bruti[r, self._coloana[c]].copy()) for c, r, _ in celule])
+        self._aplica(celule)
+        self.ultima_durata = time.perf_counter() - start
+        return self._diferenta(potential_vechi, rank_vechi)
+
+    def undo(self):
+        """Anulează ultima modificare; întoarce diferența sau None dacă nu există modificări."""
+        if not self.istoric:
+            return None
+        potential_vechi, rank_vechi = self.potential.copy(), self.rank.copy()
+        self._aplica(self.istoric.pop())
+        return self._diferenta(potential_vechi, rank_vechi)
+
+    def _aplica(self, celule):
+        dimensiuni = {}
+        for coloana, randuri, valori in celule:
+            k = self._coloana[coloana]
+            vechi = self.bruti[randuri, k].copy()
+            self.bruti[randuri, k] = valori
+            afectate = self._rescaleaza(k, randuri, vechi, valori)
+            for d in _DEPENDENTE[coloana]:
+                # slice(None) (toată coloana) absoarbe orice alt set de rânduri
+                anterior = dimensiuni.get(d)
+                if isinstance(afectate, slice) or isinstance(anterior, slice):
+                    dimensiuni[d] = slice(None)
+                else:
+                    dimensiuni[d] = afectate if anterior is None else np.union1d(anterior, afectate)
+        if not dimensiuni:
+            return
+        schimbate = None
+        coloane_dim = list(DIMENSIUNI)
+        for d, randuri in dimensiuni.items():
+            self.matrice[randuri, coloane_dim.index(d)] = self._dimensiune(d, randuri)
+            if isinstance(randuri, slice) or isinstance(schimbate, slice):
+                schimbate = slice(None)
+            else:
+                schimbate = randuri if schimbate is None else np.union1d(schimbate, randuri)
+        if isinstance(schimbate, slice):
+            schimbate = np.arange(len(self.potential))
+        noi = self.matrice[schimbate] @ self.w * 100
+        delta = noi - self.potential[schimbate]
+        self.potential[schimbate] = noi
+        self.suma += delta.sum()
+        np.add.at(self.sume_regiuni, self.cod_regiune[schimbate], delta)
+        self._reordoneaza(schimbate[delta != 0])
+
+    # --- Rezultate ---
+
+    @property
+    def media_tarii(self):
+        return self.suma / len(self.potential)
+
+    @property
+    def media_regiunii(self):
+        return (self.sume_regiuni / self.judete_per_regiune)[self.cod_regiune]
+
+    def _diferenta(self, potential_vechi, rank_vechi):
+        schimbate = np.flatnonzero((np.abs(self.potential - potential_vechi) > 1e-12) | (self.rank != rank_vechi))
+        return pd.DataFrame({
+            "Judet": self.judete[schimbate],
+            "Potential inainte": potential_vechi[schimbate],
+            "Potential dupa": self.potential[schimbate],
+            "Diferenta": self.potential[schimbate] - potential_vechi[schimbate],
+            "Rank inainte": rank_vechi[schimbate],
+            "Rank dupa": self.rank[schimbate],
+        }).sort_values("Rank dupa", ignore_index=True)
+
+    def diff(self):
+        """Diferența cumulată față de datele publicate (toate modificările scenariului)."""
+        return self._diferenta(self.potential_initial, self.rank_initial)
+
+    def edits(self):
+        """Celulele modificate față de datele publicate (județ, indicator, valoare inițială, valoare nouă)."""
+        randuri, coloane = np.nonzero((self.bruti != self.initiali) & ~(np.isnan(self.bruti) & np.isnan(self.initiali)))
+        return pd.DataFrame({
+            "Judet": self.judete[randuri],
+            "Indicator": [self.coloane[k] for k in coloane],
+            "Initial": self.initiali[randuri, coloane],
+            "Scenariu": self.bruti[randuri, coloane],
+        })
+
+    def frame(self):
+        """Scorurile scenariului, în formatul ScoringResult.frame()."""
+        return pd.DataFrame({
+            "Judet": self.judete,
+            "Regiune": self.regiuni,
+            "Potential": self.potential.round(2),
+            "Rank": self.rank,
+            "Media Tarii": self.media_tarii.round(2),
+            "Media Regiunii": self.media_regiunii.round(2),
+            "Vs Media Tarii": (self.potential - self.media_tarii).round(2),
+            "Vs Media Regiunii": (self.potential - self.media_regiunii).round(2),
+        })
+
+    def raw(self):
+        """Indicatorii bruți curenți (județ x indicator)."""
+        df = pd.DataFrame(self.bruti, columns=self.coloane)
+        df.insert(0, "Judet", self.judete)
+        return df